@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Paths vs standard error: plain MC vs variance-reduced touch probabilities.
+
+For each path count, every estimator is run --repeats times on the same
+market set; the spread of the estimates is the empirical standard error
+(worst strike reported). "Eq. plain paths" is the plain-MC path count
+that would give the same error (SE scales as 1/sqrt(paths)).
+
+Usage (from crypto/):
+    python bench_touch_prob.py
+    python bench_touch_prob.py --days 90 --repeats 20 --max-paths 262144
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from trading_bot.pricing.touch_prob import batch_touch_probabilities, STUDENT_DF_BTC
+from trading_bot.pricing.variance_reduction import touch_estimates
+
+
+def run_plain(args, n_paths):
+    above, below = batch_touch_probabilities(
+        args.spot, args.iv, args.days, args.above, args.below,
+        drift=args.drift, df=args.df, n_paths=n_paths,
+    )
+    return [above[k] for k in args.above] + [below[k] for k in args.below], None
+
+
+def make_vr(mode):
+    def run(args, n_paths):
+        above, below = touch_estimates(
+            args.spot, args.iv, args.days, args.above, args.below,
+            drift=args.drift, df=args.df, n_paths=n_paths, mode=mode,
+        )
+        ests = [above[k] for k in args.above] + [below[k] for k in args.below]
+        return [e.prob for e in ests], max(e.stderr for e in ests)
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spot", type=float, default=100_000)
+    parser.add_argument("--iv", type=float, default=0.52)
+    parser.add_argument("--drift", type=float, default=0.04)
+    parser.add_argument("--df", type=float, default=STUDENT_DF_BTC)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--min-paths", type=int, default=4096)
+    parser.add_argument("--max-paths", type=int, default=131072)
+    args = parser.parse_args()
+
+    args.above = [args.spot * m for m in (1.05, 1.10, 1.20, 1.30)]
+    args.below = [args.spot * m for m in (0.95, 0.90, 0.80, 0.70)]
+
+    estimators = [
+        ("plain", run_plain),
+        ("antithetic+cv", make_vr("antithetic")),
+        ("qmc+cv", make_vr("qmc")),
+    ]
+
+    print(f"Spot {args.spot:,.0f}  IV {args.iv:.0%}  drift {args.drift:+.1%}  "
+          f"df {args.df}  {args.days}d  {len(args.above) + len(args.below)} strikes  "
+          f"{args.repeats} repeats")
+    print()
+    print(f"{'Estimator':<15} {'Paths':>8} {'SE (emp)':>9} {'SE (rep)':>9} "
+          f"{'ms/run':>8} {'Eq. plain paths':>16}")
+    print("=" * 70)
+
+    plain_se = {}
+    n_paths = args.min_paths
+    while n_paths <= args.max_paths:
+        for name, run in estimators:
+            estimates, reported = [], []
+            t0 = time.perf_counter()
+            for _ in range(args.repeats):
+                probs, se = run(args, n_paths)
+                estimates.append(probs)
+                if se is not None:
+                    reported.append(se)
+            ms = (time.perf_counter() - t0) * 1000 / args.repeats
+
+            se_emp = float(np.std(np.array(estimates), axis=0, ddof=1).max())
+            if name == "plain":
+                plain_se[n_paths] = se_emp
+            eq_paths = n_paths * (plain_se[n_paths] / se_emp) ** 2 if se_emp > 0 else float("inf")
+            rep_str = f"{np.mean(reported):>9.4f}" if reported else f"{'--':>9}"
+            print(f"{name:<15} {n_paths:>8,} {se_emp:>9.4f} {rep_str} "
+                  f"{ms:>8.0f} {eq_paths:>16,.0f}")
+        print()
+        n_paths *= 2
+
+
+if __name__ == "__main__":
+    main()
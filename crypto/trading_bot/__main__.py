@@ -88,6 +88,8 @@ def main():
         print("Fetching balance...", end=" ", flush=True)
         balance = executor.get_balance()
         print(f"${balance:,.2f}")
+        # Approval + allowance sync in the background before the first BUY
+        executor.warm()
     else:
         print("SKIP (no API credentials)")
 
@@ -111,6 +113,9 @@ def main():
         import traceback
         traceback.print_exc()
         raise
+    finally:
+        executor.stop()
+        position_storage.close()
 
 
 if __name__ == "__main__":
@@ -30,6 +30,8 @@ class BotConfig:
     student_df_eth: float = 2.88  # Student-t degrees of freedom for ETH
     fast_pricing: bool = True      # Use fast analytical approx instead of MC
     hybrid_pricing: bool = True    # Hybrid: Student-t for dip, GBM for reach
+    path_cache_mb: int = 1024      # MC path cache budget (0 = fresh paths every scan)
+    mc_variance_reduction: Optional[str] = None  # None, "antithetic" or "qmc" (+ GBM control variate)
 
     # Portfolio limits (Kelly sizing)
     max_position_pct: float = 0.25   # Max 25% of portfolio per position
@@ -140,6 +142,20 @@ Examples:
         help="Use MC simulation (~30s) instead of fast analytical (default)"
     )
 
+    parser.add_argument(
+        "--mc-vr",
+        choices=["antithetic", "qmc"],
+        default=None,
+        help="MC variance reduction (with GBM control variate); pair with a lower --mc-paths, e.g. 16384"
+    )
+
+    parser.add_argument(
+        "--path-cache-mb",
+        type=int,
+        default=1024,
+        help="MC path cache size in MB, reused across scans (0 = disabled). Default: 1024"
+    )
+
     parser.add_argument(
         "--alloc",
         type=float,
@@ -176,6 +192,8 @@ Examples:
         history_dir=args.data_dir / "history",
         markets_json=args.markets_json,
         fast_pricing=not args.mc_pricing,
+        path_cache_mb=args.path_cache_mb,
+        mc_variance_reduction=args.mc_vr,
         target_alloc=args.alloc,
     )
 
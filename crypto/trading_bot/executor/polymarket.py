@@ -7,9 +7,11 @@ Key difference: loads crypto/.env for separate wallet.
 
 import math
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
 # Add parent directory to path for polymarket_client import
@@ -30,6 +32,17 @@ except ImportError:
     POLYMARKET_AVAILABLE = False
 
 
+# Scanner orderbook snapshots younger than this are reused for BUY sizing
+BOOK_MAX_AGE = 5.0
+# Background warm-up cadence; a COLLATERAL allowance sync older than
+# ALLOWANCE_MAX_AGE is redone inline before posting
+WARM_INTERVAL = 60.0
+ALLOWANCE_MAX_AGE = 120.0
+# Fill confirmation: poll order status instead of sleeping
+FILL_POLL_INTERVAL = 0.25
+FILL_TIMEOUT = 5.0
+
+
 @dataclass
 class OrderResult:
     """Result of an order execution."""
@@ -40,6 +53,8 @@ class OrderResult:
     tokens: Optional[float] = None
     error: Optional[str] = None
     timestamp: str = ""
+    # Per-stage latency in milliseconds (balance, book, allowance, post, fill)
+    timings: Dict[str, float] = field(default_factory=dict)
 
     def __post_init__(self):
         if not self.timestamp:
@@ -69,6 +84,112 @@ class PolymarketExecutor:
                 self.client = None
                 self.initialized = False
 
+        # Warm order state, kept fresh by a background thread (see warm())
+        self._allowance_synced_at = 0.0
+        self._warm_tokens: set[str] = set()
+        self._warmed_tokens: set[str] = set()
+        self._warm_lock = threading.Lock()
+        self._warm_wakeup = threading.Event()
+        self._warm_stop = threading.Event()
+        self._warm_thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Warm order state
+    # ------------------------------------------------------------------
+
+    def warm(self, token_ids: Iterable[str] = ()) -> None:
+        """
+        Keep BUY prerequisites warm in the background for these tokens.
+
+        Starts the warm-up thread on first call. Each pass ensures the
+        on-chain USDC approval, syncs the COLLATERAL allowance with the
+        CLOB, and prefetches tick size, neg-risk flag and fee rate for
+        new tokens (cached by the CLOB client, so signing an order for a
+        warmed token needs no extra round-trips).
+        """
+        if not self.client:
+            return
+        with self._warm_lock:
+            new = set(t for t in token_ids if t) - self._warm_tokens
+            self._warm_tokens |= new
+            if self._warm_thread is None:
+                self._warm_thread = threading.Thread(
+                    target=self._warm_loop, name="executor-warm", daemon=True
+                )
+                self._warm_thread.start()
+        if new:
+            self._warm_wakeup.set()
+
+    def stop(self) -> None:
+        """Stop the warm-up thread."""
+        self._warm_stop.set()
+        self._warm_wakeup.set()
+
+    def _warm_loop(self) -> None:
+        while not self._warm_stop.is_set():
+            try:
+                self._warm_once()
+            except Exception as e:
+                get_logger().log_warning(f"Executor warm-up failed: {e}")
+            self._warm_wakeup.wait(WARM_INTERVAL)
+            self._warm_wakeup.clear()
+
+    def _warm_once(self) -> None:
+        self.ensure_buy_approval()
+        if time.monotonic() - self._allowance_synced_at > WARM_INTERVAL:
+            self._sync_collateral_allowance()
+
+        with self._warm_lock:
+            pending = self._warm_tokens - self._warmed_tokens
+        for token_id in pending:
+            if self._warm_stop.is_set():
+                return
+            try:
+                self.client.client.get_tick_size(token_id)
+                self.client.client.get_neg_risk(token_id)
+                self.client.client.get_fee_rate_bps(token_id)
+                self._warmed_tokens.add(token_id)
+            except Exception as e:
+                get_logger().log_warning(f"Warm-up for token {token_id[:12]}... failed: {e}")
+
+    def _sync_collateral_allowance(self) -> bool:
+        """Sync USDC COLLATERAL allowance with the CLOB API."""
+        try:
+            from polymarket_console.clob_types import BalanceAllowanceParams, AssetType
+            params = BalanceAllowanceParams(
+                asset_type=AssetType.COLLATERAL,
+            )
+            self.client.client.update_balance_allowance(params)
+            self._allowance_synced_at = time.monotonic()
+            return True
+        except Exception as e:
+            get_logger().log_warning(f"BUY allowance sync failed: {e}")
+            return False
+
+    def _wait_for_fill(self, order_id: str, size: float) -> Optional[float]:
+        """
+        Poll order status until it stops matching or FILL_TIMEOUT passes.
+
+        Returns tokens matched so far, or None if the status was never read.
+        """
+        deadline = time.monotonic() + FILL_TIMEOUT
+        matched = None
+        while True:
+            try:
+                order_info = self.client.client.get_order(order_id)
+                if order_info:
+                    matched = float(order_info.get("size_matched", 0) or 0)
+                    status = order_info.get("status", "").upper()
+                    if status == "MATCHED":
+                        return max(matched, size)
+                    if status not in ("LIVE", "DELAYED") or matched >= size - 0.01:
+                        return matched
+            except Exception as e:
+                get_logger().log_warning(f"BUY fill check failed: {e}")
+            if time.monotonic() >= deadline:
+                return matched
+            time.sleep(FILL_POLL_INTERVAL)
+
     def get_balance(self) -> float:
         """Get current USDC balance. Tries API first, falls back to on-chain."""
         if not self.client:
@@ -95,13 +216,31 @@ class PolymarketExecutor:
         Execute a BUY order.
 
         Buys maximum available liquidity at the signal price within balance limits.
+        Reuses the scanner's orderbook snapshot when it is fresh and relies on
+        warm() for approval/allowance/market parameters, so the only blocking
+        round-trips on the hot path are the post and the fill confirmation.
         """
+        timings: Dict[str, float] = {}
+        stage_start = time.perf_counter()
+
+        def lap(stage: str) -> None:
+            nonlocal stage_start
+            now = time.perf_counter()
+            timings[stage] = round((now - stage_start) * 1000, 1)
+            stage_start = now
+
+        def failed(error: str) -> Tuple[OrderResult, None]:
+            return OrderResult(success=False, error=error, timings=timings), None
+
         if not self.client:
-            return OrderResult(success=False, error="Client not initialized"), None
+            return failed("Client not initialized")
 
         token_id = signal.token_id or market.yes_token_id
         if not token_id:
-            return OrderResult(success=False, error="No token ID"), None
+            return failed("No token ID")
+
+        # Keep this token warm for the next signal on it
+        self.warm([token_id])
 
         try:
             # Use suggested_size from signal, fall back to full balance
@@ -110,19 +249,23 @@ class PolymarketExecutor:
             else:
                 raw_balance = self.get_balance()
                 balance = raw_balance * 0.98
+            lap("balance")
 
             if balance <= 0:
-                return OrderResult(success=False, error="No balance available"), None
+                return failed("No balance available")
 
-            # Get orderbook
-            orderbook = self.client.get_orderbook(token_id)
+            # Orderbook: the scanner's snapshot if fresh, else fetch
+            orderbook = PolymarketData.get_recent_orderbook(token_id, BOOK_MAX_AGE)
+            if orderbook is None:
+                orderbook = self.client.get_orderbook(token_id)
             if hasattr(orderbook, 'asks'):
                 asks = orderbook.asks or []
             else:
                 asks = orderbook.get("asks", [])
+            lap("book")
 
             if not asks:
-                return OrderResult(success=False, error="No asks in orderbook"), None
+                return failed("No asks in orderbook")
 
             # Buy at current market price (not fair price!) to preserve edge
             # fair_price is our estimate of true value — buying up to fair loses all edge
@@ -147,37 +290,21 @@ class PolymarketExecutor:
                         break
 
             if available_size <= 0 or total_cost <= 0:
-                return OrderResult(
-                    success=False,
-                    error=f"No liquidity at price {target_price:.2%} or better"
-                ), None
+                return failed(f"No liquidity at price {target_price:.2%} or better")
 
             MIN_ORDER_SIZE = 1.0
             if total_cost < MIN_ORDER_SIZE:
-                return OrderResult(
-                    success=False,
-                    error=f"Order too small (${total_cost:.2f}), min $1"
-                ), None
+                return failed(f"Order too small (${total_cost:.2f}), min $1")
 
             order_price = target_price
             avg_price = total_cost / available_size if available_size > 0 else target_price
 
-            # Record balance before buy to measure actual cost (incl. fees)
-            balance_before_buy = self.get_balance()
-
-            # Ensure on-chain USDC approval for exchange contracts (one-time)
+            # Approval and allowance are normally already warm; only cold
+            # state costs a round-trip here
             self.ensure_buy_approval()
-
-            # Sync USDC COLLATERAL allowance with CLOB API
-            logger = get_logger()
-            try:
-                from polymarket_console.clob_types import BalanceAllowanceParams, AssetType
-                params = BalanceAllowanceParams(
-                    asset_type=AssetType.COLLATERAL,
-                )
-                self.client.client.update_balance_allowance(params)
-            except Exception as e:
-                logger.log_warning(f"BUY allowance sync failed: {e}")
+            if time.monotonic() - self._allowance_synced_at > ALLOWANCE_MAX_AGE:
+                self._sync_collateral_allowance()
+            lap("allowance")
 
             # Try placing order, retry with half size on balance error
             last_error = None
@@ -194,46 +321,33 @@ class PolymarketExecutor:
                 except Exception as e:
                     err_str = str(e)
                     if "not enough balance" in err_str and attempt < 2:
-                        # Refresh allowance on balance error
-                        try:
-                            from polymarket_console.clob_types import BalanceAllowanceParams, AssetType
-                            params = BalanceAllowanceParams(
-                                asset_type=AssetType.COLLATERAL,
-                            )
-                            self.client.client.update_balance_allowance(params)
-                        except Exception:
-                            pass
-                        import time
-                        time.sleep(2)
+                        # Resync allowance (synchronous) and retry smaller
+                        self._sync_collateral_allowance()
                         available_size = available_size / 2
                         total_cost = total_cost / 2
                         avg_price = total_cost / available_size if available_size > 0 else target_price
                         if total_cost < MIN_ORDER_SIZE:
-                            return OrderResult(
-                                success=False,
-                                error=f"Balance insufficient even at ${total_cost:.2f}"
-                            ), None
+                            return failed(f"Balance insufficient even at ${total_cost:.2f}")
                         last_error = err_str
                     else:
                         raise
+            lap("post")
 
             if last_error:
-                return OrderResult(success=False, error=last_error), None
+                return failed(last_error)
 
             order_id = result.get("orderID") or result.get("order_id")
 
             if order_id:
-                # Measure actual cost
-                actual_entry_size = total_cost
-                try:
-                    balance_after_buy = self.get_balance()
-                    actual_cost = balance_before_buy - balance_after_buy
-                    if actual_cost > 0 and actual_cost < total_cost * 2:
-                        actual_entry_size = actual_cost
-                except Exception:
-                    pass
+                # Confirm the fill from order status; an unconfirmed order
+                # is recorded at its full size (sync_positions reconciles)
+                tokens = available_size
+                matched = self._wait_for_fill(order_id, available_size)
+                if matched:
+                    tokens = min(matched, available_size)
+                lap("fill")
 
-                actual_avg_price = actual_entry_size / available_size if available_size > 0 else avg_price
+                actual_entry_size = tokens * avg_price
 
                 position = Position(
                     market_id=signal.market_id,
@@ -241,10 +355,10 @@ class PolymarketExecutor:
                     market_name=signal.market_name,
                     outcome=signal.outcome,
                     resolution_date=market.end_date,
-                    entry_price=actual_avg_price,
+                    entry_price=avg_price,
                     entry_time=datetime.utcnow().isoformat() + "Z",
                     entry_size=actual_entry_size,
-                    tokens=available_size,
+                    tokens=tokens,
                     strategy="crypto",
                     fair_price_at_entry=signal.fair_price,
                     edge_at_entry=signal.edge,
@@ -253,21 +367,24 @@ class PolymarketExecutor:
                     token_id=token_id,
                 )
 
+                get_logger().log_info(
+                    f"BUY {signal.market_slug[:40]} latency(ms): "
+                    + " ".join(f"{k}={v:.0f}" for k, v in timings.items())
+                )
+
                 return OrderResult(
                     success=True,
                     order_id=order_id,
-                    filled_price=actual_avg_price,
+                    filled_price=avg_price,
                     filled_size=actual_entry_size,
-                    tokens=available_size,
+                    tokens=tokens,
+                    timings=timings,
                 ), position
             else:
-                return OrderResult(
-                    success=False,
-                    error=f"No order ID in response: {result}"
-                ), None
+                return failed(f"No order ID in response: {result}")
 
         except Exception as e:
-            return OrderResult(success=False, error=str(e)), None
+            return failed(str(e))
 
     def sell(self, signal: Signal, position: Position, market: Market) -> OrderResult:
         """Execute a SELL order."""
@@ -332,24 +449,19 @@ class PolymarketExecutor:
 
     def _rpc_call(self, method: str, params: list) -> str:
         """Make a JSON-RPC call to Polygon (tries multiple RPCs)."""
-        import json, os, ssl, urllib.request
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
+        import os
+        from polymarket_console.http_helpers.transport import shared_transport
+        http = shared_transport(verify=False)
 
         primary = os.getenv("POLYGON_RPC", "https://polygon-bor-rpc.publicnode.com")
         rpcs = [primary, "https://polygon.llamarpc.com", "https://1rpc.io/matic"]
 
-        payload = json.dumps({
-            "jsonrpc": "2.0", "id": 1, "method": method, "params": params
-        }).encode()
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
 
         for rpc in rpcs:
             try:
-                req = urllib.request.Request(rpc, data=payload,
-                                             headers={"Content-Type": "application/json"})
-                resp = urllib.request.urlopen(req, timeout=10, context=ctx)
-                result = json.loads(resp.read())
+                # Read-only calls: safe to retry on the same RPC before failing over
+                result = http.post_json(rpc, json=payload, retries=1)
                 return result.get("result", "0x0")
             except Exception:
                 continue
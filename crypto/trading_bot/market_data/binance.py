@@ -4,18 +4,15 @@ Binance market data — BTC/ETH spot prices via REST API.
 Thread-safe: designed to be called from a background thread.
 """
 
-import json
-import ssl
-import urllib.request
 from datetime import datetime, timezone
 from threading import Lock
 from typing import Optional
 
+from polymarket_console.http_helpers.transport import shared_transport
 
-# SSL context for Binance API
-_ctx = ssl.create_default_context()
-_ctx.check_hostname = False
-_ctx.verify_mode = ssl.CERT_NONE
+
+# Shared pooled transport (TLS verification off, as before)
+_http = shared_transport(verify=False)
 
 BINANCE_API = "https://api.binance.com/api/v3"
 
@@ -79,9 +76,7 @@ class BinanceData:
         """Fetch latest prices from Binance. Returns True on success."""
         try:
             url = f"{BINANCE_API}/ticker/price?symbols=[\"BTCUSDT\",\"ETHUSDT\"]"
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-            data = json.loads(resp.read())
+            data = _http.get_json(url)
 
             btc = 0.0
             eth = 0.0
@@ -112,9 +107,7 @@ class BinanceData:
         try:
             for symbol, prefix in [("BTCUSDT", "btc"), ("ETHUSDT", "eth")]:
                 url = f"{BINANCE_API}/klines?symbol={symbol}&interval=1m&limit=4"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-                data = json.loads(resp.read())
+                data = _http.get_json(url)
 
                 # Drop the last candle (current, unclosed); use first 3 (closed)
                 closed = data[:-1] if len(data) > 1 else data
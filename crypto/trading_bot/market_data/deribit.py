@@ -3,31 +3,26 @@ Deribit market data — spot, IV, and futures curve.
 
 Fetches from Deribit public API:
 - Spot price via perpetual contract
-- IV from ATM options (nearest expiry)
+- IV surface from the option chain's book summary (one call per currency)
 - Futures curve for drift interpolation
 
 Thread-safe: designed to be called from a background thread.
 """
 
-import json
 import math
-import ssl
-import urllib.request
 from datetime import datetime, timezone
 from threading import Lock
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from polymarket_console.http_helpers.transport import shared_transport
 
-_ctx = ssl.create_default_context()
-_ctx.check_hostname = False
-_ctx.verify_mode = ssl.CERT_NONE
+
+_http = shared_transport(verify=False)
 
 
 def deribit_get(path: str) -> dict:
     """Call Deribit public API."""
-    req = urllib.request.Request(f"https://www.deribit.com/api/v2/public/{path}")
-    resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-    return json.loads(resp.read())["result"]
+    return _http.get_json(f"https://www.deribit.com/api/v2/public/{path}")["result"]
 
 
 # (days_to_expiry, annualized_drift, futures_price, instrument_name)
@@ -36,22 +31,60 @@ FuturesEntry = Tuple[int, float, float, str]
 # (days_to_expiry, iv_decimal)
 IVEntry = Tuple[int, float]
 
+# (expiration_timestamp_ms, strike) -> iv_decimal
+IVSurface = Dict[Tuple[int, float], float]
+
+# Deribit options expire at 08:00 UTC
+_EXPIRY_HOUR_UTC = 8
+
+
+def _parse_option_name(name: str) -> Optional[Tuple[int, float, str]]:
+    """Parse 'BTC-27JUN25-100000-C' into (expiration_ts_ms, strike, 'call'|'put')."""
+    parts = name.split("-")
+    if len(parts) != 4:
+        return None
+    try:
+        exp = datetime.strptime(parts[1], "%d%b%y").replace(
+            hour=_EXPIRY_HOUR_UTC, tzinfo=timezone.utc
+        )
+        strike = float(parts[2].replace("d", "."))
+    except ValueError:
+        return None
+    option_type = "call" if parts[3] == "C" else "put"
+    return int(exp.timestamp() * 1000), strike, option_type
+
 
 class DeribitData:
     """Fetches and caches Deribit data (spot, IV, futures curve)."""
 
-    def __init__(self):
+    def __init__(self, bulk_iv: bool = True):
+        """
+        Args:
+            bulk_iv: Load the whole IV surface via get_book_summary_by_currency
+                     (one request per currency). False = legacy per-strike
+                     ticker walk.
+        """
+        self.bulk_iv = bulk_iv
         self._lock = Lock()
+        self._http_calls: int = 0
+        self._last_update_calls: int = 0
         self._btc_spot: float = 0.0
         self._eth_spot: float = 0.0
         self._btc_iv: float = 0.0
         self._eth_iv: float = 0.0
         self._btc_iv_curve: List[IVEntry] = []
         self._eth_iv_curve: List[IVEntry] = []
+        self._btc_iv_surface: IVSurface = {}
+        self._eth_iv_surface: IVSurface = {}
         self._btc_curve: List[FuturesEntry] = []
         self._eth_curve: List[FuturesEntry] = []
         self._last_update: Optional[datetime] = None
 
+    def _get(self, path: str) -> dict:
+        """deribit_get() that counts requests for the current update."""
+        self._http_calls += 1
+        return deribit_get(path)
+
     # --- Thread-safe properties ---
 
     @property
@@ -89,6 +122,18 @@ class DeribitData:
         with self._lock:
             return self._last_update
 
+    @property
+    def last_update_calls(self) -> int:
+        """Number of HTTP requests made by the last update()."""
+        with self._lock:
+            return self._last_update_calls
+
+    def get_iv_surface(self, currency: str) -> IVSurface:
+        """Copy of the (expiration_ts_ms, strike) -> IV surface."""
+        currency = currency.upper()
+        with self._lock:
+            return dict(self._btc_iv_surface if currency == "BTC" else self._eth_iv_surface)
+
     @property
     def age_seconds(self) -> float:
         with self._lock:
@@ -138,8 +183,8 @@ class DeribitData:
     def iv_for_days(self, currency: str, target_days: int) -> float:
         """Get IV from the expiry closest to target_days.
 
-        Uses per-maturity IV curve fetched from ATM options at each expiry.
-        Falls back to the headline IV (7d+ nearest) if no curve available.
+        Uses the per-maturity ATM IV curve (derived from the IV surface in
+        bulk mode, from per-strike tickers otherwise). Falls back to the headline IV (7d+ nearest) if no curve available.
         """
         currency = currency.upper()
         with self._lock:
@@ -158,13 +203,78 @@ class DeribitData:
     def _fetch_spot(self, currency: str) -> float:
         """Fetch spot price from perpetual."""
         try:
-            ticker = deribit_get(f"ticker?instrument_name={currency}-PERPETUAL")
+            ticker = self._get(f"ticker?instrument_name={currency}-PERPETUAL")
             return ticker["last_price"]
         except Exception:
             return 0.0
 
-    def _fetch_iv(self, currency: str) -> Tuple[float, List[IVEntry]]:
-        """Fetch ATM IV curve from Deribit options.
+    def _fetch_iv(self, currency: str) -> Tuple[float, List[IVEntry], IVSurface]:
+        """Fetch ATM IV curve (and surface in bulk mode) for a currency.
+
+        Bulk mode falls back to the ticker walk if the book summary fails.
+        """
+        if self.bulk_iv:
+            headline_iv, iv_curve, surface = self._fetch_iv_surface(currency)
+            if iv_curve:
+                return headline_iv, iv_curve, surface
+        headline_iv, iv_curve = self._fetch_iv_tickers(currency)
+        return headline_iv, iv_curve, {}
+
+    def _fetch_iv_surface(self, currency: str) -> Tuple[float, List[IVEntry], IVSurface]:
+        """Fetch the whole option chain's mark IV in one request.
+
+        Returns (headline_iv, iv_curve, surface). The ATM curve is picked
+        from the surface with the same rules as the ticker walk: call strike
+        closest to spot, 7d+ expiries, nearest expiry as fallback.
+        """
+        try:
+            with self._lock:
+                spot = self._btc_spot if currency == "BTC" else self._eth_spot
+            summaries = self._get(
+                f"get_book_summary_by_currency?currency={currency}&kind=option"
+            )
+            if spot <= 0:
+                spot = next((s["underlying_price"] for s in summaries
+                             if s.get("underlying_price")), 0.0)
+            if spot <= 0:
+                return 0.0, [], {}
+
+            # Calls first; puts only fill strikes with no call quote
+            surface: IVSurface = {}
+            calls: IVSurface = {}
+            for s in summaries:
+                parsed = _parse_option_name(s.get("instrument_name", ""))
+                iv = s.get("mark_iv") or 0
+                if parsed is None or iv <= 0:
+                    continue
+                exp_ts, strike, option_type = parsed
+                if option_type == "call":
+                    calls[(exp_ts, strike)] = iv / 100
+                surface.setdefault((exp_ts, strike), iv / 100)
+            surface.update(calls)
+
+            now_ts = datetime.now(timezone.utc).timestamp() * 1000
+            min_exp_ts = now_ts + 7 * 86400 * 1000  # at least 7 days out
+
+            expiries = sorted({exp for exp, _ in calls if exp >= min_exp_ts})
+            if not expiries:
+                expiries = sorted({exp for exp, _ in calls if exp > now_ts})
+
+            iv_curve: List[IVEntry] = []
+            for exp_ts in expiries:
+                days = max(1, int((exp_ts - now_ts) / 86400000))
+                strike = min((k for e, k in calls if e == exp_ts),
+                             key=lambda k: abs(k - spot))
+                iv_curve.append((days, calls[(exp_ts, strike)]))
+
+            headline_iv = iv_curve[0][1] if iv_curve else 0.0
+            return headline_iv, iv_curve, surface
+
+        except Exception:
+            return 0.0, [], {}
+
+    def _fetch_iv_tickers(self, currency: str) -> Tuple[float, List[IVEntry]]:
+        """Fetch ATM IV curve from Deribit options, one ticker per candidate strike.
 
         Returns (headline_iv, iv_curve) where:
         - headline_iv: IV from nearest 7d+ expiry (for display)
@@ -179,7 +289,7 @@ class DeribitData:
             if spot <= 0:
                 return 0.0, []
 
-            instruments = deribit_get(
+            instruments = self._get(
                 f"get_instruments?currency={currency}&kind=option&expired=false"
             )
 
@@ -215,7 +325,7 @@ class DeribitData:
                     dist = abs(inst["strike"] - spot)
                     if dist < best_dist:
                         try:
-                            ticker = deribit_get(
+                            ticker = self._get(
                                 f"ticker?instrument_name={inst['instrument_name']}"
                             )
                             iv = ticker.get("mark_iv", 0)
@@ -236,7 +346,7 @@ class DeribitData:
     def _fetch_futures_curve(self, currency: str) -> Tuple[float, List[FuturesEntry]]:
         """Fetch full futures curve: list of (days, drift, price, name)."""
         try:
-            futures = deribit_get(
+            futures = self._get(
                 f"get_book_summary_by_currency?currency={currency}&kind=future"
             )
             spot = None
@@ -276,6 +386,7 @@ class DeribitData:
 
     def update(self) -> bool:
         """Fetch all data from Deribit. Returns True on success."""
+        self._http_calls = 0
         try:
             # Fetch futures curves (includes spot)
             btc_spot, btc_curve = self._fetch_futures_curve("BTC")
@@ -293,8 +404,8 @@ class DeribitData:
                 self._btc_spot = btc_spot
                 self._eth_spot = eth_spot
 
-            btc_iv, btc_iv_curve = self._fetch_iv("BTC")
-            eth_iv, eth_iv_curve = self._fetch_iv("ETH")
+            btc_iv, btc_iv_curve, btc_surface = self._fetch_iv("BTC")
+            eth_iv, eth_iv_curve, eth_surface = self._fetch_iv("ETH")
 
             with self._lock:
                 self._btc_curve = btc_curve
@@ -305,10 +416,15 @@ class DeribitData:
                     self._eth_iv = eth_iv
                 self._btc_iv_curve = btc_iv_curve
                 self._eth_iv_curve = eth_iv_curve
+                self._btc_iv_surface = btc_surface
+                self._eth_iv_surface = eth_surface
                 self._last_update = datetime.now(timezone.utc)
+                self._last_update_calls = self._http_calls
 
             return True
         except Exception:
+            with self._lock:
+                self._last_update_calls = self._http_calls
             return False
 
     def get_snapshot(self) -> dict:
@@ -324,4 +440,5 @@ class DeribitData:
                 "btc_curve": list(self._btc_curve),
                 "eth_curve": list(self._eth_curve),
                 "last_update": self._last_update,
+                "http_calls": self._last_update_calls,
             }
@@ -8,18 +8,22 @@ Prices are fetched in batch via paginated events search.
 
 import json
 import re
-import ssl
-import urllib.request
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
 from typing import Dict, List, Optional, Tuple
 
+from polymarket_console.http_helpers.transport import shared_transport
 
-_ctx = ssl.create_default_context()
-_ctx.check_hostname = False
-_ctx.verify_mode = ssl.CERT_NONE
+
+_http = shared_transport(verify=False)
+
+# Last fetched orderbook per token: token_id -> (monotonic fetch time, book).
+# Lets the executor reuse the scanner's snapshot instead of re-fetching.
+_books: Dict[str, Tuple[float, dict]] = {}
+_books_lock = Lock()
 
 GAMMA_API = "https://gamma-api.polymarket.com"
 
@@ -206,9 +210,7 @@ class PolymarketData:
             batch_size = 500
             while True:
                 url = f"{GAMMA_API}/events?closed=false&limit={batch_size}&offset={offset}"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp = urllib.request.urlopen(req, timeout=30, context=_ctx)
-                events = json.loads(resp.read())
+                events = _http.get_json(url, timeout=30)
                 if not events:
                     break
 
@@ -260,9 +262,7 @@ class PolymarketData:
         for slug in slugs:
             try:
                 url = f"{GAMMA_API}/events?slug={slug}"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-                data = json.loads(resp.read())
+                data = _http.get_json(url)
                 if not data:
                     continue
 
@@ -335,9 +335,7 @@ class PolymarketData:
                     f"{GAMMA_API}/events?"
                     f"closed=false&limit=50&tag={keyword}"
                 )
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-                data = json.loads(resp.read())
+                data = _http.get_json(url)
 
                 for event in data:
                     slug = event.get("slug", "")
@@ -399,11 +397,21 @@ class PolymarketData:
         """
         try:
             url = f"https://clob.polymarket.com/book?token_id={token_id}"
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-            return json.loads(resp.read())
+            book = _http.get_json(url)
         except Exception:
             return {"asks": [], "bids": []}
+        with _books_lock:
+            _books[token_id] = (time.monotonic(), book)
+        return book
+
+    @staticmethod
+    def get_recent_orderbook(token_id: str, max_age: float) -> Optional[dict]:
+        """Last orderbook fetched for token_id if younger than max_age seconds."""
+        with _books_lock:
+            entry = _books.get(token_id)
+        if entry is None or time.monotonic() - entry[0] > max_age:
+            return None
+        return entry[1]
 
     @staticmethod
     def get_usable_liquidity(token_id: str, fair_price: float) -> tuple:
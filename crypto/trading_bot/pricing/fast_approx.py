@@ -1,12 +1,13 @@
 """
 Fast analytical approximation for Student-t touch probabilities.
 
-Uses GBM first-passage-time formula as base, with a 2D lookup table
+Uses GBM first-passage-time formula as base, with a lookup table
 correction calibrated against MC Student-t (2M paths per point).
 
 Method:
   1. Compute GBM touch probability (exact, ~1µs)
-  2. Look up correction ratio from pre-computed table (bilinear interp, ~1µs)
+  2. Look up correction ratio from pre-computed table (trilinear interp
+     over x, ln n, df — plus sigma if the table has that axis)
   3. Return GBM * correction
 
 Accuracy: mean abs error ~0.9%, max ~2% vs MC 1M paths
@@ -19,12 +20,18 @@ The correction ratio depends on:
 
 Tables calibrated with mu=0 (risk-neutral). Correction is approximately
 invariant to drift and sigma (error ~1-2%).
+
+Tables generated by table_builder.py (tables/*.npy) are memory-mapped at
+import and take precedence; otherwise the built-in BTC/ETH tables below
+form a 2-point df axis.
 """
 
 import math
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+from scipy.special import ndtr
 from scipy.stats import norm
 
 
@@ -109,39 +116,104 @@ _RATIO_ETH = np.array([
 ])
 
 
-def _bilinear_interp(x: float, ln_n: float, table: np.ndarray) -> float:
-    """Fast bilinear interpolation on (x_grid, ln_n_grid) → ratio.
-
-    Uses numpy searchsorted + manual bilinear — avoids scipy overhead.
-    Clamps to grid boundaries (no extrapolation).
-    """
-    # Clamp inputs
-    x = max(_X_GRID[0], min(_X_GRID[-1], x))
-    ln_n = max(_LN_N_GRID[0], min(_LN_N_GRID[-1], ln_n))
-
-    # Find surrounding indices
-    ix = int(np.searchsorted(_X_GRID, x, side='right')) - 1
-    ix = max(0, min(ix, len(_X_GRID) - 2))
-    jn = int(np.searchsorted(_LN_N_GRID, ln_n, side='right')) - 1
-    jn = max(0, min(jn, len(_LN_N_GRID) - 2))
+# Built-in 3-D table: df axis from the two calibrated tables
+_DF_GRID = np.array([2.61, 2.88])
+_RATIO_3D = np.stack([_RATIO_BTC, _RATIO_ETH], axis=-1)
 
-    # Fractional positions
-    x0, x1 = _X_GRID[ix], _X_GRID[ix + 1]
-    n0, n1 = _LN_N_GRID[jn], _LN_N_GRID[jn + 1]
+TABLES_DIR = Path(__file__).parent / "tables"
 
-    fx = (x - x0) / (x1 - x0) if x1 != x0 else 0.0
-    fn = (ln_n - n0) / (n1 - n0) if n1 != n0 else 0.0
 
-    # Bilinear
-    v00 = table[ix, jn]
-    v10 = table[ix + 1, jn]
-    v01 = table[ix, jn + 1]
-    v11 = table[ix + 1, jn + 1]
+def _load_tables(tables_dir: Path = TABLES_DIR) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """Load generated correction tables (memory-mapped), or the built-in ones.
 
-    return (v00 * (1 - fx) * (1 - fn) +
-            v10 * fx * (1 - fn) +
-            v01 * (1 - fx) * fn +
-            v11 * fx * fn)
+    Returns (ratio, grids) where grids are the interpolation axes:
+    [x, ln n, df] or [x, ln n, df, sigma].
+    """
+    try:
+        ratio = np.load(tables_dir / "ratio.npy", mmap_mode="r")
+        grids = [
+            np.load(tables_dir / "x_grid.npy"),
+            np.log(np.load(tables_dir / "n_grid.npy")),
+            np.load(tables_dir / "df_grid.npy"),
+        ]
+        sigma_path = tables_dir / "sigma_grid.npy"
+        if sigma_path.exists():
+            grids.append(np.load(sigma_path))
+        if ratio.shape != tuple(len(g) for g in grids):
+            raise ValueError(f"ratio shape {ratio.shape} does not match grids")
+        return ratio, grids
+    except (OSError, ValueError):
+        return _RATIO_3D, [_X_GRID, _LN_N_GRID, _DF_GRID]
+
+
+_RATIO_TABLE, _RATIO_GRIDS = _load_tables()
+
+
+def _multilinear_interp(point: Tuple[float, ...],
+                        table: Optional[np.ndarray] = None,
+                        grids: Optional[List[np.ndarray]] = None) -> float:
+    """Multilinear interpolation of table at point (one coordinate per grid).
+
+    Clamps to grid boundaries (no extrapolation). Axes with a single grid
+    point are constant.
+    """
+    if table is None:
+        table, grids = _RATIO_TABLE, _RATIO_GRIDS
+
+    lo = []
+    frac = []
+    for v, g in zip(point, grids):
+        if len(g) == 1:
+            lo.append(0)
+            frac.append(0.0)
+            continue
+        v = max(g[0], min(g[-1], v))
+        i = int(np.searchsorted(g, v, side='right')) - 1
+        i = max(0, min(i, len(g) - 2))
+        g0, g1 = g[i], g[i + 1]
+        lo.append(i)
+        frac.append((v - g0) / (g1 - g0) if g1 != g0 else 0.0)
+
+    # Slice the surrounding cell, then collapse it one axis at a time
+    cell = table[tuple(slice(i, i + 2) for i in lo)]
+    for f in frac:
+        cell = cell[0] * (1 - f) + cell[1] * f if len(cell) == 2 else cell[0]
+    return float(cell)
+
+
+def _multilinear_interp_vec(points: List[np.ndarray],
+                            table: Optional[np.ndarray] = None,
+                            grids: Optional[List[np.ndarray]] = None) -> np.ndarray:
+    """Vectorized _multilinear_interp: one array of coordinates per grid axis."""
+    if table is None:
+        table, grids = _RATIO_TABLE, _RATIO_GRIDS
+
+    lo = []
+    frac = []
+    for v, g in zip(points, grids):
+        if len(g) == 1:
+            lo.append(np.zeros(np.shape(v), dtype=np.intp))
+            frac.append(np.zeros(np.shape(v)))
+            continue
+        v = np.clip(v, g[0], g[-1])
+        i = np.clip(np.searchsorted(g, v, side='right') - 1, 0, len(g) - 2)
+        g0, g1 = g[i], g[i + 1]
+        lo.append(i)
+        frac.append(np.where(g1 != g0, (v - g0) / np.where(g1 != g0, g1 - g0, 1.0), 0.0))
+
+    result = np.zeros(np.broadcast(*lo).shape)
+    for corner in range(1 << len(lo)):
+        w = 1.0
+        idx = []
+        for axis, (i, f) in enumerate(zip(lo, frac)):
+            upper = (corner >> axis) & 1
+            if upper and len(grids[axis]) == 1:
+                break
+            w = w * (f if upper else 1 - f)
+            idx.append(i + upper)
+        else:
+            result += w * table[tuple(idx)]
+    return result
 
 
 # === GBM first-passage formulas ===
@@ -180,6 +252,37 @@ def touch_below_gbm(S: float, K: float, sigma: float, T: float, mu: float = 0) -
     return min(norm.cdf(d1) + math.exp(exp) * norm.cdf(d2), 1.0)
 
 
+def touch_gbm_vec(S, K, sigma, T, mu=0.0) -> np.ndarray:
+    """Vectorized touch_above_gbm / touch_below_gbm (direction from K vs S).
+
+    With a = |ln(K/S)| and nu = mu - sigma²/2 both scalar formulas reduce to
+    N((-a + nu*T)/st) + exp(±2*nu*a/sigma²) * N((-a - nu*T)/st),
+    with + for above and - for below. This matches touch_below_gbm term for
+    term. NOTE: the textbook reflection formula for the lower barrier pairs
+    the exponential with the other N() term; kept as-is so fast pricing
+    stays consistent with the calibrated correction tables.
+    """
+    S, K, sigma, T, mu = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                               for v in (S, K, sigma, T, mu)))
+    is_up = K > S
+    already = np.where(is_up, K <= S, K >= S)
+    live = ~already & (T > 0) & (sigma > 0)
+
+    out = np.where(already, 1.0, 0.0)
+    if not live.any():
+        return out
+
+    S, K, sigma, T, mu, up = S[live], K[live], sigma[live], T[live], mu[live], is_up[live]
+    a = np.abs(np.log(K / S))
+    st = sigma * np.sqrt(T)
+    nu = mu - 0.5 * sigma**2
+    d1 = (-a + nu * T) / st
+    d2 = (-a - nu * T) / st
+    exp = np.minimum(np.where(up, 2.0, -2.0) * nu * a / sigma**2, 100)
+    out[live] = np.minimum(ndtr(d1) + np.exp(exp) * ndtr(d2), 1.0)
+    return out
+
+
 # === Main API ===
 
 def fast_touch_prob(
@@ -241,15 +344,52 @@ def fast_touch_prob(
     n_days = max(int(T * 365), 1)
     ln_n = math.log(n_days)
 
-    # Select correction table
-    table = _RATIO_BTC if df < 2.75 else _RATIO_ETH
-
-    # Interpolate correction ratio
-    correction = _bilinear_interp(x, ln_n, table)
+    # Interpolate correction ratio over (x, ln n, df[, sigma])
+    point = (x, ln_n, df, iv)[:len(_RATIO_GRIDS)]
+    correction = _multilinear_interp(point)
 
     return max(0.0, min(1.0, gbm * correction))
 
 
+def fast_touch_prob_vec(
+    spot,
+    strike,
+    iv,
+    T,
+    drift=0.0,
+    df=2.61,
+    hybrid: bool = False,
+) -> np.ndarray:
+    """Vectorized fast_touch_prob over broadcastable arrays.
+
+    All of spot, strike, iv, T, drift and df may be scalars or arrays of
+    the same (broadcastable) shape; returns touch probabilities with that
+    shape. Same math as fast_touch_prob, without per-call Python overhead.
+    """
+    spot, strike, iv, T, drift, df = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (spot, strike, iv, T, drift, df))
+    )
+    gbm = touch_gbm_vec(spot, strike, iv, T, drift)
+    expired = (T <= 0) | (iv <= 0)
+    gbm = np.where(expired, np.where(strike > spot, 0.0, 1.0), gbm)
+
+    # Correction only inside (0.001, 0.999); hybrid leaves reach markets as GBM
+    correct = ~expired & (gbm >= 0.001) & (gbm <= 0.999)
+    if hybrid:
+        correct &= ~(strike > spot)
+    if not correct.any():
+        return gbm
+
+    s_, k_, iv_, T_, df_ = (a[correct] for a in (spot, strike, iv, T, df))
+    x = np.abs(np.log(k_ / s_)) / (iv_ * np.sqrt(T_))
+    ln_n = np.log(np.maximum(np.floor(T_ * 365), 1))
+    points = [x, ln_n, df_, iv_][:len(_RATIO_GRIDS)]
+
+    out = gbm.copy()
+    out[correct] = np.clip(gbm[correct] * _multilinear_interp_vec(points), 0.0, 1.0)
+    return out
+
+
 def batch_fast_touch_probabilities(
     spot: float,
     iv: float,
@@ -266,18 +406,17 @@ def batch_fast_touch_probabilities(
     """
     T = days / 365 if days > 0 else 0
 
+    strikes = np.array(list(strikes_above) + list(strikes_below), dtype=float)
+    probs = fast_touch_prob_vec(spot, strikes, iv, T, drift, df, hybrid=hybrid) \
+        if len(strikes) else strikes
+
+    n_above = len(strikes_above)
     above_probs = {}
-    for strike in strikes_above:
-        if strike <= spot:
-            above_probs[strike] = 1.0
-        else:
-            above_probs[strike] = fast_touch_prob(spot, strike, iv, T, drift, df, hybrid=hybrid)
+    for strike, p in zip(strikes_above, probs[:n_above]):
+        above_probs[strike] = 1.0 if strike <= spot else float(p)
 
     below_probs = {}
-    for strike in strikes_below:
-        if strike >= spot:
-            below_probs[strike] = 1.0
-        else:
-            below_probs[strike] = fast_touch_prob(spot, strike, iv, T, drift, df, hybrid=hybrid)
+    for strike, p in zip(strikes_below, probs[n_above:]):
+        below_probs[strike] = 1.0 if strike >= spot else float(p)
 
     return above_probs, below_probs
@@ -58,6 +58,7 @@ def simulate_portfolio_outcomes(
     correlation: float = DEFAULT_CORRELATION,
     n_paths: int = 100_000,
     balance: float = 0.0,
+    antithetic: bool = False,
 ) -> PortfolioOutcome:
     """Simulate portfolio P&L distribution at expiration.
 
@@ -65,6 +66,10 @@ def simulate_portfolio_outcomes(
     - Dip positions: Student-t paths (fat tails)
     - Reach positions: GBM paths (normal tails)
 
+    With antithetic=True, half the paths mirror the other half's normal
+    shocks (same chi2 draws), which lowers the noise of mean P&L and
+    win probability for the same n_paths.
+
     Returns percentile distribution of portfolio outcomes.
     """
     t0 = time.monotonic()
@@ -83,8 +88,9 @@ def simulate_portfolio_outcomes(
     paths = _generate_correlated_paths(
         btc_spot, eth_spot, btc_iv, eth_iv,
         btc_drift, eth_drift, btc_df, eth_df,
-        correlation, max_days, n_paths,
+        correlation, max_days, n_paths, antithetic,
     )
+    n_paths = paths["btc_t_max"].shape[0]
 
     # For each position, compute payout per MC path
     total_pnl = np.zeros(n_paths)
@@ -149,6 +155,7 @@ def _generate_correlated_paths(
     btc_df: float, eth_df: float,
     correlation: float,
     n_days: int, n_paths: int,
+    antithetic: bool = False,
 ) -> Dict[str, np.ndarray]:
     """Generate correlated BTC+ETH price paths — both Student-t and GBM.
 
@@ -159,21 +166,28 @@ def _generate_correlated_paths(
     Returns dict with running max/min for each variant:
         btc_t_max, btc_t_min, btc_gbm_max, btc_gbm_min,
         eth_t_max, eth_t_min, eth_gbm_max, eth_gbm_min
-    Each shape: (n_paths, n_days)
+    Each shape: (n_paths, n_days); antithetic rounds n_paths down to even.
     """
     rng = np.random.default_rng()
     T = n_days / 365
     dt = T / n_days
+    n_draw = max(n_paths // 2, 1) if antithetic else n_paths
 
     # Correlated standard normals via Cholesky
-    z_btc = rng.standard_normal((n_paths, n_days))
-    z_ind = rng.standard_normal((n_paths, n_days))
+    z_btc = rng.standard_normal((n_draw, n_days))
+    z_ind = rng.standard_normal((n_draw, n_days))
     rho = max(-0.99, min(0.99, correlation))
     z_eth = rho * z_btc + math.sqrt(1 - rho ** 2) * z_ind
 
     # Student-t innovations: z * sqrt(df / chi2)
-    chi2_btc = rng.chisquare(btc_df, size=(n_paths, n_days))
-    chi2_eth = rng.chisquare(eth_df, size=(n_paths, n_days))
+    chi2_btc = rng.chisquare(btc_df, size=(n_draw, n_days))
+    chi2_eth = rng.chisquare(eth_df, size=(n_draw, n_days))
+
+    if antithetic:
+        z_btc = np.vstack([z_btc, -z_btc])
+        z_eth = np.vstack([z_eth, -z_eth])
+        chi2_btc = np.vstack([chi2_btc, chi2_btc])
+        chi2_eth = np.vstack([chi2_eth, chi2_eth])
     t_btc = z_btc * np.sqrt(btc_df / chi2_btc)
     t_eth = z_eth * np.sqrt(eth_df / chi2_eth)
 
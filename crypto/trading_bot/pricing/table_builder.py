@@ -0,0 +1,142 @@
+"""
+Correction-table builder for fast_approx.
+
+Generates ratio[x, n, df(, sigma)] = MC_student_t / GBM touch probability
+(dip side, mu=0) with the vectorized multi-horizon MC from touch_prob:
+one simulation per df out to the longest horizon, chunked over paths so
+memory stays bounded. Tables are written as plain .npy files that
+fast_approx memory-maps at import.
+
+Usage (from crypto/):
+    python -m trading_bot.pricing.table_builder --df 2.4 2.61 2.88 3.2
+    python -m trading_bot.pricing.table_builder --df 2.61 2.88 --sigma 0.4 0.55 0.7
+"""
+
+import argparse
+import math
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+
+from .fast_approx import TABLES_DIR, _X_GRID, _N_GRID, touch_below_gbm
+from .touch_prob import PathCache, _log_extremes
+
+
+DEFAULT_PATHS = 2_000_000
+DEFAULT_SIGMA = 0.52
+CHUNK_PATHS = 100_000
+MIN_GBM_PROB = 1e-6  # below this the ratio is numerically meaningless → 1.0
+
+
+def build_ratio_table(
+    df_grid: Sequence[float],
+    x_grid: Sequence[float] = tuple(_X_GRID),
+    n_grid: Sequence[int] = tuple(_N_GRID),
+    sigma_grid: Optional[Sequence[float]] = None,
+    n_paths: int = DEFAULT_PATHS,
+    seed: int = 42,
+    progress: bool = False,
+) -> np.ndarray:
+    """Build the correction ratio table.
+
+    Returns:
+        float32 array of shape (len(x), len(n), len(df)), or
+        (len(x), len(n), len(df), len(sigma)) if sigma_grid is given.
+    """
+    x_grid = np.asarray(x_grid, dtype=float)
+    n_grid = [int(n) for n in n_grid]
+    sigmas = list(sigma_grid) if sigma_grid else [DEFAULT_SIGMA]
+    max_n = max(n_grid)
+    dt = 1 / 365
+
+    touches = np.zeros((len(x_grid), len(n_grid), len(df_grid), len(sigmas)))
+    done = 0
+    chunk_seed = seed
+    while done < n_paths:
+        chunk = min(CHUNK_PATHS, n_paths - done)
+        for k, df in enumerate(df_grid):
+            std_paths = PathCache._simulate(df, max_n, chunk, chunk_seed + k)
+            for s, sigma in enumerate(sigmas):
+                extremes = _log_extremes(
+                    std_paths,
+                    step_scale=sigma * math.sqrt(dt),
+                    drift_per_step=-0.5 * sigma**2 * dt,
+                    day_indices=n_grid,
+                    need_max=False,
+                )
+                for j, n in enumerate(n_grid):
+                    log_min = extremes[n][1]
+                    barriers = -x_grid * sigma * math.sqrt(n * dt)
+                    touches[:, j, k, s] += (log_min[None, :] <= barriers[:, None]).sum(axis=1)
+        done += chunk
+        chunk_seed += len(df_grid)
+        if progress:
+            print(f"  {done:,}/{n_paths:,} paths")
+
+    mc = touches / n_paths
+    gbm = np.empty((len(x_grid), len(n_grid), len(sigmas)))
+    for s, sigma in enumerate(sigmas):
+        for j, n in enumerate(n_grid):
+            T = n * dt
+            for i, x in enumerate(x_grid):
+                strike = 100 * math.exp(-x * sigma * math.sqrt(T))
+                gbm[i, j, s] = touch_below_gbm(100, strike, sigma, T, mu=0)
+
+    gbm = gbm[:, :, None, :]
+    ratio = np.where(gbm > MIN_GBM_PROB, mc / np.maximum(gbm, MIN_GBM_PROB), 1.0)
+    ratio = ratio.astype(np.float32)
+    return ratio if sigma_grid else ratio[..., 0]
+
+
+def save_tables(
+    out_dir: Path,
+    ratio: np.ndarray,
+    df_grid: Sequence[float],
+    x_grid: Sequence[float] = tuple(_X_GRID),
+    n_grid: Sequence[int] = tuple(_N_GRID),
+    sigma_grid: Optional[Sequence[float]] = None,
+) -> None:
+    """Write ratio + grids as .npy files (loaded by fast_approx at import)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    np.save(out_dir / "ratio.npy", ratio)
+    np.save(out_dir / "x_grid.npy", np.asarray(x_grid, dtype=np.float64))
+    np.save(out_dir / "n_grid.npy", np.asarray(n_grid, dtype=np.float64))
+    np.save(out_dir / "df_grid.npy", np.asarray(df_grid, dtype=np.float64))
+    sigma_path = out_dir / "sigma_grid.npy"
+    if sigma_grid:
+        np.save(sigma_path, np.asarray(sigma_grid, dtype=np.float64))
+    elif sigma_path.exists():
+        sigma_path.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build Student-t/GBM correction tables for fast_approx",
+    )
+    parser.add_argument("--df", type=float, nargs="+", required=True,
+                        help="Student-t df grid (ascending)")
+    parser.add_argument("--sigma", type=float, nargs="+", default=None,
+                        help="Optional sigma grid (adds a 4th table axis)")
+    parser.add_argument("--paths", type=int, default=DEFAULT_PATHS,
+                        help=f"MC paths per grid point. Default: {DEFAULT_PATHS:,}")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", type=Path, default=TABLES_DIR,
+                        help=f"Output directory. Default: {TABLES_DIR}")
+    args = parser.parse_args()
+
+    df_grid = sorted(args.df)
+    sigma_grid = sorted(args.sigma) if args.sigma else None
+
+    t0 = time.monotonic()
+    print(f"Building ratio table: df={df_grid} sigma={sigma_grid or DEFAULT_SIGMA} "
+          f"paths={args.paths:,}")
+    ratio = build_ratio_table(df_grid, sigma_grid=sigma_grid, n_paths=args.paths,
+                              seed=args.seed, progress=True)
+    save_tables(args.out, ratio, df_grid, sigma_grid=sigma_grid)
+    print(f"Saved {ratio.shape} table to {args.out} ({time.monotonic() - t0:.0f}s)")
+
+
+if __name__ == "__main__":
+    main()
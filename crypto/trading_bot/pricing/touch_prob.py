@@ -4,11 +4,22 @@ Touch probability calculation using Student-t Monte Carlo simulation.
 Batch-optimized: generates paths once per (currency, drift) combo,
 then checks all strikes against pre-computed running max/min.
 This gives ~40x speedup vs per-market MC.
+
+With a PathCache, standardized (unit-variance, zero-drift) cumulative
+log-return paths are kept between scans; each scan only rescales them
+by the current IV and drift and takes max/min in log space.
+
+multi_horizon_touch_probabilities() prices every expiry of a currency
+from one simulation out to the longest horizon: each horizon applies its
+own IV/drift to the shared standardized paths and reads the running
+max/min at its day index.
 """
 
 import math
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -18,6 +29,10 @@ STUDENT_DF_BTC = 2.61
 STUDENT_DF_ETH = 2.88
 MC_PATHS = 150_000
 
+# Path cache defaults
+PATH_CACHE_SEED = 42
+PATH_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1 GiB (~4 × 150k×365 float32)
+
 
 @dataclass
 class TouchResult:
@@ -32,6 +47,95 @@ class TouchResult:
     drift_used: float
 
 
+def _t_variance(df: float) -> float:
+    """Var(t_df) = df/(df-2) for df>2; df <= 2 has infinite variance."""
+    return df / (df - 2) if df > 2 else 10.0  # approximate for df <= 2
+
+
+class PathCache:
+    """LRU cache of standardized Student-t cumulative log-return paths.
+
+    Entry for key (df, n_days, n_paths, seed) is a float32 array of shape
+    (n_paths, n_days) holding cumsum of unit-variance t innovations.
+    Real log-paths are ``drift_step * k + iv * sqrt(dt) * paths[:, k-1]``.
+
+    Thread-safe. Memory is bounded by max_bytes (least recently used
+    entries are evicted first).
+    """
+
+    def __init__(self, max_bytes: int = PATH_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, df: float, n_days: int, n_paths: int,
+            seed: int = PATH_CACHE_SEED) -> np.ndarray:
+        """Get standardized cumulative paths, simulating on miss.
+
+        The returned array may be a prefix view of a longer cached entry.
+        """
+        key = (float(df), int(n_days), int(n_paths), seed)
+        with self._lock:
+            paths = self._entries.get(key)
+            if paths is None:
+                # A longer simulation with the same df/paths/seed covers this one
+                key, paths = next(
+                    ((k, v) for k, v in self._entries.items()
+                     if k[0] == key[0] and k[2:] == key[2:] and k[1] > n_days),
+                    (key, None),
+                )
+            if paths is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return paths[:, :n_days]
+            self.misses += 1
+
+        paths = self._simulate(df, n_days, n_paths, seed)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = paths
+                self._bytes += paths.nbytes
+                self._evict()
+            return self._entries.get(key, paths)
+
+    def _evict(self) -> None:
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            self._bytes -= old.nbytes
+            self.evictions += 1
+
+    @staticmethod
+    def _simulate(df: float, n_days: int, n_paths: int, seed: int) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        innovations = rng.standard_t(df, size=(n_paths, n_days))
+        innovations /= math.sqrt(_t_variance(df))
+        return np.cumsum(innovations, axis=1).astype(np.float32)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and memory usage (for UI/logging)."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "mb": self._bytes / (1024 * 1024),
+            }
+
+
 def batch_touch_probabilities(
     spot: float,
     iv: float,
@@ -41,12 +145,16 @@ def batch_touch_probabilities(
     drift: float = 0.0,
     df: float = STUDENT_DF_BTC,
     n_paths: int = MC_PATHS,
+    cache: Optional[PathCache] = None,
 ) -> Tuple[Dict[float, float], Dict[float, float]]:
     """Compute touch probabilities for multiple strikes in one batch.
 
     Generates paths once, computes running_max and running_min,
     then vectorized comparison against each strike.
 
+    If ``cache`` is given, standardized paths are reused across calls
+    (fixed seed) and only rescaled by iv/drift here.
+
     Args:
         spot: Current spot price
         iv: Annualized implied volatility
@@ -56,6 +164,7 @@ def batch_touch_probabilities(
         drift: Annualized drift (from futures curve)
         df: Student-t degrees of freedom
         n_paths: Number of MC paths
+        cache: Optional PathCache to reuse standardized paths
 
     Returns:
         Tuple of (above_probs, below_probs) dicts mapping strike → touch_prob
@@ -68,17 +177,16 @@ def batch_touch_probabilities(
     T = days / 365
     n_days = max(days, 1)
     dt = T / n_days
+    drift_per_step = (drift - 0.5 * iv**2) * dt
 
-    # Scale Student-t so variance matches iv^2 * dt
-    # Var(t_df) = df/(df-2) for df>2
-    if df > 2:
-        t_var = df / (df - 2)
-    else:
-        # df <= 2: infinite variance, use empirical scaling
-        t_var = 10.0  # approximate
+    if cache is not None:
+        return _touch_from_cache(
+            cache.get(df, n_days, n_paths), spot, iv * math.sqrt(dt),
+            drift_per_step, strikes_above, strikes_below,
+        )
 
-    scale = iv * math.sqrt(dt / t_var)
-    drift_per_step = (drift - 0.5 * iv**2) * dt
+    # Scale Student-t so variance matches iv^2 * dt
+    scale = iv * math.sqrt(dt / _t_variance(df))
 
     # Generate all paths at once using numpy (much faster than scipy)
     rng = np.random.default_rng()
@@ -118,6 +226,156 @@ def batch_touch_probabilities(
     return above_probs, below_probs
 
 
+@dataclass
+class Horizon:
+    """One expiry group for multi_horizon_touch_probabilities()."""
+    days: int
+    iv: float
+    drift: float
+    strikes_above: List[float]
+    strikes_below: List[float]
+
+
+def _log_extremes(
+    std_paths: np.ndarray,
+    step_scale: float,
+    drift_per_step: float,
+    day_indices: List[int],
+    need_max: bool = True,
+    need_min: bool = True,
+) -> Dict[int, Tuple[Optional[np.ndarray], Optional[np.ndarray]]]:
+    """Running max/min of log(S_k/S_0) at each requested day index.
+
+    Rescales standardized cumulative paths segment by segment
+    (``drift_per_step * k + step_scale * std_paths[:, k-1]``), so memory
+    stays at one segment plus two (n_paths,) vectors.
+    """
+    n_paths = std_paths.shape[0]
+    run_max = np.full(n_paths, -np.inf, dtype=np.float32) if need_max else None
+    run_min = np.full(n_paths, np.inf, dtype=np.float32) if need_min else None
+
+    out = {}
+    prev = 0
+    for day in sorted(set(day_indices)):
+        if day > prev:
+            steps = np.arange(prev + 1, day + 1, dtype=np.float32) * np.float32(drift_per_step)
+            seg = std_paths[:, prev:day] * np.float32(step_scale)
+            seg += steps
+            if need_max:
+                np.maximum(run_max, seg.max(axis=1), out=run_max)
+            if need_min:
+                np.minimum(run_min, seg.min(axis=1), out=run_min)
+            prev = day
+        out[day] = (
+            run_max.copy() if need_max else None,
+            run_min.copy() if need_min else None,
+        )
+    return out
+
+
+def _probs_from_extremes(
+    spot: float,
+    log_max: Optional[np.ndarray],
+    log_min: Optional[np.ndarray],
+    strikes_above: List[float],
+    strikes_below: List[float],
+) -> Tuple[Dict[float, float], Dict[float, float]]:
+    """Barrier K is touched iff max_k log(S_k/S_0) >= ln(K/S_0) (min for below)."""
+    above_probs = {}
+    for strike in strikes_above:
+        if strike <= spot:
+            above_probs[strike] = 1.0
+        else:
+            above_probs[strike] = float(np.mean(log_max >= math.log(strike / spot)))
+
+    below_probs = {}
+    for strike in strikes_below:
+        if strike >= spot:
+            below_probs[strike] = 1.0
+        else:
+            below_probs[strike] = float(np.mean(log_min <= math.log(strike / spot)))
+
+    return above_probs, below_probs
+
+
+def _touch_from_cache(
+    std_paths: np.ndarray,
+    spot: float,
+    step_scale: float,
+    drift_per_step: float,
+    strikes_above: List[float],
+    strikes_below: List[float],
+) -> Tuple[Dict[float, float], Dict[float, float]]:
+    """Touch probabilities from standardized cumulative paths (one horizon)."""
+    n_days = std_paths.shape[1]
+    log_max, log_min = _log_extremes(
+        std_paths, step_scale, drift_per_step, [n_days],
+        need_max=bool(strikes_above), need_min=bool(strikes_below),
+    )[n_days]
+    return _probs_from_extremes(spot, log_max, log_min, strikes_above, strikes_below)
+
+
+def multi_horizon_touch_probabilities(
+    spot: float,
+    horizons: List[Horizon],
+    df: float = STUDENT_DF_BTC,
+    n_paths: int = MC_PATHS,
+    cache: Optional[PathCache] = None,
+) -> Dict[int, Tuple[Dict[float, float], Dict[float, float]]]:
+    """Touch probabilities for all expiries of one currency from one simulation.
+
+    Simulates standardized paths once out to the longest horizon. Each
+    horizon's IV and drift are applied by rescaling those paths (daily
+    steps, dt = 1/365). Horizons sharing an (iv, drift) pair — the Deribit
+    curves are piecewise constant — share one pass and read the running
+    max/min at their own day index, so cost grows with the number of
+    distinct IV/drift regimes rather than the number of expiries.
+
+    Returns:
+        {days: (above_probs, below_probs)} for every horizon
+    """
+    results: Dict[int, Tuple[Dict[float, float], Dict[float, float]]] = {}
+    live = []
+    for h in horizons:
+        if h.days <= 0 or h.iv <= 0:
+            results[h.days] = batch_touch_probabilities(
+                spot, h.iv, h.days, h.strikes_above, h.strikes_below,
+            )
+        else:
+            live.append(h)
+
+    if not live:
+        return results
+
+    max_days = max(h.days for h in live)
+    if cache is not None:
+        std_paths = cache.get(df, max_days, n_paths)
+    else:
+        std_paths = PathCache._simulate(df, max_days, n_paths, seed=None)
+
+    dt = 1 / 365
+    regimes: Dict[Tuple[float, float], List[Horizon]] = {}
+    for h in live:
+        regimes.setdefault((h.iv, h.drift), []).append(h)
+
+    for (iv, drift), group in regimes.items():
+        extremes = _log_extremes(
+            std_paths,
+            step_scale=iv * math.sqrt(dt),
+            drift_per_step=(drift - 0.5 * iv**2) * dt,
+            day_indices=[h.days for h in group],
+            need_max=any(h.strikes_above for h in group),
+            need_min=any(h.strikes_below for h in group),
+        )
+        for h in group:
+            log_max, log_min = extremes[h.days]
+            results[h.days] = _probs_from_extremes(
+                spot, log_max, log_min, h.strikes_above, h.strikes_below,
+            )
+
+    return results
+
+
 def single_touch_prob(
     spot: float,
     strike: float,
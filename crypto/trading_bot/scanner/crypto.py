@@ -1,13 +1,16 @@
 """
 Crypto scanner — scans BTC/ETH markets on Polymarket for trading opportunities.
 
-Uses batch Monte Carlo with Student-t innovations for touch probability,
+Uses multi-horizon Monte Carlo with Student-t innovations (or the fast
+analytical approximation) for touch probability,
 live Deribit data for IV and drift, and Binance for spot prices.
 """
 
 import math
 from typing import Callable, Dict, List, Optional, Tuple
 
+from polymarket_console.http_helpers.transport import format_latency_report, shared_transport
+
 from .base import BaseScanner
 from ..config import BotConfig
 from ..models.market import Market
@@ -17,9 +20,10 @@ from ..market_data.binance import BinanceData
 from ..market_data.deribit import DeribitData
 from ..market_data.polymarket import PolymarketData, CryptoMarket
 from ..pricing.touch_prob import (
-    batch_touch_probabilities, get_df, MC_PATHS
+    get_df, MC_PATHS, PathCache, Horizon, multi_horizon_touch_probabilities
 )
 from ..pricing.fast_approx import batch_fast_touch_probabilities
+from ..pricing.variance_reduction import touch_estimates
 from ..pricing.portfolio import kelly_fraction
 from ..logger import get_logger
 
@@ -53,6 +57,12 @@ class CryptoScanner(BaseScanner):
         self.deribit = DeribitData()
         self.polymarket = PolymarketData(config.markets_json)
 
+        # Standardized MC paths reused across scans (MC pricing mode only)
+        path_cache_mb = getattr(config, 'path_cache_mb', 0)
+        self.path_cache: Optional[PathCache] = (
+            PathCache(max_bytes=path_cache_mb * 1024 * 1024) if path_cache_mb > 0 else None
+        )
+
         # Caches from last scan
         self._markets_cache: List[Market] = []
         self._fair_prices: Dict[str, float] = {}      # slug -> fair_price
@@ -159,7 +169,14 @@ class CryptoScanner(BaseScanner):
                 key = (m.currency, days)
                 groups.setdefault(key, []).append(m)
 
-            # Run batch MC for each group
+            # MC: one multi-horizon simulation per currency covers all groups
+            mc_probs = {}
+            if not self.config.fast_pricing:
+                mc_probs = self._price_groups_mc(
+                    groups, {"BTC": btc_spot, "ETH": eth_spot}, progress_callback,
+                )
+
+            # Price each group
             for (currency, days), markets_in_group in groups.items():
                 spot = btc_spot if currency == "BTC" else eth_spot
                 spot_high = btc_high_3m if currency == "BTC" else eth_high_3m
@@ -172,13 +189,11 @@ class CryptoScanner(BaseScanner):
                 strikes_above = [m.strike for m in markets_in_group if m.is_up]
                 strikes_below = [m.strike for m in markets_in_group if not m.is_up]
 
-                if progress_callback:
-                    mode = "Fast" if self.config.fast_pricing else "MC"
-                    progress_callback(
-                        f"{mode} {currency} {days}d: {len(strikes_above)}↑ {len(strikes_below)}↓"
-                    )
-
                 if self.config.fast_pricing:
+                    if progress_callback:
+                        progress_callback(
+                            f"Fast {currency} {days}d: {len(strikes_above)}↑ {len(strikes_below)}↓"
+                        )
                     above_probs, below_probs = batch_fast_touch_probabilities(
                         spot=spot,
                         iv=iv,
@@ -190,16 +205,7 @@ class CryptoScanner(BaseScanner):
                         hybrid=getattr(self.config, 'hybrid_pricing', True),
                     )
                 else:
-                    above_probs, below_probs = batch_touch_probabilities(
-                        spot=spot,
-                        iv=iv,
-                        days=days,
-                        strikes_above=strikes_above,
-                        strikes_below=strikes_below,
-                        drift=drift,
-                        df=df,
-                        n_paths=self.config.mc_paths,
-                    )
+                    above_probs, below_probs = mc_probs[(currency, days)]
 
                 # Generate signals for each market
                 for m in markets_in_group:
@@ -326,6 +332,15 @@ class CryptoScanner(BaseScanner):
             buy_count = len([s for s in signals if s.type == SignalType.BUY])
             skip_count = len([s for s in signals if s.type == SignalType.SKIP])
             logger.log_info(f"Scan found {buy_count} BUY, {skip_count} SKIP signals")
+            cache_stats = self.path_cache_stats()
+            if cache_stats:
+                logger.log_info(
+                    f"Path cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                    f"{cache_stats['entries']} entries ({cache_stats['mb']:.0f}MB)"
+                )
+            # Market-data requests since the previous scan (shared pooled transport)
+            for line in format_latency_report(shared_transport(verify=False).take_stats()).splitlines():
+                logger.log_info(f"Wire {line}")
 
         except Exception as e:
             logger.log_error(f"Error during scan: {e}")
@@ -334,6 +349,93 @@ class CryptoScanner(BaseScanner):
 
         return signals
 
+    def _price_groups_mc(
+        self,
+        groups: Dict[Tuple[str, int], List[CryptoMarket]],
+        spots: Dict[str, float],
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> Dict[Tuple[str, int], Tuple[Dict[float, float], Dict[float, float]]]:
+        """Price all (currency, days) groups with one MC simulation per currency."""
+        horizons: Dict[str, List[Horizon]] = {}
+        for (currency, days), markets_in_group in groups.items():
+            horizons.setdefault(currency, []).append(Horizon(
+                days=days,
+                iv=self.deribit.iv_for_days(currency, days),
+                drift=self.deribit.drift_for_days(currency, days),
+                strikes_above=[m.strike for m in markets_in_group if m.is_up],
+                strikes_below=[m.strike for m in markets_in_group if not m.is_up],
+            ))
+
+        vr_mode = getattr(self.config, 'mc_variance_reduction', None)
+        if vr_mode:
+            return self._price_groups_vr(horizons, spots, vr_mode, progress_callback)
+
+        probs = {}
+        for currency, currency_horizons in horizons.items():
+            if progress_callback:
+                max_days = max(h.days for h in currency_horizons)
+                progress_callback(
+                    f"MC {currency}: {len(currency_horizons)} expiries, {max_days}d"
+                )
+            by_days = multi_horizon_touch_probabilities(
+                spot=spots[currency],
+                horizons=currency_horizons,
+                df=get_df(currency),
+                n_paths=self.config.mc_paths,
+                cache=self.path_cache,
+            )
+            for days, result in by_days.items():
+                probs[(currency, days)] = result
+        return probs
+
+    def _price_groups_vr(
+        self,
+        horizons: Dict[str, List[Horizon]],
+        spots: Dict[str, float],
+        mode: str,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> Dict[Tuple[str, int], Tuple[Dict[float, float], Dict[float, float]]]:
+        """Variance-reduced MC per group; logs the achieved standard error."""
+        logger = get_logger()
+        probs = {}
+        for currency, currency_horizons in horizons.items():
+            for h in currency_horizons:
+                if progress_callback:
+                    progress_callback(
+                        f"MC-{mode} {currency} {h.days}d: "
+                        f"{len(h.strikes_above)}↑ {len(h.strikes_below)}↓"
+                    )
+                above, below = touch_estimates(
+                    spot=spots[currency],
+                    iv=h.iv,
+                    days=h.days,
+                    strikes_above=h.strikes_above,
+                    strikes_below=h.strikes_below,
+                    drift=h.drift,
+                    df=get_df(currency),
+                    n_paths=self.config.mc_paths,
+                    mode=mode,
+                )
+                probs[(currency, h.days)] = (
+                    {k: e.prob for k, e in above.items()},
+                    {k: e.prob for k, e in below.items()},
+                )
+                stderr = [(k, e.stderr) for k, e in {**above, **below}.items()]
+                if stderr:
+                    worst_k, worst_se = max(stderr, key=lambda x: x[1])
+                    logger.log_info(
+                        f"MC-{mode} {currency} {h.days}d: max SE {worst_se:.2%} "
+                        f"(strike {worst_k:,.0f})"
+                    )
+        return probs
+
+    def path_cache_stats(self) -> Optional[dict]:
+        """MC path cache stats, or None when the cache is not in use."""
+        if (self.path_cache is None or self.config.fast_pricing
+                or getattr(self.config, 'mc_variance_reduction', None)):
+            return None
+        return self.path_cache.stats()
+
     def scan_for_exits(
         self,
         positions: List[Position],
@@ -5,10 +5,11 @@ History storage - manages trade history and statistics.
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 from ..models.position import Position, PositionStatus
+from .ledger import TradeLedger
 
 
 @dataclass
@@ -41,6 +42,9 @@ class HistoryStorage:
         self._recent_trades: List[TradeRecord] = []
         self._max_recent = 100
 
+        # Closed-position ledger (appended by PositionStorage on close)
+        self.ledger = TradeLedger(history_dir)
+
     def load_closed_positions(self) -> List[Position]:
         """Load all closed positions from history."""
         positions = []
@@ -93,45 +97,21 @@ class HistoryStorage:
 
     def get_realized_pnl_today(self) -> float:
         """Calculate realized P&L for today."""
-        today = datetime.utcnow().date()
-        total = 0.0
-
-        for position in self.load_closed_positions():
-            if position.exit_time:
-                try:
-                    exit_date = datetime.fromisoformat(
-                        position.exit_time.replace("Z", "+00:00")
-                    ).date()
-                    if exit_date == today:
-                        total += position.realized_pnl()
-                except:
-                    pass
-
-        return total
+        return self.ledger.day(datetime.utcnow().date()).total.pnl
 
     def get_realized_pnl_period(self, days: int = 7) -> float:
         """Calculate realized P&L for the last N days."""
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        total = 0.0
-
-        for position in self.load_closed_positions():
-            if position.exit_time:
-                try:
-                    exit_dt = datetime.fromisoformat(
-                        position.exit_time.replace("Z", "+00:00")
-                    )
-                    if exit_dt.replace(tzinfo=None) >= cutoff:
-                        total += position.realized_pnl()
-                except:
-                    pass
-
-        return total
+        return self.ledger.pnl_since(datetime.utcnow() - timedelta(days=days))
+
+    def get_realized_pnl_by_direction(self) -> Dict[str, float]:
+        """Total realized P&L per market direction ("above"/"below")."""
+        return {d: t.pnl for d, t in self.ledger.by_direction().items()}
 
     def get_statistics(self) -> dict:
         """Get overall trading statistics."""
-        positions = self.load_closed_positions()
+        totals = self.ledger.totals()
 
-        if not positions:
+        if not totals.trades:
             return {
                 "total_trades": 0,
                 "wins": 0,
@@ -143,17 +123,14 @@ class HistoryStorage:
                 "worst_trade": 0.0,
             }
 
-        pnls = [p.realized_pnl() for p in positions]
-        wins = sum(1 for p in pnls if p > 0)
-        losses = sum(1 for p in pnls if p < 0)
-
+        best, worst = self.ledger.extremes()
         return {
-            "total_trades": len(positions),
-            "wins": wins,
-            "losses": losses,
-            "win_rate": wins / len(positions) if positions else 0.0,
-            "total_pnl": sum(pnls),
-            "avg_pnl": sum(pnls) / len(pnls) if pnls else 0.0,
-            "best_trade": max(pnls) if pnls else 0.0,
-            "worst_trade": min(pnls) if pnls else 0.0,
+            "total_trades": totals.trades,
+            "wins": totals.wins,
+            "losses": totals.losses,
+            "win_rate": totals.wins / totals.trades,
+            "total_pnl": totals.pnl,
+            "avg_pnl": totals.pnl / totals.trades,
+            "best_trade": best,
+            "worst_trade": worst,
         }
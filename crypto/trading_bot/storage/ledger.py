@@ -0,0 +1,205 @@
+"""
+Trade ledger - append-only log of closed positions with running P&L aggregates.
+
+Every closed position is appended as one JSON line to ledger.jsonl in the
+history directory (next to the per-position history files). Readers keep
+the byte offset they have consumed and only parse lines appended since,
+folding them into per-day / per-direction totals, so P&L queries cost a
+stat() plus dictionary lookups regardless of how long the bot has run.
+
+On first use the ledger is built once from the existing history/*.json
+files.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..models.position import Position
+
+LEDGER_FILE = "ledger.jsonl"
+
+
+def _exit_datetime(exit_time: Optional[str]) -> Optional[datetime]:
+    """Naive UTC datetime of an ISO exit time (None if missing/invalid)."""
+    if not exit_time:
+        return None
+    try:
+        return datetime.fromisoformat(exit_time.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+@dataclass
+class PnlTotals:
+    """Running P&L aggregate."""
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    pnl: float = 0.0
+
+    def add(self, pnl: float, sign: int = 1) -> None:
+        self.trades += sign
+        self.wins += sign * (pnl > 0)
+        self.losses += sign * (pnl < 0)
+        self.pnl += sign * pnl
+
+
+@dataclass
+class DayTotals:
+    """Aggregates for one UTC exit day."""
+    total: PnlTotals = field(default_factory=PnlTotals)
+    by_direction: Dict[str, PnlTotals] = field(default_factory=dict)
+    # (exit datetime, pnl) — only scanned for the partial day of a rolling window
+    entries: Dict[str, Tuple[datetime, float]] = field(default_factory=dict)
+
+
+class TradeLedger:
+    """Append-only closed-position ledger with incremental aggregates."""
+
+    def __init__(self, history_dir: Path):
+        self.history_dir = history_dir
+        self.path = history_dir / LEDGER_FILE
+        self._lock = threading.Lock()
+
+        self._offset = 0
+        self._records: Dict[str, dict] = {}     # position id -> last record
+        self._days: Dict[Optional[date], DayTotals] = {}
+        self._total = PnlTotals()
+        self._by_direction: Dict[str, PnlTotals] = {}
+        self._best: Optional[float] = None
+        self._worst: Optional[float] = None
+
+        if not self.path.exists():
+            self._migrate()
+
+    @staticmethod
+    def record_for(position: Position) -> dict:
+        """Ledger line for a closed position."""
+        return {
+            "id": position.id,
+            "exit_time": position.exit_time,
+            "direction": position.direction or "",
+            "market_slug": position.market_slug,
+            "outcome": position.outcome,
+            "status": position.status.value,
+            "entry_size": position.entry_size,
+            "pnl": position.realized_pnl(),
+        }
+
+    def _migrate(self) -> None:
+        """One-shot build of the ledger from existing history/*.json files."""
+        lines = []
+        for path in sorted(self.history_dir.glob("*.json")):
+            try:
+                with open(path) as f:
+                    position = Position.from_json(f.read())
+            except Exception as e:
+                print(f"Warning: Failed to load {path}: {e}")
+                continue
+            lines.append(json.dumps(self.record_for(position)) + "\n")
+
+        lines.sort(key=lambda line: json.loads(line)["exit_time"] or "")
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            f.writelines(lines)
+        os.replace(tmp, self.path)
+
+    def append(self, position: Position) -> None:
+        """Append a closed position (one write, O(1))."""
+        line = json.dumps(self.record_for(position)) + "\n"
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line)
+
+    def _catch_up(self) -> None:
+        """Fold lines appended since the last call into the aggregates."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size == self._offset:
+            return
+
+        with self._lock:
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                chunk = f.read(size - self._offset)
+            # Leave a partially written last line for the next call
+            end = chunk.rfind(b"\n") + 1
+            self._offset += end
+            for line in chunk[:end].splitlines():
+                if line.strip():
+                    self._apply(json.loads(line))
+
+    def _apply(self, record: dict) -> None:
+        previous = self._records.get(record["id"])
+        if previous is not None:
+            self._fold(previous, -1)
+        self._records[record["id"]] = record
+        self._fold(record, 1)
+
+        pnl = record["pnl"]
+        if previous is not None:
+            # Rare (position re-written): recompute extremes from scratch
+            pnls = [r["pnl"] for r in self._records.values()]
+            self._best, self._worst = max(pnls), min(pnls)
+        else:
+            self._best = pnl if self._best is None else max(self._best, pnl)
+            self._worst = pnl if self._worst is None else min(self._worst, pnl)
+
+    def _fold(self, record: dict, sign: int) -> None:
+        pnl = record["pnl"]
+        direction = record.get("direction") or ""
+        exit_dt = _exit_datetime(record.get("exit_time"))
+        day = self._days.setdefault(exit_dt.date() if exit_dt else None, DayTotals())
+
+        self._total.add(pnl, sign)
+        self._by_direction.setdefault(direction, PnlTotals()).add(pnl, sign)
+        day.total.add(pnl, sign)
+        day.by_direction.setdefault(direction, PnlTotals()).add(pnl, sign)
+        if sign > 0:
+            if exit_dt:
+                day.entries[record["id"]] = (exit_dt, pnl)
+        else:
+            day.entries.pop(record["id"], None)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def day(self, day: date) -> DayTotals:
+        self._catch_up()
+        return self._days.get(day) or DayTotals()
+
+    def pnl_since(self, cutoff: datetime) -> float:
+        """Realized P&L of positions closed at or after cutoff (naive UTC)."""
+        self._catch_up()
+        total = 0.0
+        cutoff_day = cutoff.date()
+        for day in range((datetime.utcnow().date() - cutoff_day).days + 1):
+            totals = self._days.get(cutoff_day + timedelta(days=day))
+            if totals is None:
+                continue
+            if day == 0:
+                total += sum(pnl for t, pnl in totals.entries.values() if t >= cutoff)
+            else:
+                total += totals.total.pnl
+        return total
+
+    def totals(self) -> PnlTotals:
+        self._catch_up()
+        return self._total
+
+    def by_direction(self) -> Dict[str, PnlTotals]:
+        self._catch_up()
+        return dict(self._by_direction)
+
+    def extremes(self) -> Tuple[float, float]:
+        """(best, worst) single-trade P&L."""
+        self._catch_up()
+        return self._best or 0.0, self._worst or 0.0
@@ -127,6 +127,7 @@ class ScannerPanel(Static):
         self.scan_status: str = ""
         self.pending_confirmation: Optional[Signal] = None
         self.last_scan_time: Optional[datetime] = None
+        self.cache_stats: Optional[dict] = None
 
     def update_signals(self, signals: List[Signal], exit_signals: List[Signal],
                        last_scan_time: Optional[datetime] = None,
@@ -172,6 +173,12 @@ class ScannerPanel(Static):
             buy_count = len([s for s in self.signals if s.type == SignalType.BUY])
             total_count = len(self.signals)
             lines.append(f"Next: {mins}:{secs:02d}  |  Found: {buy_count}/{total_count}")
+            if self.cache_stats:
+                cs = self.cache_stats
+                lines.append(
+                    f"[dim]Path cache: {cs['hits']} hit / {cs['misses']} miss "
+                    f"({cs['hit_rate']:.0%}), {cs['mb']:.0f}MB[/dim]"
+                )
 
         lines.append("")
 
@@ -491,11 +498,14 @@ class FuturesCurvePanel(Static):
         super().__init__(**kwargs)
         self.btc_curve: list = []
         self.eth_curve: list = []
+        self.http_calls: int = 0
         self._updated_at: float = 0.0
 
-    def update_curve(self, btc_curve: list, eth_curve: list, age: int = 0) -> None:
+    def update_curve(self, btc_curve: list, eth_curve: list, age: int = 0,
+                     http_calls: int = 0) -> None:
         self.btc_curve = btc_curve
         self.eth_curve = eth_curve
+        self.http_calls = http_calls
         self._updated_at = time.monotonic()
         self.refresh()
 
@@ -525,7 +535,8 @@ class FuturesCurvePanel(Static):
         lines.append("")
         if self._updated_at > 0:
             age = int(time.monotonic() - self._updated_at)
-            lines.append(f"Updated: {age}s ago")
+            calls = f"  ({self.http_calls} req)" if self.http_calls else ""
+            lines.append(f"Updated: {age}s ago{calls}")
 
         content = "\n".join(lines)
         return Panel(content, title="FUTURES CURVE", border_style="yellow")
@@ -866,6 +877,7 @@ class TradingBotApp(App):
                             snap.get("btc_curve", []),
                             snap.get("eth_curve", []),
                             age,
+                            snap.get("http_calls", 0),
                         )
                     except RuntimeError:
                         pass  # App shutting down
@@ -906,11 +918,11 @@ class TradingBotApp(App):
         except Exception:
             pass
 
-    def _update_futures_panel(self, btc_curve, eth_curve, age=0):
+    def _update_futures_panel(self, btc_curve, eth_curve, age=0, http_calls=0):
         """Update futures curve panel (called from thread)."""
         try:
             panel = self.query_one(FuturesCurvePanel)
-            panel.update_curve(btc_curve, eth_curve, age)
+            panel.update_curve(btc_curve, eth_curve, age, http_calls)
         except Exception:
             pass
 
@@ -1023,6 +1035,7 @@ class TradingBotApp(App):
                 eth_df=self.config.student_df_eth,
                 n_paths=500_000,
                 balance=balance,
+                antithetic=bool(self.config.mc_variance_reduction),
             )
 
             try:
@@ -1110,6 +1123,12 @@ class TradingBotApp(App):
             for market in self.scanner.get_markets():
                 self._markets_cache[market.slug] = market
 
+            # Warm order state for tokens we may buy this cycle
+            if not self.config.dry_run and self.executor.initialized:
+                self.executor.warm(
+                    s.token_id for s in entry_signals if s.type == SignalType.BUY
+                )
+
             # Sort by APY (primary) → Edge (secondary)
             # Prefer short-term positions with high annualized return
             entry_signals.sort(key=lambda s: (s.annual_return, s.edge), reverse=True)
@@ -1188,6 +1207,8 @@ class TradingBotApp(App):
         self._last_scan_time = datetime.now()
 
         # Update UI
+        if self.scanner:
+            scanner_panel.cache_stats = self.scanner.path_cache_stats()
         scanner_panel.update_signals(entry_signals, exit_signals, self._last_scan_time, rotation_proposals)
         scanner_panel.set_scanning(False)
         self.scanning = False
@@ -1239,6 +1260,7 @@ class TradingBotApp(App):
                 dsnap.get("btc_curve", []),
                 dsnap.get("eth_curve", []),
                 age,
+                dsnap.get("http_calls", 0),
             )
 
         if self._shutting_down:
@@ -2239,6 +2261,7 @@ class TradingBotApp(App):
         if self.quit_pending:
             if event.key == "enter":
                 self._shutting_down = True
+                self.executor.stop()
                 if self.scan_timer:
                     self.scan_timer.stop()
                 if self.countdown_timer:
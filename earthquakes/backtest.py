@@ -50,8 +50,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 import statistics
-from concurrent.futures import ProcessPoolExecutor, as_completed
-import multiprocessing
+
+import numpy as np
+
+import etas
 
 # Для прогресс-бара
 try:
@@ -462,31 +464,18 @@ class IntegratedModel:
         self,
         recent_events: list[Earthquake],
         forecast_date: datetime,
+        end_date: Optional[datetime] = None,
     ) -> float:
-        """ETAS-коррекция на основе недавних событий."""
+        """ETAS-коррекция на основе недавних событий (средняя на [forecast_date, end_date])."""
         if not self.use_etas or not recent_events:
             return 0.0
 
-        boost = 0.0
-        c = 0.01
-        p = 1.1
-        alpha = 0.8
-        Mc = self.magnitude - 0.5
-
-        for eq in recent_events:
-            days_ago = (forecast_date - eq.time).total_seconds() / 86400
-
-            if days_ago < 0 or days_ago > 30:
-                continue
-
-            if eq.magnitude < Mc:
-                continue
-
-            productivity = 10 ** (alpha * (eq.magnitude - Mc))
-            omori_factor = 1 / ((days_ago + c) ** p)
-            boost += productivity * omori_factor * 0.01
-
-        return boost
+        times, mags = etas.event_arrays(recent_events)
+        ends = None if end_date is None else [etas.to_days(end_date)]
+        return float(etas.etas_boost(
+            times, mags, [etas.to_days(forecast_date)],
+            mc=self.magnitude - 0.5, eval_ends=ends,
+        )[0])
 
     def predict_at_least(
         self,
@@ -512,7 +501,7 @@ class IntegratedModel:
         alpha_post, beta_post, lambda_mean = self._get_bayesian_params(forecast_date)
 
         # ETAS
-        etas_lambda = self._etas_boost(recent_events, forecast_date)
+        etas_lambda = self._etas_boost(recent_events, forecast_date, end_date)
 
         # Корректируем параметры
         remaining_years = period_days / 365.0
@@ -555,7 +544,7 @@ class IntegratedModel:
         alpha_post, beta_post, lambda_mean = self._get_bayesian_params(forecast_date)
 
         # ETAS
-        etas_lambda = self._etas_boost(recent_events, forecast_date)
+        etas_lambda = self._etas_boost(recent_events, forecast_date, end_date)
 
         # Корректируем параметры
         remaining_years = period_days / 365.0
@@ -921,150 +910,160 @@ def get_market_ranges_for_period(magnitude: float, period_days: float) -> list[t
             ]
 
 
-def _process_single_forecast(args: tuple) -> list[ForecastResult]:
-    """
-    Обработать один прогноз для ВСЕХ порогов (для параллельного выполнения).
+# ============================================================================
+# ВЕКТОРИЗОВАННЫЙ ДВИЖОК
+# ============================================================================
+#
+# Каталог хранится как отсортированные массивы (время в секундах, магнитуда).
+# Количество событий в окнах для всех дат прогноза считается двумя
+# searchsorted, вероятности для всех дат × порогов/интервалов — одним
+# векторным вызовом scipy.stats.
+
+def _catalog_arrays(earthquakes: list[Earthquake], magnitude: float) -> tuple[np.ndarray, np.ndarray]:
+    """Отсортированные по времени массивы (timestamp, magnitude) для M >= magnitude."""
+    selected = sorted(
+        (eq.time.timestamp(), eq.magnitude)
+        for eq in earthquakes if eq.magnitude >= magnitude
+    )
+    if not selected:
+        return np.empty(0), np.empty(0)
+    times, mags = zip(*selected)
+    return np.array(times), np.array(mags)
 
-    Возвращает список результатов — по одному на каждый threshold.
-    """
-    (forecast_date, period_days, magnitude,
-     eq_times_mags, historical_m7, historical_m8) = args
-
-    # Пересоздаём модели в процессе (они не сериализуются)
-    simple = SimpleModel(magnitude)
-    integrated = IntegratedModel(magnitude)
-    consensus = ConsensusModel(magnitude)
-
-    forecast_end = forecast_date + timedelta(days=period_days)
-
-    # Получаем недавние события (последние 30 дней)
-    recent_start = forecast_date - timedelta(days=30)
-    recent_events = [
-        Earthquake(
-            time=datetime.fromisoformat(t),
-            magnitude=m,
-            place="", latitude=0, longitude=0, depth=0, id=""
-        )
-        for t, m in eq_times_mags
-        if recent_start <= datetime.fromisoformat(t) < forecast_date
-    ]
 
-    # Считаем события в периоде
-    actual = sum(
-        1 for t, m in eq_times_mags
-        if forecast_date <= datetime.fromisoformat(t) < forecast_end
-    )
+def _forecast_dates(start_year: int, end_year: int, period_days: int, step_days: int) -> list[datetime]:
+    """Даты прогнозов каждые step_days дней."""
+    forecast_dates = []
+    current = datetime(start_year, 1, 1, tzinfo=timezone.utc)
+    end_limit = datetime(end_year, 12, 31, tzinfo=timezone.utc) - timedelta(days=period_days)
 
-    # Получаем пороги для этого периода
-    thresholds = get_thresholds_for_period(magnitude, period_days)
+    while current < end_limit:
+        forecast_dates.append(current)
+        current += timedelta(days=step_days)
 
-    results = []
-    for threshold in thresholds:
-        # Прогнозы для каждого порога
-        simple_prob = simple.predict_at_least(threshold, period_days)
-        integrated_prob = integrated.predict_at_least(
-            threshold, period_days,
-            forecast_date=forecast_date,
-            recent_events=recent_events,
-        )
-        consensus_prob, consensus_type = consensus.predict_at_least(
-            threshold, period_days,
-            forecast_date=forecast_date,
-            recent_events=recent_events,
-        )
+    return forecast_dates
+
+
+def _window_counts(times: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Количество событий в [start, end) для каждой пары."""
+    return (np.searchsorted(times, ends, side="left")
+            - np.searchsorted(times, starts, side="left"))
 
-        results.append(ForecastResult(
-            forecast_date=forecast_date,
-            end_date=forecast_end,
-            period_days=period_days,
-            magnitude=magnitude,
-            threshold=threshold,
-            simple_prob=simple_prob,
-            integrated_prob=integrated_prob,
-            consensus_prob=consensus_prob,
-            consensus_type=consensus_type,
-            actual_count=actual,
-            outcome=actual >= threshold,
-        ))
 
-    return results
+def _poisson_cdf_many(k: np.ndarray, lam: np.ndarray) -> np.ndarray:
+    if HAS_SCIPY:
+        return stats.poisson.cdf(k, lam)
+    return np.vectorize(lambda kk, ll: poisson_cdf(int(kk), ll) if kk >= 0 else 0.0)(k, lam)
+
+
+def _nbinom_cdf_many(k: np.ndarray, r: np.ndarray, p: np.ndarray) -> np.ndarray:
+    if HAS_SCIPY:
+        return stats.nbinom.cdf(k, r, p)
+    return np.vectorize(lambda kk, rr, pp: negative_binomial_cdf(int(kk), rr, pp) if kk >= 0 else 0.0)(k, r, p)
 
 
-def _process_single_forecast_intervals(args: tuple) -> list[ForecastResultInterval]:
+def _range_probs(cdf, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
     """
-    Обработать один прогноз для ВСЕХ интервалов (для параллельного выполнения).
+    P(lo <= X <= hi) по CDF.
 
-    Возвращает список результатов — по одному на каждый интервал.
+    Args:
+        cdf: Функция k -> CDF(k), векторизованная (broadcast по датам)
+        lo: Минимум дополнительных событий (>= 0)
+        hi: Максимум (np.inf = без верхней границы)
     """
-    (forecast_date, period_days, magnitude,
-     eq_times_mags, historical_m7, historical_m8) = args
-
-    # Пересоздаём модели в процессе (они не сериализуются)
-    simple = SimpleModel(magnitude)
-    integrated = IntegratedModel(magnitude)
-    consensus = ConsensusModel(magnitude)
-
-    forecast_end = forecast_date + timedelta(days=period_days)
-
-    # Получаем недавние события (последние 30 дней)
-    recent_start = forecast_date - timedelta(days=30)
-    recent_events = [
-        Earthquake(
-            time=datetime.fromisoformat(t),
-            magnitude=m,
-            place="", latitude=0, longitude=0, depth=0, id=""
+    upper = np.where(np.isinf(hi), 1.0, cdf(np.where(np.isinf(hi), 0, hi)))
+    prob = upper - cdf(lo - 1)
+    prob = np.where(hi < lo, 0.0, prob)
+    return np.clip(prob, 0.0, 1.0)
+
+
+def _simple_probs(model: SimpleModel, lo: np.ndarray, hi: np.ndarray, period_days: float) -> np.ndarray:
+    """Вероятности простой модели, shape (n_ranges,) — от даты не зависят."""
+    lam = model.annual_rate * (period_days / 365.0)
+    return _range_probs(lambda k: _poisson_cdf_many(k, lam), lo, hi)
+
+
+def _integrated_probs(
+    model: IntegratedModel,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    period_days: float,
+    forecast_dates: list[datetime],
+    times: np.ndarray,
+    mags: np.ndarray,
+) -> np.ndarray:
+    """Вероятности интегрированной модели, shape (n_dates, n_ranges)."""
+    params = [model._get_bayesian_params(fd) for fd in forecast_dates]
+    alpha_post = np.array([a for a, _, _ in params])[:, None]
+    beta_post = np.array([b for _, b, _ in params])[:, None]
+    lambda_mean = np.array([m for _, _, m in params])[:, None]
+
+    # ETAS — только если включена (в бэктесте по умолчанию выключена):
+    # одна матрица даты × события, средняя интенсивность на окне прогноза
+    etas_lambda = np.zeros_like(lambda_mean)
+    if model.use_etas and len(times):
+        stamps = np.array([fd.timestamp() for fd in forecast_dates]) / 86400
+        etas_lambda[:, 0] = etas.etas_boost(
+            times / 86400, mags, stamps,
+            mc=model.magnitude - 0.5, eval_ends=stamps + period_days,
         )
-        for t, m in eq_times_mags
-        if recent_start <= datetime.fromisoformat(t) < forecast_date
-    ]
 
-    # Считаем события в периоде
-    actual = sum(
-        1 for t, m in eq_times_mags
-        if forecast_date <= datetime.fromisoformat(t) < forecast_end
+    remaining_years = period_days / 365.0
+    effective_beta = beta_post / (1 + etas_lambda / np.maximum(lambda_mean, 0.1))
+    p = effective_beta / (effective_beta + remaining_years)
+    fallback = (p <= 0) | (p >= 1)
+
+    probs = _range_probs(
+        lambda k: _nbinom_cdf_many(k, alpha_post, np.clip(p, 1e-12, 1 - 1e-12)), lo, hi
     )
+    if fallback.any():
+        # Fallback на Poisson
+        lam = lambda_mean * remaining_years
+        probs = np.where(fallback, _range_probs(lambda k: _poisson_cdf_many(k, lam), lo, hi), probs)
+    return probs
 
-    # Получаем интервалы для этого периода
-    intervals = get_market_ranges_for_period(magnitude, period_days)
 
-    results = []
-    for interval_name, min_count, max_count in intervals:
-        # Проверяем, попадает ли actual в интервал
-        if max_count is None:
-            outcome = actual >= min_count
-        else:
-            outcome = min_count <= actual <= max_count
-
-        # Прогнозы для каждого интервала
-        simple_prob = simple.predict_range(min_count, max_count, period_days)
-        integrated_prob = integrated.predict_range(
-            min_count, max_count, period_days,
-            forecast_date=forecast_date,
-            recent_events=recent_events,
-        )
-        consensus_prob, consensus_type = consensus.predict_range(
-            min_count, max_count, period_days,
-            forecast_date=forecast_date,
-            recent_events=recent_events,
-        )
+def _consensus_probs(
+    magnitude: float,
+    simple_probs: np.ndarray,
+    integrated_probs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Консенсус (как ConsensusModel): вероятности и типы, shape (n_dates, n_ranges)."""
+    if magnitude < 8.0:
+        return integrated_probs, np.full(integrated_probs.shape, "primary", dtype=object)
 
-        results.append(ForecastResultInterval(
-            forecast_date=forecast_date,
-            end_date=forecast_end,
-            period_days=period_days,
-            magnitude=magnitude,
-            interval_name=interval_name,
-            interval_min=min_count,
-            interval_max=max_count,
-            simple_prob=simple_prob,
-            integrated_prob=integrated_prob,
-            consensus_prob=consensus_prob,
-            consensus_type=consensus_type,
-            actual_count=actual,
-            outcome=outcome,
-        ))
+    diff = np.abs(integrated_probs - simple_probs)
+    probs = np.where(diff < 0.05, (integrated_probs + simple_probs) / 2, integrated_probs)
+    kinds = np.where(diff < 0.05, "agree", np.where(diff < 0.15, "weak", "disagree")).astype(object)
+    return probs, kinds
 
-    return results
+
+def _evaluate(
+    earthquakes: list[Earthquake],
+    magnitude: float,
+    period_days: int,
+    forecast_dates: list[datetime],
+    lo: np.ndarray,
+    hi: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Прогнозы всех трёх моделей для всех дат × диапазонов.
+
+    Returns:
+        (actual_counts, simple, integrated, consensus, consensus_types)
+    """
+    times, mags = _catalog_arrays(earthquakes, magnitude)
+    stamps = np.array([fd.timestamp() for fd in forecast_dates])
+    actual = _window_counts(times, stamps, stamps + period_days * 86400)
+
+    simple = np.broadcast_to(
+        _simple_probs(SimpleModel(magnitude), lo, hi, period_days), (len(forecast_dates), len(lo))
+    )
+    integrated = _integrated_probs(
+        IntegratedModel(magnitude), lo, hi, period_days, forecast_dates, times, mags
+    )
+    consensus, kinds = _consensus_probs(magnitude, simple, integrated)
+    return actual, simple, integrated, consensus, kinds
 
 
 def run_backtest_intervals(
@@ -1082,49 +1081,40 @@ def run_backtest_intervals(
     Запустить бэктест для интервалов (как на Polymarket).
 
     В отличие от run_backtest, тестирует P(min <= X <= max), а не P(X >= N).
+    parallel/n_workers/show_progress оставлены для совместимости: расчёт
+    векторизован и идёт в одном процессе.
     """
-    # Фильтруем землетрясения и преобразуем для сериализации
-    eq_filtered = [eq for eq in earthquakes if eq.magnitude >= magnitude]
-    eq_times_mags = [(eq.time.isoformat(), eq.magnitude) for eq in eq_filtered]
-
-    # Генерируем даты прогнозов
-    forecast_dates = []
-    current = datetime(start_year, 1, 1, tzinfo=timezone.utc)
-    end_limit = datetime(end_year, 12, 31, tzinfo=timezone.utc) - timedelta(days=period_days)
-
-    while current < end_limit:
-        forecast_dates.append(current)
-        current += timedelta(days=step_days)
+    forecast_dates = _forecast_dates(start_year, end_year, period_days, step_days)
+    intervals = get_market_ranges_for_period(magnitude, period_days)
+    if not forecast_dates:
+        return []
 
-    # Подготавливаем аргументы
-    tasks = [
-        (fd, period_days, magnitude,
-         eq_times_mags, M7_HISTORICAL_COUNTS, M8_HISTORICAL_COUNTS)
-        for fd in forecast_dates
-    ]
+    lo = np.array([max(0, mn) for _, mn, _ in intervals], dtype=float)
+    hi = np.array([np.inf if mx is None else mx for _, _, mx in intervals], dtype=float)
+    actual, simple, integrated, consensus, kinds = _evaluate(
+        earthquakes, magnitude, period_days, forecast_dates, lo, hi
+    )
 
     all_results = []
-
-    if parallel and len(tasks) > 10:
-        if n_workers is None:
-            n_workers = min(multiprocessing.cpu_count(), 8)
-
-        desc = f"M{magnitude}+ {period_days}d intervals"
-
-        if HAS_TQDM and show_progress:
-            with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                futures = [executor.submit(_process_single_forecast_intervals, task) for task in tasks]
-                for future in tqdm(as_completed(futures), total=len(futures), desc=desc, leave=False):
-                    all_results.extend(future.result())
-        else:
-            with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                for result_list in executor.map(_process_single_forecast_intervals, tasks):
-                    all_results.extend(result_list)
-    else:
-        desc = f"M{magnitude}+ {period_days}d intervals"
-        iterator = tqdm(tasks, desc=desc, leave=False) if (HAS_TQDM and show_progress) else tasks
-        for task in iterator:
-            all_results.extend(_process_single_forecast_intervals(task))
+    for i, forecast_date in enumerate(forecast_dates):
+        forecast_end = forecast_date + timedelta(days=period_days)
+        count = int(actual[i])
+        for j, (interval_name, min_count, max_count) in enumerate(intervals):
+            all_results.append(ForecastResultInterval(
+                forecast_date=forecast_date,
+                end_date=forecast_end,
+                period_days=period_days,
+                magnitude=magnitude,
+                interval_name=interval_name,
+                interval_min=min_count,
+                interval_max=max_count,
+                simple_prob=float(simple[i, j]),
+                integrated_prob=float(integrated[i, j]),
+                consensus_prob=float(consensus[i, j]),
+                consensus_type=kinds[i, j],
+                actual_count=count,
+                outcome=count >= min_count and (max_count is None or count <= max_count),
+            ))
 
     # Сортируем по дате прогноза и интервалу
     all_results.sort(key=lambda r: (r.forecast_date, r.interval_min))
@@ -1150,54 +1140,38 @@ def run_backtest(
     Для каждой даты тестирует несколько порогов (thresholds).
 
     Args:
-        parallel: Использовать параллельную обработку
-        n_workers: Количество процессов (None = auto)
-        show_progress: Показывать прогресс-бар
+        parallel, n_workers, show_progress: Оставлены для совместимости —
+            расчёт векторизован и идёт в одном процессе
     """
-    # Фильтруем землетрясения и преобразуем для сериализации
-    eq_filtered = [eq for eq in earthquakes if eq.magnitude >= magnitude]
-    eq_times_mags = [(eq.time.isoformat(), eq.magnitude) for eq in eq_filtered]
-
-    # Генерируем даты прогнозов
-    forecast_dates = []
-    current = datetime(start_year, 1, 1, tzinfo=timezone.utc)
-    end_limit = datetime(end_year, 12, 31, tzinfo=timezone.utc) - timedelta(days=period_days)
-
-    while current < end_limit:
-        forecast_dates.append(current)
-        current += timedelta(days=step_days)
+    forecast_dates = _forecast_dates(start_year, end_year, period_days, step_days)
+    thresholds = get_thresholds_for_period(magnitude, period_days)
+    if not forecast_dates:
+        return []
 
-    # Подготавливаем аргументы для обработки (без threshold — он теперь внутри)
-    tasks = [
-        (fd, period_days, magnitude,
-         eq_times_mags, M7_HISTORICAL_COUNTS, M8_HISTORICAL_COUNTS)
-        for fd in forecast_dates
-    ]
+    lo = np.array(thresholds, dtype=float)
+    hi = np.full(len(thresholds), np.inf)
+    actual, simple, integrated, consensus, kinds = _evaluate(
+        earthquakes, magnitude, period_days, forecast_dates, lo, hi
+    )
 
     all_results = []
-
-    if parallel and len(tasks) > 10:
-        # Параллельная обработка
-        if n_workers is None:
-            n_workers = min(multiprocessing.cpu_count(), 8)
-
-        desc = f"M{magnitude}+ {period_days}d"
-
-        if HAS_TQDM and show_progress:
-            with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                futures = [executor.submit(_process_single_forecast, task) for task in tasks]
-                for future in tqdm(as_completed(futures), total=len(futures), desc=desc, leave=False):
-                    all_results.extend(future.result())  # extend т.к. возвращает list
-        else:
-            with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                for result_list in executor.map(_process_single_forecast, tasks):
-                    all_results.extend(result_list)
-    else:
-        # Последовательная обработка
-        desc = f"M{magnitude}+ {period_days}d"
-        iterator = tqdm(tasks, desc=desc, leave=False) if (HAS_TQDM and show_progress) else tasks
-        for task in iterator:
-            all_results.extend(_process_single_forecast(task))
+    for i, forecast_date in enumerate(forecast_dates):
+        forecast_end = forecast_date + timedelta(days=period_days)
+        count = int(actual[i])
+        for j, threshold in enumerate(thresholds):
+            all_results.append(ForecastResult(
+                forecast_date=forecast_date,
+                end_date=forecast_end,
+                period_days=period_days,
+                magnitude=magnitude,
+                threshold=threshold,
+                simple_prob=float(simple[i, j]),
+                integrated_prob=float(integrated[i, j]),
+                consensus_prob=float(consensus[i, j]),
+                consensus_type=kinds[i, j],
+                actual_count=count,
+                outcome=count >= threshold,
+            ))
 
     # Сортируем по дате прогноза и порогу
     all_results.sort(key=lambda r: (r.forecast_date, r.threshold))
@@ -1779,8 +1753,10 @@ def main():
     parser.add_argument("--magnitude", type=float, help="Только эта магнитуда (7.0, 8.0 или 9.0)")
     parser.add_argument("--period", type=int, help="Только этот период (дни)")
     parser.add_argument("--step", type=int, default=30, help="Шаг между прогнозами в днях (default: 30)")
-    parser.add_argument("--workers", type=int, default=None, help="Количество worker процессов")
-    parser.add_argument("--no-parallel", action="store_true", help="Отключить параллелизм")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Не используется (расчёт векторизован), оставлен для совместимости")
+    parser.add_argument("--no-parallel", action="store_true",
+                        help="Не используется (расчёт векторизован), оставлен для совместимости")
     parser.add_argument("--output", type=str, help="Путь к выходному файлу")
     parser.add_argument("--thresholds", action="store_true",
                         help="Тестировать пороги >=N вместо интервалов Polymarket")
@@ -1798,8 +1774,7 @@ def main():
         print(f"Режим: ИНТЕРВАЛЫ (как на Polymarket)")
     else:
         print(f"Режим: пороги (>=N событий)")
-    n_workers = args.workers or min(multiprocessing.cpu_count(), 8)
-    print(f"Параллелизм: {'ВЫКЛ' if args.no_parallel else f'{n_workers} workers'}")
+    print("Расчёт: векторизованный (NumPy searchsorted + scipy.stats)")
     print(f"TQDM: {'ВКЛ' if HAS_TQDM else 'ВЫКЛ (pip install tqdm)'}")
     print(f"Scipy: {'ВКЛ' if HAS_SCIPY else 'ВЫКЛ (pip install scipy)'}")
     print()
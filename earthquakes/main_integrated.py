@@ -24,6 +24,8 @@ from pathlib import Path
 from typing import Optional
 
 from usgs_client import USGSClient
+from usgs_catalog import USGSCatalog
+import etas
 from polymarket_client import PolymarketClient
 from markets import EARTHQUAKE_ANNUAL_RATES
 
@@ -281,6 +283,7 @@ class IntegratedModel:
         recent_events: list[dict],
         now: datetime,
         decay_days: float = 30.0,
+        end_date: Optional[datetime] = None,
     ) -> float:
         """
         ETAS-коррекция на основе недавних событий.
@@ -292,6 +295,9 @@ class IntegratedModel:
             recent_events: список событий с 'time' и 'magnitude'
             now: текущее время
             decay_days: горизонт влияния
+            end_date: конец окна рынка — если задан, берётся средняя
+                интенсивность на [now, end_date] (интеграл Омори), а не
+                значение в точке now
 
         Returns:
             Дополнительный λ от кластеризации
@@ -299,40 +305,15 @@ class IntegratedModel:
         if not self.use_etas or not recent_events:
             return 0.0
 
-        boost = 0.0
-
-        # Параметры ETAS (типичные значения)
-        c = 0.01  # Параметр Омори (дни)
-        p = 1.1   # Экспонента Омори
-        alpha = 0.8  # Параметр продуктивности
-        Mc = self.magnitude - 0.5  # Cutoff magnitude
-
-        for event in recent_events:
-            event_time = event.get('time')
-            if isinstance(event_time, str):
-                event_time = datetime.fromisoformat(event_time.replace('Z', '+00:00'))
-
-            days_ago = (now - event_time).total_seconds() / 86400
-
-            if days_ago < 0 or days_ago > decay_days:
-                continue
-
-            mag = float(event.get('magnitude', 0))
-
-            if mag < Mc:
-                continue
-
-            # Продуктивность: сколько афтершоков ожидаем от этого события
-            # 10^(α * (M - Mc)) = ожидаемое число M≥Mc афтершоков
-            productivity = 10 ** (alpha * (mag - Mc))
-
-            # Затухание по Омори
-            omori_factor = 1 / ((days_ago + c) ** p)
-
-            # Вклад этого события
-            boost += productivity * omori_factor * 0.01  # Калибровочный коэффициент
-
-        return boost
+        times, mags = etas.event_arrays(recent_events)
+        ends = None if end_date is None else [etas.to_days(end_date)]
+        boost = etas.etas_boost(
+            times, mags, [etas.to_days(now)],
+            mc=self.magnitude - 0.5,  # Cutoff magnitude
+            eval_ends=ends,
+            decay_days=decay_days,
+        )
+        return float(boost[0])
 
     def probability_count(
         self,
@@ -374,8 +355,8 @@ class IntegratedModel:
             beta_post = self.beta_prior
             lambda_mean = self.annual_rate
 
-        # 2. ETAS boost
-        etas_lambda = self.etas_boost(recent_events, now)
+        # 2. ETAS boost (средний на оставшемся окне рынка)
+        etas_lambda = self.etas_boost(recent_events, now, end_date=end_date)
 
         # 3. Финальный λ для периода
         remaining_years = remaining_days / 365.0
@@ -1468,7 +1449,7 @@ def main():
 
     # Инициализация
     poly = PolymarketClient()
-    usgs = USGSClient()
+    usgs = USGSCatalog()
 
     # Анализ
     print("\nАнализирую рынки...")
@@ -37,6 +37,7 @@ from markets import EARTHQUAKE_ANNUAL_RATES
 
 # Для USGS
 from usgs_client import USGSClient
+from usgs_catalog import USGSCatalog
 from polymarket_client import PolymarketClient
 
 # Для monitor_bot (альтернативный мониторинг - раннее обнаружение)
@@ -1019,7 +1020,7 @@ def main():
 
     # Инициализация
     poly = PolymarketClient()
-    usgs = USGSClient()
+    usgs = USGSCatalog()
 
     # Анализ
     print("\nАнализирую рынки...")
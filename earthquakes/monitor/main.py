@@ -16,7 +16,7 @@ import asyncio
 import logging
 import signal
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from .config import config
@@ -40,6 +40,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Events older than this are dropped from the matcher index
+INDEX_RETENTION_HOURS = 24
+
 
 class EarthquakeMonitor:
     """Main earthquake monitoring service."""
@@ -56,6 +59,8 @@ class EarthquakeMonitor:
     def __init__(self, sources: Optional[list[str]] = None):
         self.db = Database()
         self.matcher = EventMatcher()
+        self.index = self.matcher.new_index()
+        self._last_prune = datetime.now(timezone.utc)
         self._running = False
         self._collectors = []
         self._tasks = []
@@ -76,6 +81,9 @@ class EarthquakeMonitor:
         await self.db.connect()
         logger.info(f"Database: {config.DB_HOST}:{config.DB_PORT}/{config.DB_NAME}")
 
+        # Warm the matcher index once; afterwards it is kept in sync locally
+        await self._load_index()
+
         # Initialize collectors
         for name in self._source_names:
             if name in self.COLLECTORS:
@@ -121,31 +129,43 @@ class EarthquakeMonitor:
         await self.db.close()
         logger.info("Stopped")
 
+    async def _load_index(self):
+        """Load recent events from the database into the matcher index."""
+        try:
+            events = await self.db.get_recent_events(
+                hours=INDEX_RETENTION_HOURS,
+                min_magnitude=config.MIN_MAGNITUDE_TRACK - 0.5,
+            )
+        except Exception as e:
+            logger.warning(f"Could not load recent events for matching: {e}")
+            return
+        for event in events:
+            self.index.add(event)
+        logger.info(f"Matcher index: {len(self.index)} events from the last {INDEX_RETENTION_HOURS}h")
+
     async def _handle_report(self, report: SourceReport):
         """Handle incoming earthquake report."""
         try:
             # Check if we already have this source event
-            existing = await self.db.get_event_by_source_id(
-                report.source, report.source_event_id
-            )
-
-            if existing:
+            if self.index.find_by_source(report.source, report.source_event_id):
                 # Already processed this exact report
                 return
 
-            # Get recent events for matching
-            recent_events = await self.db.get_recent_events(
-                hours=24,
-                min_magnitude=config.MIN_MAGNITUDE_TRACK - 0.5,
-            )
+            now = datetime.now(timezone.utc)
+            if now - self._last_prune > timedelta(minutes=10):
+                self.index.prune(now - timedelta(hours=INDEX_RETENTION_HOURS))
+                self._last_prune = now
 
             # Try to match to existing event
-            matched_id = self.matcher.find_matching_event(report, recent_events)
+            event = self.matcher.find_match(
+                report, self.index, min_magnitude=config.MIN_MAGNITUDE_TRACK - 0.5,
+            )
 
-            if matched_id:
-                # Update existing event
-                event = next(e for e in recent_events if e.event_id == matched_id)
+            if event:
+                # Update existing event (index first, so a burst of reports
+                # arriving while the DB write is in flight sees it)
                 event = self.matcher.update_event_from_report(event, report)
+                self.index.add(event)
                 await self.db.update_event(event)
                 await self.db.insert_report(report, event.event_id)
 
@@ -163,6 +183,7 @@ class EarthquakeMonitor:
             else:
                 # Create new event
                 event = self.matcher.create_event_from_report(report)
+                self.index.add(event)
                 await self.db.insert_event(event)
                 await self.db.insert_report(report, event.event_id)
 
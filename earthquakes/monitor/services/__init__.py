@@ -2,10 +2,12 @@
 Services for earthquake monitoring.
 """
 
+from .event_index import EventIndex
 from .event_matcher import EventMatcher
 from .history import ExtendedHistoryService
 
 __all__ = [
+    "EventIndex",
     "EventMatcher",
     "ExtendedHistoryService",
 ]
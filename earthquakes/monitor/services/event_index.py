@@ -0,0 +1,197 @@
+"""
+In-memory spatio-temporal index of earthquake events for report matching.
+
+Events are bucketed by (time window, geohash cell). A report only has to be
+compared against events in the neighbouring time buckets and the geohash
+cells overlapping its search radius, and source-id duplicates are found
+with one dict lookup, so handling a report needs no database round-trip.
+
+The index is kept in sync by the monitor: events loaded from the database
+at startup are added once, and every event it creates or updates is
+re-added after the write.
+"""
+
+import math
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterator, Optional
+from uuid import UUID
+
+from ..config import config
+from ..models import EarthquakeEvent, SourceReport
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_EARTH_RADIUS_KM = 6371
+_KM_PER_DEG_LAT = math.pi * _EARTH_RADIUS_KM / 180
+_MAX_PRECISION = 8
+
+SOURCE_ID_FIELDS = {
+    "usgs": "usgs_id",
+    "jma": "jma_id",
+    "emsc": "emsc_id",
+    "gfz": "gfz_id",
+    "iris": "iris_id",
+    "ingv": "ingv_id",
+}
+
+
+def _bits(precision: int) -> tuple[int, int]:
+    """(lat_bits, lon_bits) of a geohash with this many characters."""
+    total = 5 * precision
+    return total // 2, total - total // 2
+
+
+def _cell_index(lat: float, lon: float, precision: int) -> tuple[int, int]:
+    """Row/column of the geohash cell containing (lat, lon)."""
+    lat_bits, lon_bits = _bits(precision)
+    i = int((lat + 90) / 180 * (1 << lat_bits))
+    j = int(((lon + 180) % 360) / 360 * (1 << lon_bits))
+    return min(i, (1 << lat_bits) - 1), j
+
+
+def _geohash_from_index(i: int, j: int, precision: int) -> str:
+    """Interleave row/column bits (longitude first) into a geohash string."""
+    lat_bits, lon_bits = _bits(precision)
+    value = 0
+    for k in range(5 * precision):
+        if k % 2 == 0:
+            lon_bits -= 1
+            bit = (j >> lon_bits) & 1
+        else:
+            lat_bits -= 1
+            bit = (i >> lat_bits) & 1
+        value = (value << 1) | bit
+    chars = []
+    for _ in range(precision):
+        chars.append(_BASE32[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def geohash(lat: float, lon: float, precision: int) -> str:
+    """Standard geohash of a point."""
+    i, j = _cell_index(lat, lon, precision)
+    return _geohash_from_index(i, j, precision)
+
+
+def precision_for_radius(radius_km: float) -> int:
+    """Finest geohash precision whose cells are at least radius_km tall."""
+    precision = 1
+    while precision < _MAX_PRECISION:
+        lat_bits, _ = _bits(precision + 1)
+        if 180 / (1 << lat_bits) * _KM_PER_DEG_LAT < radius_km:
+            break
+        precision += 1
+    return precision
+
+
+def cells_within(lat: float, lon: float, radius_km: float, precision: int) -> set[str]:
+    """Geohash cells overlapping the bounding box of a circle around (lat, lon)."""
+    lat_bits, lon_bits = _bits(precision)
+    d_lat = radius_km / _KM_PER_DEG_LAT
+    lat_lo, lat_hi = max(-90.0, lat - d_lat), min(90.0, lat + d_lat)
+
+    # Widest longitude reach of a great circle of this radius, taken at the
+    # more polar edge of the box; near a pole every column qualifies
+    cos_lat = min(math.cos(math.radians(lat_lo)), math.cos(math.radians(lat_hi)))
+    reach = math.sin(radius_km / _EARTH_RADIUS_KM) / cos_lat if cos_lat > 1e-9 else 1.0
+    n_cols = 1 << lon_bits
+    if reach >= 1:
+        cols = range(n_cols)
+    else:
+        d_lon = math.degrees(math.asin(reach))
+        _, j_lo = _cell_index(lat, lon - d_lon, precision)
+        _, j_hi = _cell_index(lat, lon + d_lon, precision)
+        span = (j_hi - j_lo) % n_cols
+        cols = [(j_lo + k) % n_cols for k in range(span + 1)]
+
+    i_lo, _ = _cell_index(lat_lo, lon, precision)
+    i_hi, _ = _cell_index(lat_hi, lon, precision)
+    return {_geohash_from_index(i, j, precision)
+            for i in range(i_lo, i_hi + 1) for j in cols}
+
+
+class EventIndex:
+    """
+    Events bucketed by (time bucket, geohash cell), plus a source-id map.
+
+    Time buckets are time_window_sec wide and geohash cells at least
+    distance_km tall, so every event within the matching thresholds of a
+    report lives in one of the 3 neighbouring time buckets and the cells
+    returned by cells_within().
+    """
+
+    def __init__(self, time_window_sec: int = None, distance_km: float = None):
+        self.time_window_sec = time_window_sec or config.MATCH_TIME_WINDOW_SEC
+        self.distance_km = distance_km or config.MATCH_DISTANCE_KM
+        self.precision = precision_for_radius(self.distance_km)
+
+        self._events: dict[UUID, EarthquakeEvent] = {}
+        self._keys: dict[UUID, tuple[int, str]] = {}
+        self._buckets: dict[tuple[int, str], set[UUID]] = defaultdict(set)
+        self._by_source: dict[tuple[str, str], UUID] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[EarthquakeEvent]:
+        return iter(list(self._events.values()))
+
+    def _time_bucket(self, t: datetime) -> int:
+        return int(t.timestamp() // self.time_window_sec)
+
+    def add(self, event: EarthquakeEvent) -> None:
+        """Insert or refresh an event (call again after every update)."""
+        key = (self._time_bucket(event.event_time),
+               geohash(event.latitude, event.longitude, self.precision))
+        old_key = self._keys.get(event.event_id)
+        if old_key != key:
+            if old_key is not None:
+                self._discard_from_bucket(old_key, event.event_id)
+            self._buckets[key].add(event.event_id)
+            self._keys[event.event_id] = key
+        self._events[event.event_id] = event
+
+        # Remember every source id ever attached to the event
+        for source, attr in SOURCE_ID_FIELDS.items():
+            source_id = getattr(event, attr, None)
+            if source_id:
+                self._by_source[(source, source_id)] = event.event_id
+
+    def _discard_from_bucket(self, key: tuple[int, str], event_id: UUID) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.discard(event_id)
+            if not bucket:
+                del self._buckets[key]
+
+    def get(self, event_id: UUID) -> Optional[EarthquakeEvent]:
+        return self._events.get(event_id)
+
+    def find_by_source(self, source: str, source_event_id: str) -> Optional[EarthquakeEvent]:
+        """Event already holding this source's report id, if any."""
+        event_id = self._by_source.get((source, source_event_id))
+        return self._events.get(event_id) if event_id else None
+
+    def candidates(self, report: SourceReport) -> list[EarthquakeEvent]:
+        """Events that may match the report, most recent event_time first."""
+        t = self._time_bucket(report.event_time)
+        cells = cells_within(report.latitude, report.longitude, self.distance_km, self.precision)
+        found = []
+        for bucket in (t - 1, t, t + 1):
+            for cell in cells:
+                for event_id in self._buckets.get((bucket, cell), ()):
+                    found.append(self._events[event_id])
+        found.sort(key=lambda e: e.event_time, reverse=True)
+        return found
+
+    def prune(self, before: datetime) -> int:
+        """Drop events with event_time before the cutoff. Returns count dropped."""
+        stale = [eid for eid, e in self._events.items() if e.event_time < before]
+        for event_id in stale:
+            self._discard_from_bucket(self._keys.pop(event_id), event_id)
+            del self._events[event_id]
+        if stale:
+            dropped = set(stale)
+            self._by_source = {k: v for k, v in self._by_source.items() if v not in dropped}
+        return len(stale)
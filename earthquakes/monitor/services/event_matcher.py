@@ -12,6 +12,7 @@ from uuid import UUID, uuid4
 
 from ..models import SourceReport, EarthquakeEvent
 from ..config import config
+from .event_index import EventIndex
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +75,30 @@ class EventMatcher:
                 return event.event_id
         return None
 
+    def find_match(
+        self,
+        report: SourceReport,
+        index: EventIndex,
+        min_magnitude: Optional[float] = None,
+    ) -> Optional[EarthquakeEvent]:
+        """
+        Find a matching event using the spatio-temporal index.
+
+        Same criteria and precedence (most recent event first) as
+        find_matching_event, but only neighbouring time/geohash buckets
+        are checked.
+        """
+        for event in index.candidates(report):
+            if min_magnitude is not None and event.best_magnitude < min_magnitude:
+                continue
+            if self._is_match(report, event):
+                return event
+        return None
+
+    def new_index(self) -> EventIndex:
+        """Empty EventIndex sized for this matcher's thresholds."""
+        return EventIndex(self.time_window_sec, self.distance_km)
+
     def _is_match(self, report: SourceReport, event: EarthquakeEvent) -> bool:
         """Check if report matches existing event."""
         # Time check
@@ -263,6 +263,7 @@ class MonitorBotApp(App):
         super().__init__()
         self.db = Database()
         self.matcher = EventMatcher()
+        self.event_index = self.matcher.new_index()
         self.reports_db = ReportsDB()
 
         self.status_bar: Optional[StatusBar] = None
@@ -547,9 +548,10 @@ class MonitorBotApp(App):
                 self.log_message(f"Could not load from database: {e}", color="yellow")
                 logger.warning(f"Database load failed: {e}")
 
-        # Populate cache
+        # Populate cache and matcher index
         for event in events:
             self.events_cache[event.event_id] = event
+            self.event_index.add(event)
 
         # Rebuild table sorted
         self._rebuild_events_table()
@@ -807,38 +809,9 @@ class MonitorBotApp(App):
     async def _handle_report(self, report: SourceReport):
         """Handle incoming earthquake report."""
         try:
-            # Check if we already have this source event
-            existing = None
-
-            if config.USE_DATABASE:
-                # Use database for duplicate checking
-                try:
-                    existing = await self.db.get_event_by_source_id(
-                        report.source, report.source_event_id
-                    )
-                except Exception as db_error:
-                    logger.warning(f"DB error checking existing event: {db_error}")
-            else:
-                # Use in-memory cache for duplicate checking
-                for event in self.events_cache.values():
-                    if report.source == "usgs" and event.usgs_id == report.source_event_id:
-                        existing = event
-                        break
-                    elif report.source == "jma" and event.jma_id == report.source_event_id:
-                        existing = event
-                        break
-                    elif report.source == "emsc" and event.emsc_id == report.source_event_id:
-                        existing = event
-                        break
-                    elif report.source == "gfz" and event.gfz_id == report.source_event_id:
-                        existing = event
-                        break
-                    elif report.source == "iris" and event.iris_id == report.source_event_id:
-                        existing = event
-                        break
-                    elif report.source == "ingv" and event.ingv_id == report.source_event_id:
-                        existing = event
-                        break
+            # Check if we already have this source event (in-memory index,
+            # kept in sync with events_cache and the DB writes below)
+            existing = self.event_index.find_by_source(report.source, report.source_event_id)
 
             # Log ALL incoming reports with duplicate marker
             if existing:
@@ -851,38 +824,19 @@ class MonitorBotApp(App):
                 self.log_message(log_msg, color="dim")
                 logger.info(log_msg)
 
-            # Get recent events for matching
-            logger.info(f"[{report.source.upper()}] Starting to get recent events for matching...")
-
-            if config.USE_DATABASE:
-                # Use database
-                try:
-                    recent_events = await self.db.get_recent_events(
-                        hours=24, min_magnitude=config.MIN_MAGNITUDE_TRACK - 0.5
-                    )
-                    logger.info(f"[{report.source.upper()}] DB returned {len(recent_events) if recent_events else 'None'} events")
-                    if recent_events is None:
-                        recent_events = []
-                except Exception as db_error:
-                    logger.warning(f"DB error getting recent events: {db_error}")
-                    # Fallback to in-memory cache
-                    recent_events = list(self.events_cache.values())
-                    logger.info(f"[{report.source.upper()}] Using cache fallback: {len(recent_events)} events")
-            else:
-                # Use in-memory cache directly
-                recent_events = list(self.events_cache.values())
-                logger.info(f"[{report.source.upper()}] Using in-memory cache: {len(recent_events)} events")
-
-            logger.info(f"[{report.source.upper()}] Matching against {len(recent_events)} events in cache")
-
-            # Try to match to existing event
-            matched_id = self.matcher.find_matching_event(report, recent_events)
-            logger.info(f"[{report.source.upper()}] Match result: {matched_id}")
+            # Match against neighbouring time/geohash buckets of the index
+            event = self.matcher.find_match(
+                report, self.event_index, min_magnitude=config.MIN_MAGNITUDE_TRACK - 0.5,
+            )
+            logger.info(
+                f"[{report.source.upper()}] Match result: {event.event_id if event else None} "
+                f"({len(self.event_index)} events indexed)"
+            )
 
-            if matched_id:
+            if event:
                 # Update existing event
-                event = next(e for e in recent_events if e.event_id == matched_id)
                 event = self.matcher.update_event_from_report(event, report)
+                self.event_index.add(event)
 
                 # Optionally save to DB
                 if config.USE_DATABASE:
@@ -935,6 +889,7 @@ class MonitorBotApp(App):
             else:
                 # Create new event
                 event = self.matcher.create_event_from_report(report)
+                self.event_index.add(event)
 
                 # Optionally save to DB
                 if config.USE_DATABASE:
@@ -1,6 +1,9 @@
 """
 Helper module to read Monitor Bot's JSON cache from Trading Bot.
 
+The parsed cache stays in memory and is re-read only when the file
+changes, so the calls below cost a stat() in the steady state.
+
 Usage:
     from monitor_cache import get_monitor_events, get_edge_time
 
@@ -12,13 +15,120 @@ Usage:
 """
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict
-from datetime import datetime
 
 
 CACHE_FILE = Path(__file__).parent / "monitor_bot" / "data" / "events_cache.json"
 
+# Source id fields in the cache, in the order get_event_sources() reports them
+SOURCE_FIELDS = [
+    ("jma_id", "JMA"),
+    ("emsc_id", "EMSC"),
+    ("gfz_id", "GFZ"),
+    ("geonet_id", "GEONET"),
+    ("usgs_id", "USGS"),
+]
+
+
+class MonitorCache:
+    """
+    Memory-resident view of the monitor bot's JSON cache.
+
+    The monitor rewrites the file atomically (os.replace), so a new
+    version always shows up as a new inode/mtime/size. Each read costs a
+    stat(); the file is only re-parsed when that stamp changes, and the
+    parsed events are indexed by usgs_id and by every source id.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._stamp: Optional[tuple] = None
+        self._data: Dict = {}
+        self._events: List[Dict] = []
+        self._by_usgs: Dict[str, Dict] = {}
+        self._by_source: Dict[tuple, Dict] = {}
+        self._error: Optional[str] = None
+
+    def _refresh(self) -> None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            stamp = None
+        else:
+            stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            if stamp == self._stamp:
+                return
+            if stamp is None:
+                self._set({}, None)
+                return
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                # Keep serving the last good snapshot; retry on next call
+                if self._error != str(e):
+                    print(f"Warning: Could not read monitor cache: {e}")
+                self._error = str(e)
+                return
+            self._set(data, stamp)
+
+    def _set(self, data: Dict, stamp: Optional[tuple]) -> None:
+        events = data.get("events", [])
+        by_usgs = {}
+        by_source = {}
+        for event in events:
+            for field, _ in SOURCE_FIELDS:
+                source_id = event.get(field)
+                if source_id:
+                    by_source.setdefault((field, source_id), event)
+            if event.get("usgs_id"):
+                by_usgs.setdefault(event["usgs_id"], event)
+
+        self._data = data
+        self._events = events
+        self._by_usgs = by_usgs
+        self._by_source = by_source
+        self._stamp = stamp
+        self._error = None
+
+    def events(self) -> List[Dict]:
+        self._refresh()
+        return list(self._events)
+
+    def by_usgs_id(self, usgs_id: str) -> Optional[Dict]:
+        self._refresh()
+        return self._by_usgs.get(usgs_id)
+
+    def by_source_id(self, field: str, source_id: str) -> Optional[Dict]:
+        """Event by source id field (e.g. "jma_id", "emsc_id")."""
+        self._refresh()
+        return self._by_source.get((field, source_id))
+
+    def info(self) -> Dict:
+        self._refresh()
+        if self._stamp is None:
+            return {
+                "exists": self.path.exists(),
+                "last_updated": None,
+                "event_count": 0,
+                **({"error": self._error} if self._error else {}),
+            }
+        return {
+            "exists": True,
+            "last_updated": self._data.get("last_updated"),
+            "event_count": self._data.get("event_count", len(self._events)),
+            "file_size_kb": self._stamp[2] / 1024,
+        }
+
+
+_cache = MonitorCache(CACHE_FILE)
+
 
 def get_monitor_events() -> List[Dict]:
     """
@@ -27,16 +137,7 @@ def get_monitor_events() -> List[Dict]:
     Returns:
         List of event dictionaries, or empty list if cache doesn't exist.
     """
-    if not CACHE_FILE.exists():
-        return []
-
-    try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get("events", [])
-    except Exception as e:
-        print(f"Warning: Could not read monitor cache: {e}")
-        return []
+    return _cache.events()
 
 
 def get_edge_time(usgs_id: str) -> Optional[float]:
@@ -56,13 +157,8 @@ def get_edge_time(usgs_id: str) -> Optional[float]:
         else:
             print("No information advantage")
     """
-    events = get_monitor_events()
-
-    for event in events:
-        if event.get("usgs_id") == usgs_id:
-            return event.get("detection_advantage_minutes")
-
-    return None
+    event = _cache.by_usgs_id(usgs_id)
+    return event.get("detection_advantage_minutes") if event else None
 
 
 def get_event_sources(usgs_id: str) -> List[str]:
@@ -75,24 +171,21 @@ def get_event_sources(usgs_id: str) -> List[str]:
     Returns:
         List of source names (e.g., ["JMA", "EMSC", "USGS"])
     """
-    events = get_monitor_events()
+    event = _cache.by_usgs_id(usgs_id)
+    if not event:
+        return []
+    return [name for field, name in SOURCE_FIELDS if event.get(field)]
 
-    for event in events:
-        if event.get("usgs_id") == usgs_id:
-            sources = []
-            if event.get("jma_id"):
-                sources.append("JMA")
-            if event.get("emsc_id"):
-                sources.append("EMSC")
-            if event.get("gfz_id"):
-                sources.append("GFZ")
-            if event.get("geonet_id"):
-                sources.append("GEONET")
-            if event.get("usgs_id"):
-                sources.append("USGS")
-            return sources
 
-    return []
+def get_event_by_source(field: str, source_id: str) -> Optional[Dict]:
+    """
+    Get event by any source's id.
+
+    Args:
+        field: Source id field, e.g. "jma_id" or "emsc_id"
+        source_id: That source's event ID
+    """
+    return _cache.by_source_id(field, source_id)
 
 
 def get_cache_info() -> Dict:
@@ -102,28 +195,7 @@ def get_cache_info() -> Dict:
     Returns:
         Dictionary with cache metadata (last_updated, event_count, etc.)
     """
-    if not CACHE_FILE.exists():
-        return {
-            "exists": False,
-            "last_updated": None,
-            "event_count": 0,
-        }
-
-    try:
-        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        return {
-            "exists": True,
-            "last_updated": data.get("last_updated"),
-            "event_count": data.get("event_count", len(data.get("events", []))),
-            "file_size_kb": CACHE_FILE.stat().st_size / 1024,
-        }
-    except Exception as e:
-        return {
-            "exists": True,
-            "error": str(e),
-        }
+    return _cache.info()
 
 
 if __name__ == "__main__":
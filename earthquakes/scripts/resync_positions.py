@@ -20,9 +20,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from polymarket_client import PolymarketClient
+from trading_bot.storage.positions import PositionStorage
 
 DATA_DIR = Path(__file__).parent.parent / "trading_bot" / "data"
 ACTIVE_DIR = DATA_DIR / "active"
+HISTORY_DIR = DATA_DIR / "history"
 SELL_ORDERS_FILE = DATA_DIR / "sell_orders.json"
 
 
@@ -40,22 +42,20 @@ def main():
         print("  Continuing anyway (orders may already be cancelled)...")
 
     # Step 2: Show current active positions
-    active_files = list(ACTIVE_DIR.glob("*.json"))
-    print(f"\nStep 2: Found {len(active_files)} active position files:")
-    for f in active_files:
-        try:
-            data = json.loads(f.read_text())
-            print(f"  {f.name}: {data.get('market_slug', '?')[:40]} "
-                  f"tokens={data.get('tokens', 0):.2f} "
-                  f"entry_size=${data.get('entry_size', 0):.2f}")
-        except Exception:
-            print(f"  {f.name}: (unreadable)")
+    storage = PositionStorage(ACTIVE_DIR, HISTORY_DIR)
+    positions = storage.load_all_active()
+    print(f"\nStep 2: Found {len(positions)} active positions:")
+    for pos in positions:
+        print(f"  {pos.id}: {pos.market_slug[:40]} "
+              f"tokens={pos.tokens:.2f} "
+              f"entry_size=${pos.entry_size:.2f}")
 
-    # Step 3: Delete active position files
-    print(f"\nStep 3: Deleting {len(active_files)} active position files...")
-    for f in active_files:
-        f.unlink()
-        print(f"  Deleted {f.name}")
+    # Step 3: Delete active positions
+    print(f"\nStep 3: Deleting {len(positions)} active positions...")
+    for pos in positions:
+        storage.delete(pos.id)
+        print(f"  Deleted {pos.id}")
+    storage.close()
 
     # Step 4: Clear sell orders
     print(f"\nStep 4: Clearing sell_orders.json...")
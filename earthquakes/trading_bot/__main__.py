@@ -100,6 +100,8 @@ def main():
         import traceback
         traceback.print_exc()
         raise
+    finally:
+        position_storage.close()
 
 
 if __name__ == "__main__":
@@ -25,7 +25,7 @@ try:
     )
     from main import get_spread_info
     from polymarket_client import PolymarketClient
-    from usgs_client import USGSClient
+    from usgs_catalog import USGSCatalog
     from monitor_cache import get_monitor_events
     IMPORTS_OK = True
 except ImportError as e:
@@ -51,7 +51,9 @@ class EarthquakeScanner(BaseScanner):
         if IMPORTS_OK:
             try:
                 self.api_client = PolymarketClient()
-                self.usgs_client = USGSClient()
+                # Shared local catalog: each scan refreshes it with one delta
+                # request, all per-market queries are answered from memory
+                self.usgs_client = USGSCatalog(max_age=None)
                 print(f"Polymarket client initialized: {self.api_client.get_address()[:10]}...")
             except Exception as e:
                 print(f"Warning: Failed to initialize clients: {e}")
@@ -183,6 +185,11 @@ class EarthquakeScanner(BaseScanner):
                     if not significant:
                         logger.log_info("  No significant extra events after discount")
 
+            if self.usgs_client is not None:
+                changed = self.usgs_client.refresh()
+                if changed:
+                    logger.log_info(f"USGS catalog: {changed} events updated")
+
             # Run the same analysis as main_tested.py
             self._opportunities = run_analysis(
                 self.api_client, self.usgs_client,
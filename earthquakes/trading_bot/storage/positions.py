@@ -1,17 +1,32 @@
 """
-Position storage - save and load active positions from JSON files.
-
-Each position is stored as a separate JSON file in the active directory.
-When a position is closed, it's moved to the history directory.
+Position storage - in-memory registry of active positions.
+
+The registry is authoritative at runtime and indexed by id, market slug and
+(slug, outcome). Every change is appended to a write-ahead journal
+(positions.journal) and the registry is periodically written to
+positions.snapshot via os.replace; on startup the snapshot is loaded and the
+journal replayed. When a position is closed, it's moved to the history
+directory.
 """
 
+import copy
 import json
+import os
+import threading
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from ..models.position import Position, PositionStatus
 
 
+SNAPSHOT_FILE = "positions.snapshot"
+JOURNAL_FILE = "positions.journal"
+
+# Journal records between automatic snapshots
+SNAPSHOT_EVERY = 200
+
+
 class PositionStorage:
     """Manages persistence of trading positions."""
 
@@ -23,64 +38,178 @@ class PositionStorage:
         self.active_dir.mkdir(parents=True, exist_ok=True)
         self.history_dir.mkdir(parents=True, exist_ok=True)
 
-    def _position_path(self, position_id: str) -> Path:
-        """Get file path for a position."""
-        return self.active_dir / f"{position_id}.json"
+        # In-memory registry (authoritative) + indexes
+        self._lock = threading.RLock()
+        self._positions: Dict[str, Position] = {}
+        self._by_slug: Dict[str, Set[str]] = defaultdict(set)
+        self._by_key: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+
+        self._snapshot_path = self.active_dir / SNAPSHOT_FILE
+        self._journal_path = self.active_dir / JOURNAL_FILE
+        self._journal = None
+        self._journal_records = 0
+        self._recover()
 
     def _history_path(self, position_id: str) -> Path:
         """Get history file path for a position."""
         return self.history_dir / f"{position_id}.json"
 
+    # ------------------------------------------------------------------
+    # Registry
+    # ------------------------------------------------------------------
+
+    def _index(self, position: Position) -> None:
+        self._unindex(position.id)
+        self._positions[position.id] = position
+        self._by_slug[position.market_slug].add(position.id)
+        self._by_key[(position.market_slug, position.outcome)].add(position.id)
+
+    def _unindex(self, position_id: str) -> Optional[Position]:
+        old = self._positions.pop(position_id, None)
+        if old is not None:
+            self._discard(self._by_slug, old.market_slug, position_id)
+            self._discard(self._by_key, (old.market_slug, old.outcome), position_id)
+        return old
+
+    @staticmethod
+    def _discard(index: dict, key, position_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(position_id)
+            if not ids:
+                del index[key]
+
+    def _newest(self, index: dict, key) -> Optional[Position]:
+        """Most recently entered position under an index key (copy)."""
+        with self._lock:
+            ids = index.get(key)
+            if not ids:
+                return None
+            position = max((self._positions[i] for i in ids), key=lambda p: p.entry_time)
+            return copy.copy(position)
+
+    # ------------------------------------------------------------------
+    # Journal / snapshot
+    # ------------------------------------------------------------------
+
+    def _recover(self) -> None:
+        """Rebuild the registry: load the snapshot, then replay the journal."""
+        legacy = []
+        if self._snapshot_path.exists():
+            with open(self._snapshot_path) as f:
+                for data in json.load(f):
+                    self._index(Position.from_dict(data))
+        elif not self._journal_path.exists():
+            legacy = self._import_legacy_files()
+
+        if self._journal_path.exists():
+            with open(self._journal_path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # torn last write from a crash
+                    if record["op"] == "put":
+                        self._index(Position.from_dict(record["position"]))
+                    else:
+                        self._unindex(record["id"])
+
+        # Compact what was recovered; legacy files are only removed once
+        # their positions are in a snapshot
+        self.snapshot()
+        for path in legacy:
+            path.unlink()
+
+    def _import_legacy_files(self) -> List[Path]:
+        """One-shot import of the old one-JSON-file-per-position layout."""
+        imported = []
+        for path in self.active_dir.glob("*.json"):
+            try:
+                with open(path) as f:
+                    position = Position.from_json(f.read())
+            except Exception as e:
+                print(f"Warning: Failed to load {path}: {e}")
+                continue
+            if position.status == PositionStatus.OPEN:
+                self._index(position)
+            imported.append(path)
+        return imported
+
+    def _log(self, record: dict) -> None:
+        """Append a journal record (caller holds the lock)."""
+        if self._journal is None:
+            self._journal = open(self._journal_path, "a")
+        self._journal.write(json.dumps(record) + "\n")
+        self._journal.flush()
+        self._journal_records += 1
+        if self._journal_records >= SNAPSHOT_EVERY:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """Atomically write all active positions and truncate the journal."""
+        with self._lock:
+            tmp = self._snapshot_path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump([p.to_dict() for p in self._positions.values()], f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._snapshot_path)
+
+            # A crash before this point just replays the old journal on top
+            # of the new snapshot, which is idempotent
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self._journal_path, "w")
+            self._journal_records = 0
+
+    def close(self) -> None:
+        """Snapshot and release the journal (call on shutdown)."""
+        with self._lock:
+            self.snapshot()
+            self._journal.close()
+            self._journal = None
+
+    # ------------------------------------------------------------------
+    # Positions
+    # ------------------------------------------------------------------
+
     def save(self, position: Position) -> None:
-        """Save a position to disk."""
+        """Save a position (registry + journal)."""
         if position.status == PositionStatus.OPEN:
-            # Save to active directory
-            path = self._position_path(position.id)
-            with open(path, "w") as f:
-                f.write(position.to_json())
+            with self._lock:
+                self._index(copy.copy(position))
+                self._log({"op": "put", "position": position.to_dict()})
         else:
             # Move to history
             self.move_to_history(position)
 
     def load(self, position_id: str) -> Optional[Position]:
         """Load a position by ID."""
-        path = self._position_path(position_id)
-        if not path.exists():
-            return None
-
-        with open(path) as f:
-            return Position.from_json(f.read())
+        with self._lock:
+            position = self._positions.get(position_id)
+            return copy.copy(position) if position else None
 
     def load_all_active(self) -> List[Position]:
         """Load all active positions."""
-        positions = []
-        for path in self.active_dir.glob("*.json"):
-            try:
-                with open(path) as f:
-                    pos = Position.from_json(f.read())
-                    if pos.status == PositionStatus.OPEN:
-                        positions.append(pos)
-            except Exception as e:
-                print(f"Warning: Failed to load {path}: {e}")
+        with self._lock:
+            positions = [copy.copy(p) for p in self._positions.values()]
 
         # Sort by entry time (newest first)
         positions.sort(key=lambda p: p.entry_time, reverse=True)
         return positions
 
     def delete(self, position_id: str) -> bool:
-        """Delete a position file."""
-        path = self._position_path(position_id)
-        if path.exists():
-            path.unlink()
+        """Delete a position."""
+        with self._lock:
+            if self._unindex(position_id) is None:
+                return False
+            self._log({"op": "del", "id": position_id})
             return True
-        return False
 
     def move_to_history(self, position: Position) -> None:
         """Move a closed position to history directory."""
         # Remove from active
-        active_path = self._position_path(position.id)
-        if active_path.exists():
-            active_path.unlink()
+        self.delete(position.id)
 
         # Save to history
         history_path = self._history_path(position.id)
@@ -106,7 +235,6 @@ class PositionStorage:
         Returns (closed_partial, updated_remaining). Both None if position not found.
         If tokens_sold >= position.tokens, does full close and returns (closed, None).
         """
-        import copy
         from datetime import datetime
 
         position = self.load(position_id)
@@ -151,17 +279,11 @@ class PositionStorage:
 
     def get_position_by_market(self, market_slug: str) -> Optional[Position]:
         """Find an active position for a specific market."""
-        for position in self.load_all_active():
-            if position.market_slug == market_slug:
-                return position
-        return None
+        return self._newest(self._by_slug, market_slug)
 
     def find_matching_position(self, market_slug: str, outcome: str) -> Optional[Position]:
         """Find an active position for a specific market + outcome."""
-        for position in self.load_all_active():
-            if position.market_slug == market_slug and position.outcome == outcome:
-                return position
-        return None
+        return self._newest(self._by_key, (market_slug, outcome))
 
     def merge_into(self, existing: Position, new_tokens: float,
                    new_entry_size: float, new_entry_price: float,
@@ -188,7 +310,7 @@ class PositionStorage:
 
     def count_active(self) -> int:
         """Count active positions."""
-        return len(list(self.active_dir.glob("*.json")))
+        return len(self._positions)
 
     def total_invested(self) -> float:
         """Calculate total $ invested in active positions."""
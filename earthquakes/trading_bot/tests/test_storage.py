@@ -0,0 +1,98 @@
+"""Tests for PositionStorage (in-memory registry + journal + snapshot)."""
+
+import pytest
+
+from ..models.position import Position, PositionStatus
+from ..storage.positions import PositionStorage, JOURNAL_FILE, SNAPSHOT_FILE
+
+
+def make_position(slug="earthquake-test", outcome="YES", entry_time="2026-01-01T00:00:00Z"):
+    return Position(
+        market_id="cond123",
+        market_slug=slug,
+        market_name="Test Market",
+        outcome=outcome,
+        entry_price=0.05,
+        entry_time=entry_time,
+        entry_size=10.0,
+        tokens=200.0,
+    )
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    return tmp_path / "active", tmp_path / "history"
+
+
+class TestPositionStorage:
+    """Test registry lookups and crash recovery."""
+
+    def test_lookups(self, dirs):
+        """Lookups by id, slug and (slug, outcome) return the newest entry."""
+        storage = PositionStorage(*dirs)
+        old = make_position(entry_time="2026-01-01T00:00:00Z")
+        new = make_position(entry_time="2026-01-02T00:00:00Z")
+        other = make_position(outcome="NO")
+        for pos in (old, new, other):
+            storage.save(pos)
+
+        assert storage.count_active() == 3
+        assert storage.load(old.id).id == old.id
+        assert storage.get_position_by_market("earthquake-test").id == new.id
+        assert storage.find_matching_position("earthquake-test", "NO").id == other.id
+        assert storage.find_matching_position("earthquake-test", "MAYBE") is None
+
+    def test_load_returns_copy(self, dirs):
+        """Mutating a loaded position does not change the registry until saved."""
+        storage = PositionStorage(*dirs)
+        pos = make_position()
+        storage.save(pos)
+
+        loaded = storage.load(pos.id)
+        loaded.tokens = 1.0
+        assert storage.load(pos.id).tokens == 200.0
+
+    def test_close_moves_to_history(self, dirs):
+        """Closing removes the position from the registry and writes history."""
+        active_dir, history_dir = dirs
+        storage = PositionStorage(active_dir, history_dir)
+        pos = make_position()
+        storage.save(pos)
+
+        closed = storage.close_position(pos.id, 0.10)
+
+        assert closed.status == PositionStatus.CLOSED
+        assert storage.load(pos.id) is None
+        assert storage.get_position_by_market("earthquake-test") is None
+        assert (history_dir / f"{pos.id}.json").exists()
+
+    def test_recovery_replays_journal(self, dirs):
+        """A restart without close() rebuilds state from snapshot + journal."""
+        storage = PositionStorage(*dirs)
+        kept = make_position()
+        dropped = make_position(slug="earthquake-other")
+        storage.save(kept)
+        storage.save(dropped)
+        storage.merge_into(kept, 100.0, 5.0, 0.05)
+        storage.delete(dropped.id)
+
+        # Simulate a crash mid-write: torn last journal line
+        storage._journal.write('{"op": "put", "posi')
+        storage._journal.flush()
+
+        recovered = PositionStorage(*dirs)
+        assert recovered.count_active() == 1
+        assert recovered.load(kept.id).tokens == 300.0
+        assert recovered.load(dropped.id) is None
+
+    def test_imports_legacy_files(self, dirs):
+        """Old one-file-per-position layout is imported once and removed."""
+        active_dir, history_dir = dirs
+        active_dir.mkdir(parents=True)
+        pos = make_position()
+        (active_dir / f"{pos.id}.json").write_text(pos.to_json())
+
+        storage = PositionStorage(active_dir, history_dir)
+
+        assert storage.load(pos.id).market_slug == "earthquake-test"
+        assert sorted(p.name for p in active_dir.iterdir()) == [JOURNAL_FILE, SNAPSHOT_FILE]
@@ -0,0 +1,194 @@
+"""
+Local incremental USGS catalog.
+
+Drop-in replacement for USGSClient in the pricing paths (main_tested,
+main_integrated, trading_bot scanner). Events are downloaded once and
+kept as time-sorted columns; every (start, end, min_magnitude) query is
+then answered in memory with two binary searches and a magnitude mask.
+
+Coverage is the smallest (start, min_magnitude) ever asked for. A query
+outside it backfills only the missing part; after that the store is kept
+current with `updatedafter` delta requests, so a full scan costs one
+small request instead of one catalog download per market.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+
+from usgs_client import Earthquake, USGSClient, feature_to_earthquake
+
+# Delta requests go this far below the coverage magnitude so that a
+# downward revision across the threshold still reaches the store
+MAG_REVISION_MARGIN = 1.0
+MAG_EPS = 1e-9
+
+
+def _iso(t: datetime) -> str:
+    return t.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+class USGSCatalog:
+    """In-memory USGS event store with incremental `updatedafter` refresh."""
+
+    def __init__(self, client: Optional[USGSClient] = None,
+                 max_age: Optional[float] = 60.0):
+        """
+        Args:
+            client: USGSClient used for backfills and deltas
+            max_age: Seconds before a query triggers a delta refresh on its
+                own. None = only refresh when refresh() is called
+        """
+        self.client = client or USGSClient()
+        self.max_age = max_age
+        self._lock = threading.RLock()
+
+        self._events: dict[str, Earthquake] = {}
+        self._sorted: list[Earthquake] = []
+        self._times = np.empty(0)
+        self._mags = np.empty(0)
+
+        self._start: Optional[datetime] = None
+        self._min_mag: Optional[float] = None
+        self._updated_ms = 0
+        self._refreshed_at = 0.0
+        self.requests = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    # ------------------------------------------------------------------
+    # Store maintenance
+    # ------------------------------------------------------------------
+
+    def _fetch(self, params: dict) -> int:
+        """Run one /query and upsert the result. Returns events changed."""
+        features = self.client.query_features(params)
+        self.requests += 1
+
+        changed = 0
+        for feature in features:
+            props = feature["properties"]
+            self._updated_ms = max(self._updated_ms, props.get("updated") or 0)
+            if props.get("status") == "deleted" or props.get("mag") is None:
+                changed += self._events.pop(feature["id"], None) is not None
+                continue
+            eq = feature_to_earthquake(feature)
+            if self._events.get(eq.id) != eq:
+                self._events[eq.id] = eq
+                changed += 1
+
+        if changed:
+            self._rebuild()
+        return changed
+
+    def _rebuild(self) -> None:
+        self._sorted = sorted(self._events.values(), key=lambda e: e.time)
+        self._times = np.array([e.time.timestamp() for e in self._sorted])
+        self._mags = np.array([e.magnitude for e in self._sorted])
+
+    def _covers(self, start: datetime, min_magnitude: float) -> bool:
+        return (self._start is not None
+                and start >= self._start
+                and min_magnitude >= self._min_mag - MAG_EPS)
+
+    def _ensure(self, start: datetime, min_magnitude: float) -> None:
+        """Extend coverage to (start, min_magnitude) and refresh if stale."""
+        if self._start is None:
+            self._fetch({"starttime": _iso(start), "minmagnitude": min_magnitude})
+            self._start, self._min_mag = start, min_magnitude
+            self._refreshed_at = time.monotonic()
+            return
+
+        if min_magnitude < self._min_mag - MAG_EPS:
+            # Lower threshold: the whole covered range has to be re-read
+            new_start = min(start, self._start)
+            self._fetch({"starttime": _iso(new_start), "minmagnitude": min_magnitude})
+            self._start, self._min_mag = new_start, min_magnitude
+        elif start < self._start:
+            self._fetch({
+                "starttime": _iso(start),
+                "endtime": _iso(self._start),
+                "minmagnitude": self._min_mag,
+            })
+            self._start = start
+
+        if self.max_age is not None and time.monotonic() - self._refreshed_at > self.max_age:
+            self.refresh()
+
+    def refresh(self) -> int:
+        """
+        Pull events added, revised or deleted since the last request.
+
+        Returns:
+            Number of events inserted, changed or removed
+        """
+        with self._lock:
+            if self._start is None:
+                return 0
+            params = {
+                "starttime": _iso(self._start),
+                "minmagnitude": self._min_mag - MAG_REVISION_MARGIN,
+                "includedeleted": "true",
+            }
+            if self._updated_ms:
+                updated = datetime.fromtimestamp(self._updated_ms / 1000, tz=timezone.utc)
+                params["updatedafter"] = updated.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
+            changed = self._fetch(params)
+            self._refreshed_at = time.monotonic()
+            return changed
+
+    # ------------------------------------------------------------------
+    # USGSClient-compatible queries
+    # ------------------------------------------------------------------
+
+    def get_earthquakes(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        min_magnitude: float = 7.0,
+    ) -> list[Earthquake]:
+        """Events in [start_time, end_time] at or above min_magnitude, newest first."""
+        if end_time is None:
+            end_time = datetime.now(timezone.utc)
+        with self._lock:
+            self._ensure(start_time, min_magnitude)
+            return self._select(start_time, end_time, min_magnitude)
+
+    def _select(self, start: datetime, end: datetime,
+                min_magnitude: float) -> list[Earthquake]:
+        lo = np.searchsorted(self._times, start.timestamp(), side="left")
+        hi = np.searchsorted(self._times, end.timestamp(), side="right")
+        hits = lo + np.flatnonzero(self._mags[lo:hi] >= min_magnitude - MAG_EPS)
+        # USGS orders by time descending
+        return [self._sorted[i] for i in hits[::-1]]
+
+    def count_earthquakes(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        min_magnitude: float = 7.0,
+    ) -> int:
+        """Count from memory when covered, else one /count request (no backfill)."""
+        if end_time is None:
+            end_time = datetime.now(timezone.utc)
+        with self._lock:
+            if self._covers(start_time, min_magnitude):
+                return len(self._select(start_time, end_time, min_magnitude))
+        return self.client.count_earthquakes(start_time, end_time, min_magnitude)
+
+    def get_historical_rate(self, years: int = 10, min_magnitude: float = 7.0) -> float:
+        # Decade-long windows are not worth keeping in the store
+        return self.client.get_historical_rate(years, min_magnitude)
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -22,6 +22,18 @@ class Earthquake:
         return f"M{self.magnitude} - {self.place} ({self.time.strftime('%Y-%m-%d %H:%M')} UTC)"
 
 
+def feature_to_earthquake(feature: dict) -> Earthquake:
+    """GeoJSON feature из USGS -> Earthquake."""
+    props = feature["properties"]
+    return Earthquake(
+        id=feature["id"],
+        magnitude=props["mag"],
+        place=props["place"] or "Unknown location",
+        time=datetime.fromtimestamp(props["time"] / 1000, tz=timezone.utc),
+        url=props["url"],
+    )
+
+
 class USGSClient:
     """Клиент для USGS Earthquake API."""
 
@@ -58,29 +70,25 @@ class USGSClient:
             "orderby": "time",
         }
 
-        response = self.client.get(f"{self.BASE_URL}/query", params=params)
-        response.raise_for_status()
-
-        data = response.json()
         earthquakes = []
 
-        for feature in data.get("features", []):
-            props = feature["properties"]
-            eq_time = datetime.fromtimestamp(props["time"] / 1000, tz=timezone.utc)
+        for feature in self.query_features(params):
+            eq = feature_to_earthquake(feature)
             # Double-check: only include if within [start_time, end_time]
-            if eq_time < start_time or eq_time > end_time:
+            if eq.time < start_time or eq.time > end_time:
                 continue
-            eq = Earthquake(
-                id=feature["id"],
-                magnitude=props["mag"],
-                place=props["place"] or "Unknown location",
-                time=eq_time,
-                url=props["url"],
-            )
             earthquakes.append(eq)
 
         return earthquakes
 
+    def query_features(self, params: dict) -> list[dict]:
+        """Сырые GeoJSON features из /query (format=geojson подставляется)."""
+        response = self.client.get(
+            f"{self.BASE_URL}/query", params={"format": "geojson", **params}
+        )
+        response.raise_for_status()
+        return response.json().get("features", [])
+
     def count_earthquakes(
         self,
         start_time: datetime,
@@ -469,7 +469,38 @@ class ClobClient:
         """
         self.assert_level_1_auth()
 
-        # add resolve_order_options, or similar
+        return self.builder.create_order(
+            order_args, self.__resolve_order_options(order_args, options)
+        )
+
+    def create_orders(
+        self,
+        orders_args: list[OrderArgs],
+        options: Optional[PartialCreateOrderOptions] = None,
+        processes: int = 0,
+    ) -> list:
+        """
+        Creates and signs a batch of orders
+        Market parameters are looked up once per token and the exchange signer
+        is reused across the batch; processes > 1 signs in a process pool
+        Level 1 Auth required
+        """
+        self.assert_level_1_auth()
+
+        orders = [
+            (order_args, self.__resolve_order_options(order_args, options))
+            for order_args in orders_args
+        ]
+        return self.builder.create_orders(orders, processes=processes)
+
+    def __resolve_order_options(
+        self,
+        order_args: OrderArgs,
+        options: Optional[PartialCreateOrderOptions] = None,
+    ) -> CreateOrderOptions:
+        """
+        Resolves tick size, neg risk and fee rate for a limit order
+        """
         tick_size = self.__resolve_tick_size(
             order_args.token_id,
             options.tick_size if options else None,
@@ -497,12 +528,9 @@ class ClobClient:
         )
         order_args.fee_rate_bps = fee_rate_bps
 
-        return self.builder.create_order(
-            order_args,
-            CreateOrderOptions(
-                tick_size=tick_size,
-                neg_risk=neg_risk,
-            ),
+        return CreateOrderOptions(
+            tick_size=tick_size,
+            neg_risk=neg_risk,
         )
 
     def create_market_order(
@@ -628,6 +656,21 @@ class ClobClient:
         ord = self.create_order(order_args, options)
         return self.post_order(ord)
 
+    def create_and_post_orders(
+        self,
+        orders_args: list[OrderArgs],
+        options: PartialCreateOrderOptions = None,
+        orderType: OrderType = OrderType.GTC,
+        processes: int = 0,
+    ):
+        """
+        Utility function to batch-sign orders and publish them in one request
+        """
+        signed_orders = self.create_orders(orders_args, options, processes)
+        return self.post_orders(
+            [PostOrdersArgs(order=order, orderType=orderType) for order in signed_orders]
+        )
+
     def cancel(self, order_id):
         """
         Cancels an order
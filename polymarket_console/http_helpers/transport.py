@@ -0,0 +1,330 @@
+"""
+Pooled HTTP transport shared by the bots' market-data modules.
+
+One keep-alive HTTP/2 connection pool per process instead of a fresh TLS
+handshake per urlopen() call. Both flavours add:
+
+  - per-host concurrency limits (a semaphore per host)
+  - gzip (Accept-Encoding; httpx decodes transparently)
+  - retry with exponential backoff on connection errors, 429 and 5xx
+    (idempotent methods only unless the caller opts in)
+  - per-host latency histograms, so a scan cycle can report how much of
+    its time was spent on the wire
+
+Usage:
+    from polymarket_console.http_helpers.transport import shared_transport
+
+    http = shared_transport()
+    data = http.get_json("https://gamma-api.polymarket.com/events", params={...})
+    print(http.latency_report())
+"""
+
+import asyncio
+import bisect
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.25          # seconds; doubled per attempt, plus jitter
+MAX_BACKOFF = 5.0
+DEFAULT_PER_HOST = 8            # concurrent in-flight requests per host
+DEFAULT_MAX_CONNECTIONS = 64
+KEEPALIVE_EXPIRY = 30.0
+
+USER_AGENT = "Mozilla/5.0"
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Upper bucket edges in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class LatencyHistogram:
+    """Request latency distribution for one host."""
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, ms: float) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def quantile_ms(self, q: float) -> float:
+        """Approximate quantile (upper edge of the bucket holding it)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target and n:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def copy(self) -> "LatencyHistogram":
+        return LatencyHistogram(list(self.buckets), self.count, self.errors,
+                                self.retries, self.total_ms, self.max_ms)
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc or url
+
+
+def _backoff(attempt: int, resp: Optional[httpx.Response]) -> float:
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF)
+    delay = DEFAULT_BACKOFF * (2 ** attempt)
+    return min(delay + random.uniform(0, delay), MAX_BACKOFF)
+
+
+def format_latency_report(stats: Dict[str, LatencyHistogram]) -> str:
+    """One line per host (slowest total first): count, mean, p50/p95, max, retries, errors."""
+    lines = []
+    for host, h in sorted(stats.items(), key=lambda kv: -kv[1].total_ms):
+        lines.append(
+            f"{host}: {h.count} req, {h.total_ms / 1000:.2f}s total, "
+            f"mean {h.mean_ms:.0f}ms, p50 {h.quantile_ms(0.5):.0f}ms, "
+            f"p95 {h.quantile_ms(0.95):.0f}ms, max {h.max_ms:.0f}ms, "
+            f"{h.retries} retries, {h.errors} errors"
+        )
+    return "\n".join(lines)
+
+
+class _TransportBase:
+    """Histogram bookkeeping shared by the sync and async transports."""
+
+    def __init__(self, retries: int, per_host: int):
+        self.retries = retries
+        self.per_host = per_host
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, LatencyHistogram] = {}
+        self._host_limits: Dict[str, int] = {}
+
+    def set_host_limit(self, host: str, limit: int) -> None:
+        """Override the concurrency limit for one host (call before first use)."""
+        self._host_limits[host] = limit
+        self._host_sems.pop(host, None)
+
+    def _hist(self, host: str) -> LatencyHistogram:
+        hist = self._stats.get(host)
+        if hist is None:
+            hist = self._stats[host] = LatencyHistogram()
+        return hist
+
+    def _record(self, host: str, ms: float, error: bool = False, retry: bool = False) -> None:
+        with self._stats_lock:
+            hist = self._hist(host)
+            hist.record(ms)
+            hist.errors += error
+            hist.retries += retry
+
+    def _attempts(self, method: str, retries: Optional[int]) -> int:
+        if retries is None:
+            retries = self.retries if method in IDEMPOTENT_METHODS else 0
+        return retries + 1
+
+    def latency_stats(self) -> Dict[str, LatencyHistogram]:
+        """Snapshot of the per-host histograms."""
+        with self._stats_lock:
+            return {host: hist.copy() for host, hist in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+    def take_stats(self) -> Dict[str, LatencyHistogram]:
+        """Return the per-host histograms and start new ones (per-cycle reporting)."""
+        with self._stats_lock:
+            stats, self._stats = self._stats, {}
+            return stats
+
+    def wire_seconds(self) -> float:
+        """Total time spent in requests across all hosts."""
+        with self._stats_lock:
+            return sum(h.total_ms for h in self._stats.values()) / 1000
+
+    def latency_report(self) -> str:
+        return format_latency_report(self.latency_stats())
+
+    @staticmethod
+    def _headers(headers: Optional[dict]) -> dict:
+        merged = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+        if headers:
+            merged.update(headers)
+        return merged
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        return httpx.Limits(max_connections=DEFAULT_MAX_CONNECTIONS,
+                            max_keepalive_connections=DEFAULT_MAX_CONNECTIONS,
+                            keepalive_expiry=KEEPALIVE_EXPIRY)
+
+
+class PooledTransport(_TransportBase):
+    """Thread-safe pooled HTTP client (sync flavour)."""
+
+    def __init__(self, verify: bool = True, retries: int = DEFAULT_RETRIES,
+                 per_host: int = DEFAULT_PER_HOST, http2: bool = True,
+                 transport: Optional[httpx.BaseTransport] = None):
+        super().__init__(retries, per_host)
+        self._client = httpx.Client(http2=http2, verify=verify, limits=self._limits(),
+                                    timeout=DEFAULT_TIMEOUT, transport=transport)
+        self._sem_lock = threading.Lock()
+        self._host_sems: Dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._sem_lock:
+            sem = self._host_sems.get(host)
+            if sem is None:
+                sem = self._host_sems[host] = threading.BoundedSemaphore(
+                    self._host_limits.get(host, self.per_host))
+            return sem
+
+    def request(self, method: str, url: str, *, params=None, headers=None,
+                json=None, content=None, timeout: float = DEFAULT_TIMEOUT,
+                retries: Optional[int] = None) -> httpx.Response:
+        """Send a request; raises httpx.HTTPError once retries are exhausted."""
+        method = method.upper()
+        host = _host(url)
+        attempts = self._attempts(method, retries)
+        headers = self._headers(headers)
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            resp = None
+            t0 = time.perf_counter()
+            try:
+                with self._semaphore(host):
+                    resp = self._client.request(method, url, params=params, headers=headers,
+                                                json=json, content=content, timeout=timeout)
+            except httpx.TransportError:
+                self._record(host, (time.perf_counter() - t0) * 1000, error=last, retry=not last)
+                if last:
+                    raise
+            else:
+                retryable = resp.status_code in RETRY_STATUS
+                self._record(host, (time.perf_counter() - t0) * 1000,
+                             error=resp.is_error and (last or not retryable),
+                             retry=retryable and not last)
+                if not retryable or last:
+                    resp.raise_for_status()
+                    return resp
+            time.sleep(_backoff(attempt, resp))
+        raise AssertionError("unreachable")
+
+    def get_json(self, url: str, params=None, headers=None,
+                 timeout: float = DEFAULT_TIMEOUT, retries: Optional[int] = None):
+        return self.request("GET", url, params=params, headers=headers,
+                            timeout=timeout, retries=retries).json()
+
+    def post_json(self, url: str, json=None, headers=None,
+                  timeout: float = DEFAULT_TIMEOUT, retries: Optional[int] = None):
+        return self.request("POST", url, json=json, headers=headers,
+                            timeout=timeout, retries=retries).json()
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class AsyncPooledTransport(_TransportBase):
+    """Pooled HTTP client for asyncio code (one per event loop)."""
+
+    def __init__(self, verify: bool = True, retries: int = DEFAULT_RETRIES,
+                 per_host: int = DEFAULT_PER_HOST, http2: bool = True,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(retries, per_host)
+        self._client = httpx.AsyncClient(http2=http2, verify=verify, limits=self._limits(),
+                                         timeout=DEFAULT_TIMEOUT, transport=transport)
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = self._host_sems[host] = asyncio.Semaphore(
+                self._host_limits.get(host, self.per_host))
+        return sem
+
+    async def request(self, method: str, url: str, *, params=None, headers=None,
+                      json=None, content=None, timeout: float = DEFAULT_TIMEOUT,
+                      retries: Optional[int] = None) -> httpx.Response:
+        """Send a request; raises httpx.HTTPError once retries are exhausted."""
+        method = method.upper()
+        host = _host(url)
+        attempts = self._attempts(method, retries)
+        headers = self._headers(headers)
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            resp = None
+            t0 = time.perf_counter()
+            try:
+                async with self._semaphore(host):
+                    resp = await self._client.request(method, url, params=params,
+                                                      headers=headers, json=json,
+                                                      content=content, timeout=timeout)
+            except httpx.TransportError:
+                self._record(host, (time.perf_counter() - t0) * 1000, error=last, retry=not last)
+                if last:
+                    raise
+            else:
+                retryable = resp.status_code in RETRY_STATUS
+                self._record(host, (time.perf_counter() - t0) * 1000,
+                             error=resp.is_error and (last or not retryable),
+                             retry=retryable and not last)
+                if not retryable or last:
+                    resp.raise_for_status()
+                    return resp
+            await asyncio.sleep(_backoff(attempt, resp))
+        raise AssertionError("unreachable")
+
+    async def get_json(self, url: str, params=None, headers=None,
+                       timeout: float = DEFAULT_TIMEOUT, retries: Optional[int] = None):
+        resp = await self.request("GET", url, params=params, headers=headers,
+                                  timeout=timeout, retries=retries)
+        return resp.json()
+
+    async def post_json(self, url: str, json=None, headers=None,
+                        timeout: float = DEFAULT_TIMEOUT, retries: Optional[int] = None):
+        resp = await self.request("POST", url, json=json, headers=headers,
+                                  timeout=timeout, retries=retries)
+        return resp.json()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncPooledTransport":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+
+_shared_lock = threading.Lock()
+_shared: Dict[bool, PooledTransport] = {}
+
+
+def shared_transport(verify: bool = True) -> PooledTransport:
+    """Process-wide sync transport (one pool per TLS-verification setting)."""
+    with _shared_lock:
+        transport = _shared.get(verify)
+        if transport is None:
+            transport = _shared[verify] = PooledTransport(verify=verify)
+        return transport
@@ -21,6 +21,9 @@ except ImportError:
     UtilsSell = "SELL"
     PY_ORDER_UTILS_AVAILABLE = False
 
+import random
+from concurrent.futures import ProcessPoolExecutor
+
 from .helpers import (
     to_token_decimals,
     round_down,
@@ -61,6 +64,26 @@ class OrderBuilder:
         # Defaults to the address of the signer
         self.funder = funder if funder is not None else self.signer.address()
 
+        # Exchange order builders (with their signer and EIP-712 domain),
+        # keyed by (chain_id, neg_risk)
+        self._exchange_builders: dict[tuple[int, bool], UtilsOrderBuilder] = {}
+
+    def _exchange_builder(self, neg_risk: bool) -> UtilsOrderBuilder:
+        """
+        Returns the cached exchange order builder for the signer's chain
+        """
+        key = (self.signer.get_chain_id(), bool(neg_risk))
+        order_builder = self._exchange_builders.get(key)
+        if order_builder is None:
+            contract_config = get_contract_config(key[0], key[1])
+            order_builder = UtilsOrderBuilder(
+                contract_config.exchange,
+                key[0],
+                UtilsSigner(key=self.signer.private_key),
+            )
+            self._exchange_builders[key] = order_builder
+        return order_builder
+
     def get_order_amounts(
         self, side: str, size: float, price: float, round_config: RoundConfig
     ):
@@ -156,17 +179,7 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
-
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
-            self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
-        )
-
-        return order_builder.build_signed_order(data)
+        return self._exchange_builder(options.neg_risk).build_signed_order(data)
 
     def create_market_order(
         self, order_args: MarketOrderArgs, options: CreateOrderOptions
@@ -195,17 +208,41 @@ class OrderBuilder:
             signatureType=self.sig_type,
         )
 
-        contract_config = get_contract_config(
-            self.signer.get_chain_id(), options.neg_risk
-        )
+        return self._exchange_builder(options.neg_risk).build_signed_order(data)
+
+    def create_orders(
+        self,
+        orders: list[tuple[OrderArgs, CreateOrderOptions]],
+        processes: int = 0,
+    ) -> list[SignedOrder]:
+        """
+        Creates and signs a batch of orders, in input order
+
+        With processes > 1 the batch is split across a process pool; worth it
+        only for large batches, since each worker pays the signer setup once
+        """
+        if processes <= 1 or len(orders) < 2:
+            return [self.create_order(args, options) for args, options in orders]
 
-        order_builder = UtilsOrderBuilder(
-            contract_config.exchange,
+        processes = min(processes, len(orders))
+        chunks = [orders[i::processes] for i in range(processes)]
+        builder_args = (
+            self.signer.private_key,
             self.signer.get_chain_id(),
-            UtilsSigner(key=self.signer.private_key),
+            self.sig_type,
+            self.funder,
         )
-
-        return order_builder.build_signed_order(data)
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=random.seed
+        ) as pool:
+            results = list(
+                pool.map(_create_orders_chunk, [builder_args] * processes, chunks)
+            )
+
+        signed = [None] * len(orders)
+        for i, chunk in enumerate(results):
+            signed[i::processes] = chunk
+        return signed
 
     def calculate_buy_market_price(
         self,
@@ -246,3 +283,18 @@ class OrderBuilder:
             raise Exception("no match")
 
         return float(positions[0].price)
+
+
+def _create_orders_chunk(
+    builder_args: tuple, orders: list[tuple[OrderArgs, CreateOrderOptions]]
+) -> list[SignedOrder]:
+    """
+    Process pool worker for OrderBuilder.create_orders
+    """
+    private_key, chain_id, sig_type, funder = builder_args
+    builder = OrderBuilder(
+        Signer(private_key=private_key, chain_id=chain_id),
+        sig_type=sig_type,
+        funder=funder,
+    )
+    return [builder.create_order(args, options) for args, options in orders]
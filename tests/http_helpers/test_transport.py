@@ -0,0 +1,111 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import patch
+
+import httpx
+
+from polymarket_console.http_helpers import transport as transport_module
+from polymarket_console.http_helpers.transport import (
+    AsyncPooledTransport,
+    LatencyHistogram,
+    PooledTransport,
+)
+
+
+def _flaky_handler(failures: int, status: int = 503):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= failures:
+            return httpx.Response(status)
+        return httpx.Response(200, json={"ok": True, "n": len(calls)})
+
+    return handler, calls
+
+
+class TestPooledTransport(TestCase):
+    def setUp(self):
+        patcher = patch.object(transport_module, "_backoff", return_value=0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_json_retries_then_succeeds(self):
+        handler, calls = _flaky_handler(failures=2)
+        http = PooledTransport(http2=False, transport=httpx.MockTransport(handler))
+        self.assertEqual(http.get_json("https://api.example.com/x"), {"ok": True, "n": 3})
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(calls[0].headers["Accept-Encoding"], "gzip")
+
+        hist = http.latency_stats()["api.example.com"]
+        self.assertEqual(hist.count, 3)
+        self.assertEqual(hist.retries, 2)
+        self.assertEqual(hist.errors, 0)
+
+    def test_retries_exhausted_raises(self):
+        handler, calls = _flaky_handler(failures=10, status=500)
+        http = PooledTransport(retries=1, http2=False, transport=httpx.MockTransport(handler))
+        with self.assertRaises(httpx.HTTPStatusError):
+            http.get_json("https://api.example.com/x")
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(http.latency_stats()["api.example.com"].errors, 1)
+
+    def test_post_not_retried_by_default(self):
+        handler, calls = _flaky_handler(failures=1)
+        http = PooledTransport(http2=False, transport=httpx.MockTransport(handler))
+        with self.assertRaises(httpx.HTTPStatusError):
+            http.post_json("https://rpc.example.com", json={"id": 1})
+        self.assertEqual(len(calls), 1)
+
+        self.assertEqual(http.post_json("https://rpc.example.com", json={"id": 1}, retries=1),
+                         {"ok": True, "n": 2})
+
+    def test_client_errors_not_retried(self):
+        handler, calls = _flaky_handler(failures=5, status=404)
+        http = PooledTransport(http2=False, transport=httpx.MockTransport(handler))
+        with self.assertRaises(httpx.HTTPStatusError):
+            http.get_json("https://api.example.com/x")
+        self.assertEqual(len(calls), 1)
+
+    def test_transport_error_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("reset", request=request)
+            return httpx.Response(200, json=[1, 2])
+
+        http = PooledTransport(http2=False, transport=httpx.MockTransport(handler))
+        self.assertEqual(http.get_json("https://api.example.com/x"), [1, 2])
+        self.assertEqual(http.latency_stats()["api.example.com"].retries, 1)
+
+
+class TestAsyncPooledTransport(TestCase):
+    def test_get_json_concurrent(self):
+        handler, calls = _flaky_handler(failures=0)
+
+        async def run():
+            async with AsyncPooledTransport(
+                http2=False, per_host=2, transport=httpx.MockTransport(handler)
+            ) as http:
+                results = await asyncio.gather(
+                    *(http.get_json(f"https://clob.example.com/book?i={i}") for i in range(5))
+                )
+                return results, http.latency_stats()
+
+        results, stats = asyncio.run(run())
+        self.assertEqual(len(results), 5)
+        self.assertEqual(stats["clob.example.com"].count, 5)
+
+
+class TestLatencyHistogram(TestCase):
+    def test_quantiles(self):
+        hist = LatencyHistogram()
+        for ms in [3, 7, 40, 40, 40, 40, 40, 40, 40, 900]:
+            hist.record(ms)
+        self.assertEqual(hist.count, 10)
+        self.assertEqual(hist.quantile_ms(0.5), 50)
+        self.assertEqual(hist.quantile_ms(0.95), 1000)
+        self.assertAlmostEqual(hist.mean_ms, 119.0)
+        self.assertEqual(hist.max_ms, 900)
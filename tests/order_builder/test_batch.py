@@ -0,0 +1,145 @@
+import time
+from unittest import TestCase
+
+from eth_account import Account
+
+from polymarket_console.clob_types import OrderArgs, CreateOrderOptions
+from polymarket_console.config import get_contract_config
+from polymarket_console.constants import AMOY
+from polymarket_console.order_builder.constants import BUY, SELL
+from polymarket_console.order_builder.builder import (
+    OrderBuilder,
+    OrderData,
+    ROUNDING_CONFIG,
+    UtilsOrderBuilder,
+    UtilsSigner,
+)
+from polymarket_console.signer import Signer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+chain_id = AMOY
+signer = Signer(private_key=private_key, chain_id=chain_id)
+
+BENCH_ORDERS = 200
+
+
+def make_orders(n: int, neg_risk: bool = False):
+    return [
+        (
+            OrderArgs(
+                token_id=str(1000 + i),
+                price=round(0.01 * (1 + i % 98), 2),
+                size=10 + i,
+                side=BUY if i % 2 == 0 else SELL,
+                fee_rate_bps=0,
+                nonce=i,
+            ),
+            CreateOrderOptions(tick_size="0.01", neg_risk=neg_risk),
+        )
+        for i in range(n)
+    ]
+
+
+def recover_signer(builder: OrderBuilder, signed_order, neg_risk: bool) -> str:
+    struct_hash = builder._exchange_builder(neg_risk)._create_struct_hash(
+        signed_order.order
+    )
+    return Account._recover_hash(struct_hash, signature=signed_order.signature)
+
+
+class TestCreateOrders(TestCase):
+    def test_exchange_builder_cached_per_neg_risk(self):
+        builder = OrderBuilder(signer)
+
+        self.assertIs(builder._exchange_builder(False), builder._exchange_builder(False))
+        self.assertIsNot(builder._exchange_builder(False), builder._exchange_builder(True))
+        self.assertEqual(
+            builder._exchange_builder(True).contract_address,
+            get_contract_config(chain_id, True).exchange,
+        )
+
+    def test_create_orders_matches_create_order(self):
+        builder = OrderBuilder(signer)
+        orders = make_orders(6) + make_orders(2, neg_risk=True)
+
+        signed_orders = builder.create_orders(orders)
+
+        self.assertEqual(len(signed_orders), len(orders))
+        for (order_args, options), signed_order in zip(orders, signed_orders):
+            single = builder.create_order(order_args, options)
+            for field in ("tokenId", "makerAmount", "takerAmount", "side", "nonce"):
+                self.assertEqual(signed_order.order[field], single.order[field])
+            self.assertEqual(
+                recover_signer(builder, signed_order, options.neg_risk),
+                signer.address(),
+            )
+
+    def test_create_orders_process_pool_keeps_order(self):
+        builder = OrderBuilder(signer)
+        orders = make_orders(7)
+
+        signed_orders = builder.create_orders(orders, processes=3)
+
+        self.assertEqual(
+            [o.order["tokenId"] for o in signed_orders],
+            [int(args.token_id) for args, _ in orders],
+        )
+        for signed_order in signed_orders:
+            self.assertEqual(recover_signer(builder, signed_order, False), signer.address())
+        self.assertEqual(len({o.order["salt"] for o in signed_orders}), len(orders))
+
+
+class TestCreateOrdersBenchmark(TestCase):
+    """Orders/second: per-order signer setup vs cached batch vs process pool"""
+
+    def test_benchmark(self):
+        builder = OrderBuilder(signer)
+        orders = make_orders(BENCH_ORDERS)
+
+        def uncached():
+            # Previous create_order path: new exchange builder + signer per order
+            signed = []
+            for order_args, options in orders:
+                side, maker_amount, taker_amount = builder.get_order_amounts(
+                    order_args.side,
+                    order_args.size,
+                    order_args.price,
+                    ROUNDING_CONFIG[options.tick_size],
+                )
+                data = OrderData(
+                    maker=builder.funder,
+                    taker=order_args.taker,
+                    tokenId=order_args.token_id,
+                    makerAmount=str(maker_amount),
+                    takerAmount=str(taker_amount),
+                    side=side,
+                    feeRateBps=str(order_args.fee_rate_bps),
+                    nonce=str(order_args.nonce),
+                    signer=signer.address(),
+                    expiration=str(order_args.expiration),
+                    signatureType=builder.sig_type,
+                )
+                order_builder = UtilsOrderBuilder(
+                    get_contract_config(chain_id, options.neg_risk).exchange,
+                    chain_id,
+                    UtilsSigner(key=private_key),
+                )
+                signed.append(order_builder.build_signed_order(data))
+            return signed
+
+        rates = {}
+        for name, run in (
+            ("per-order setup", uncached),
+            ("create_orders", lambda: builder.create_orders(orders)),
+            ("create_orders x2 procs", lambda: builder.create_orders(orders, processes=2)),
+        ):
+            start = time.perf_counter()
+            signed = run()
+            rates[name] = len(signed) / (time.perf_counter() - start)
+            self.assertEqual(len(signed), BENCH_ORDERS)
+
+        print()
+        for name, rate in rates.items():
+            print(f"{name:>24}: {rate:8.0f} orders/s")
+
@@ -7,12 +7,9 @@ Adapted from crypto bot executor. Simplified:
 - Loads weather/.env for separate wallet
 """
 
-import json
 import math
-import ssl
 import sys
 import time
-import urllib.request
 from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass
@@ -26,6 +23,8 @@ from ..models.signal import Signal
 from ..models.market import Market
 from ..logger import get_logger
 
+from polymarket_console.http_helpers.transport import shared_transport
+
 try:
     from polymarket_client import PolymarketClient
     POLYMARKET_AVAILABLE = True
@@ -33,6 +32,8 @@ except ImportError:
     PolymarketClient = None
     POLYMARKET_AVAILABLE = False
 
+_http = shared_transport()
+
 
 @dataclass
 class OrderResult:
@@ -97,22 +98,14 @@ class PolymarketExecutor:
                 "https://polygon.llamarpc.com",
             ]
 
-            import json
-            import urllib.request
-            import ssl
-            ctx = ssl.create_default_context()
-
             for rpc in rpcs:
                 try:
-                    payload = json.dumps({
+                    payload = {
                         "jsonrpc": "2.0", "method": "eth_call",
                         "params": [{"to": USDC_E, "data": data}, "latest"],
                         "id": 1
-                    })
-                    req = urllib.request.Request(rpc, payload.encode(),
-                                                headers={"Content-Type": "application/json"})
-                    resp = urllib.request.urlopen(req, timeout=10, context=ctx)
-                    result = json.loads(resp.read())
+                    }
+                    result = _http.post_json(rpc, json=payload, retries=1)
                     hex_balance = result.get("result", "0x0")
                     return int(hex_balance, 16) / 1e6
                 except Exception:
@@ -564,10 +557,7 @@ class PolymarketExecutor:
         """Get full market info from CLOB API via direct HTTP."""
         try:
             url = f"https://clob.polymarket.com/markets/{condition_id}"
-            ctx = ssl.create_default_context()
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp = urllib.request.urlopen(req, timeout=10, context=ctx)
-            return json.loads(resp.read())
+            return _http.get_json(url)
         except Exception:
             return None
 
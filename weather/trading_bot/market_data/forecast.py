@@ -11,10 +11,9 @@ Fallback: 6-hour TTL if S3 is unreachable.
 
 import json
 import logging
-import ssl
+import threading
 import time
-import urllib.request
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -22,6 +21,8 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from polymarket_console.http_helpers.transport import shared_transport
+
 from ..calibration import CityCalibration
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,38 @@ S3_MODEL_MAP = {
     "jma_seamless":    "jma_gsm",
 }
 
-_ssl_ctx = ssl.create_default_context()
+# Open-Meteo free tier allows 600 calls/min: refill at 10/s, and let a
+# full city refresh (~40 calls) go out as one burst
+OPEN_METEO_RATE = 10.0      # requests per second (sustained)
+OPEN_METEO_BURST = 50       # bucket capacity
+REFRESH_WORKERS = 16
+
+_http = shared_transport()
+_http.set_host_limit("api.open-meteo.com", REFRESH_WORKERS)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
 
 
 @dataclass
@@ -128,9 +160,7 @@ class ModelUpdateTracker:
             url = S3_META_URL.format(model=s3_name)
 
             try:
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp = urllib.request.urlopen(req, timeout=10, context=_ssl_ctx)
-                meta = json.loads(resp.read())
+                meta = _http.get_json(url)
 
                 new_init = meta.get("last_run_initialisation_time", 0)
                 new_avail = meta.get("last_run_availability_time", 0)
@@ -244,6 +274,7 @@ class ForecastData:
 
         # Cache: {city: {"fetched_at": float, "data": {date: {forecast, sigma, models}}}}
         self._cache: Dict[str, dict] = {}
+        self._rate_limit = TokenBucket(OPEN_METEO_RATE, OPEN_METEO_BURST)
         self.tracker = ModelUpdateTracker()
         self.db = None  # Optional[ForecastDB] — set externally
         self.calibration = calibration
@@ -338,9 +369,20 @@ class ForecastData:
 
     def refresh_city(self, city: str, unit: str = "F") -> bool:
         """Fetch fresh forecast for a city from Open-Meteo."""
+        result = self._fetch_city(city, unit)
+        if result is None:
+            return False
+        self._store_city(city, unit, result)
+        return True
+
+    def _fetch_city(self, city: str, unit: str) -> Optional[Dict[str, dict]]:
+        """Fetch + reduce one city's forecast (thread-safe, no cache writes).
+
+        Returns {date: {forecast, sigma, models}} or None on failure.
+        """
         cfg = self.cities.get(city)
         if not cfg:
-            return False
+            return None
 
         temp_unit = "fahrenheit" if unit == "F" else "celsius"
         url = (
@@ -353,12 +395,11 @@ class ForecastData:
             f"&forecast_days=5"
         )
 
+        self._rate_limit.acquire()
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp = urllib.request.urlopen(req, timeout=30, context=_ssl_ctx)
-            data = json.loads(resp.read())
+            data = _http.get_json(url, timeout=30)
         except Exception:
-            return False
+            return None
 
         hourly = data.get("hourly", {})
         times = hourly.get("time", [])
@@ -367,33 +408,33 @@ class ForecastData:
                       and k != "temperature_2m"]
         model_names = [k.replace("temperature_2m_", "") for k in model_keys]
 
-        if not model_keys:
-            return False
+        if not model_keys or not times:
+            return None
 
-        # Group by date, compute daily max per model
-        daily: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
-        for i, t in enumerate(times):
-            date_str = t[:10]
-            for mk, mn in zip(model_keys, model_names):
-                vals = hourly.get(mk, [])
-                if i < len(vals) and vals[i] is not None:
-                    daily[date_str][mn].append(vals[i])
+        # Daily max per model: (models × hours) matrix, None → NaN, then a
+        # NaN-ignoring max over each day's contiguous run of hours (23/25 on
+        # DST days, so reduceat rather than a fixed reshape)
+        n_hours = len(times)
+        temps = np.full((len(model_keys), n_hours), np.nan)
+        for row, mk in enumerate(model_keys):
+            vals = hourly.get(mk) or []
+            temps[row, :len(vals)] = np.array(vals[:n_hours], dtype=float)
 
-        result = {}
-        for date_str, models in daily.items():
-            maxes = {}
-            for mn, temps in models.items():
-                if temps:
-                    maxes[mn] = max(temps)
+        days = np.array([t[:10] for t in times])
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        daily_max = np.fmax.reduceat(temps, starts, axis=1)
 
+        weights = None
+        if self.calibration and self.calibration.loaded:
+            weights = self.calibration.get_weights(city)
+
+        result = {}
+        for col, date_str in enumerate(days[starts]):
+            maxes = {mn: float(v) for mn, v in zip(model_names, daily_max[:, col])
+                     if not np.isnan(v)}
             if not maxes:
                 continue
 
-            # Weighted ensemble if calibration provides per-city weights
-            weights = None
-            if self.calibration and self.calibration.loaded:
-                weights = self.calibration.get_weights(city)
-
             if weights:
                 # Weighted mean using optimal per-city model weights
                 w_sum = 0.0
@@ -410,12 +451,16 @@ class ForecastData:
                 forecast_val = float(np.mean(list(maxes.values())))
 
             vals = list(maxes.values())
-            result[date_str] = {
+            result[str(date_str)] = {
                 "forecast": forecast_val,
                 "sigma": float(np.std(vals)) if len(vals) > 1 else 0.0,
                 "models": maxes,
             }
 
+        return result
+
+    def _store_city(self, city: str, unit: str, result: Dict[str, dict]) -> None:
+        """Cache a fetched forecast and log it to the DB."""
         fetched_at = time.time()
         self._cache[city] = {
             "fetched_at": fetched_at,
@@ -430,20 +475,40 @@ class ForecastData:
             except Exception as e:
                 logger.warning("Failed to log forecasts to DB: %s", e)
 
-        return True
+    def _city_unit(self, city: str, unit_map: Optional[Dict[str, str]]) -> str:
+        if unit_map:
+            return unit_map.get(city, "F")
+        return "C" if self.cities[city].get("unit") == "celsius" else "F"
 
     def refresh_all(self, unit_map: Optional[Dict[str, str]] = None) -> int:
         """Refresh forecasts for all cities. Returns count of successful fetches."""
+        return self._refresh_many({city: self._city_unit(city, unit_map)
+                                   for city in self.cities})
+
+    def refresh_stale(self, unit_map: Dict[str, str]) -> int:
+        """Refresh the cities in unit_map that have new model data (or no cache).
+
+        Called before a scan so a new model run is picked up with one
+        concurrent round of requests instead of one fetch per get_forecast().
+        """
+        return self._refresh_many({city: unit for city, unit in unit_map.items()
+                                   if city in self.cities and self.is_stale(city)})
+
+    def _refresh_many(self, city_units: Dict[str, str]) -> int:
+        """Fetch cities concurrently (rate-limited); cache/DB writes stay on this thread."""
+        if not city_units:
+            return 0
         count = 0
-        for city in self.cities:
-            unit = "F"
-            if unit_map:
-                unit = unit_map.get(city, "F")
-            elif self.cities[city].get("unit") == "celsius":
-                unit = "C"
-            if self.refresh_city(city, unit):
-                count += 1
-            time.sleep(0.2)  # rate limit
+        workers = min(REFRESH_WORKERS, len(city_units))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(self._fetch_city, city, unit): (city, unit)
+                       for city, unit in city_units.items()}
+            for fut in as_completed(futures):
+                result = fut.result()
+                if result is not None:
+                    city, unit = futures[fut]
+                    self._store_city(city, unit, result)
+                    count += 1
         return count
 
     def cache_age(self, city: str) -> Optional[float]:
@@ -7,16 +7,25 @@ fetches live prices via Gamma API events endpoint.
 
 import json
 import re
-import ssl
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-_ctx = ssl.create_default_context()
+from polymarket_console.http_helpers.transport import shared_transport
+
+_http = shared_transport()
 
 GAMMA_API = "https://gamma-api.polymarket.com"
+CLOB_API = "https://clob.polymarket.com"
+
+# Orderbook fetches: token ids per POST /books request, and the thread pool
+# used for per-token GET /book fallbacks
+BOOKS_BATCH_SIZE = 50
+ORDERBOOK_WORKERS = 8
+
+_EMPTY_BOOK = {"asks": [], "bids": []}
 
 
 @dataclass
@@ -149,9 +158,7 @@ class WeatherPolymarketData:
         for event_slug in event_slugs:
             try:
                 url = f"{GAMMA_API}/events?slug={event_slug}"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-                data = json.loads(resp.read())
+                data = _http.get_json(url)
                 if not data:
                     continue
 
@@ -198,9 +205,7 @@ class WeatherPolymarketData:
         while True:
             try:
                 url = f"{GAMMA_API}/events?closed=false&limit=100&offset={offset}"
-                req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-                resp = urllib.request.urlopen(req, timeout=15, context=_ctx)
-                data = json.loads(resp.read())
+                data = _http.get_json(url, timeout=15)
             except Exception:
                 break
 
@@ -251,12 +256,47 @@ class WeatherPolymarketData:
     def get_orderbook(token_id: str) -> dict:
         """Fetch orderbook from CLOB API."""
         try:
-            url = f"https://clob.polymarket.com/book?token_id={token_id}"
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            resp = urllib.request.urlopen(req, timeout=10, context=_ctx)
-            return json.loads(resp.read())
+            url = f"{CLOB_API}/book?token_id={token_id}"
+            return _http.get_json(url)
         except Exception:
-            return {"asks": [], "bids": []}
+            return dict(_EMPTY_BOOK)
+
+    @staticmethod
+    def get_orderbooks(token_ids: List[str]) -> Dict[str, dict]:
+        """Fetch many orderbooks at once.
+
+        Uses the CLOB batch endpoint (POST /books, chunked) with chunks sent
+        concurrently; any token missing from the batch replies is fetched
+        via GET /book on a bounded thread pool.
+
+        Returns dict: token_id -> orderbook (empty book on failure).
+        """
+        unique = list(dict.fromkeys(t for t in token_ids if t))
+        if not unique:
+            return {}
+
+        def fetch_batch(chunk: List[str]) -> List[dict]:
+            try:
+                # Read-only query: safe to retry
+                return _http.post_json(f"{CLOB_API}/books",
+                                       json=[{"token_id": t} for t in chunk], retries=1)
+            except Exception:
+                return []
+
+        chunks = [unique[i:i + BOOKS_BATCH_SIZE]
+                  for i in range(0, len(unique), BOOKS_BATCH_SIZE)]
+        books: Dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=ORDERBOOK_WORKERS) as pool:
+            for replies in pool.map(fetch_batch, chunks):
+                for ob in replies or []:
+                    if isinstance(ob, dict) and ob.get("asset_id"):
+                        books[ob["asset_id"]] = ob
+
+            missing = [t for t in unique if t not in books]
+            for token_id, ob in zip(missing, pool.map(WeatherPolymarketData.get_orderbook, missing)):
+                books[token_id] = ob
+
+        return books
 
     @staticmethod
     def get_usable_liquidity(token_id: str, fair_price: float) -> Tuple[float, float, float]:
@@ -264,8 +304,14 @@ class WeatherPolymarketData:
 
         Returns (best_ask, usable_liquidity_usd, weighted_price).
         """
+        return WeatherPolymarketData.usable_liquidity(
+            WeatherPolymarketData.get_orderbook(token_id), fair_price
+        )
+
+    @staticmethod
+    def usable_liquidity(ob: dict, fair_price: float) -> Tuple[float, float, float]:
+        """get_usable_liquidity() for an already-fetched orderbook."""
         try:
-            ob = WeatherPolymarketData.get_orderbook(token_id)
             asks = ob.get("asks", [])
             if not asks:
                 return 0.0, 0.0, 0.0
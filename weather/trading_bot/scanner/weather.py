@@ -6,11 +6,12 @@ distribution model, generates BUY/SELL signals with edge computation.
 """
 
 import time
+from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional
 
 from ..adaptive_sigma import AdaptiveSigma
 from ..calibration import CityCalibration
-from ..market_data.forecast import ForecastData
+from ..market_data.forecast import ForecastData, ForecastResult
 from ..market_data.polymarket import WeatherMarket, WeatherPolymarketData
 from ..models.signal import Signal, SignalType
 from ..pricing import bucket_fair_price
@@ -20,6 +21,16 @@ from ..logger import get_logger
 _CALIBRATION_FILE = "trading_bot/data/calibration_single_model.json"
 
 
+@dataclass
+class _Candidate:
+    """Bucket that passed the pricing filters and awaits its orderbook."""
+    market: WeatherMarket
+    forecast: ForecastResult
+    fair: float
+    effective_sigma: float
+    sigma_mult: float
+
+
 class WeatherScanner:
     """Scans weather temperature markets for trading opportunities."""
 
@@ -73,8 +84,18 @@ class WeatherScanner:
         if progress_callback:
             progress_callback(f"Scanning {len(active_markets)} buckets...")
 
+        # Re-fetch cities with a new model run concurrently up front, rather
+        # than one blocking fetch per get_forecast() cache miss below
+        refreshed = self.forecast.refresh_stale({m.city: m.unit for m in active_markets})
+        if refreshed:
+            logger.log_info(f"Refreshed forecasts for {refreshed} cities")
+
         signals: List[Signal] = []
 
+        # Phase 1: price every bucket, collect candidates that pass the
+        # cheap filters (no network)
+        candidates: List[_Candidate] = []
+
         for market in active_markets:
             fc = self.forecast.get_forecast(market.city, market.date, market.unit)
             if not fc:
@@ -122,11 +143,22 @@ class WeatherScanner:
             if fair - market.yes_price < self.config.min_edge:
                 continue
 
+            candidates.append(_Candidate(market, fc, fair, effective_sigma, sigma_mult))
+
+        # Phase 2: fetch all candidate orderbooks concurrently
+        if candidates and progress_callback:
+            progress_callback(f"Fetching {len(candidates)} orderbooks...")
+        books = WeatherPolymarketData.get_orderbooks(
+            [c.market.yes_token_id for c in candidates]
+        )
+
+        # Phase 3: finalize signals from liquidity at the actual fill price
+        for c in candidates:
+            market, fc, fair = c.market, c.forecast, c.fair
+
             # Check liquidity and get weighted price (actual fill price)
-            best_ask, liq_usd, weighted_price = (
-                WeatherPolymarketData.get_usable_liquidity(
-                    market.yes_token_id, fair
-                )
+            best_ask, liq_usd, weighted_price = WeatherPolymarketData.usable_liquidity(
+                books.get(market.yes_token_id, {}), fair
             )
 
             if liq_usd < self.config.min_position_size:
@@ -155,7 +187,7 @@ class WeatherScanner:
                 days_remaining=market.days_remaining,
                 liquidity=liq_usd,
                 token_id=market.yes_token_id,
-                model_used=f"Normal(σ={effective_sigma:.1f}{f'×{sigma_mult:.1f}' if sigma_mult > 1.0 else ''})",
+                model_used=f"Normal(σ={c.effective_sigma:.1f}{f'×{c.sigma_mult:.1f}' if c.sigma_mult > 1.0 else ''})",
                 city=market.city,
                 date=market.date,
                 bucket_label=market.bucket_label,